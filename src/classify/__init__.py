@@ -1,86 +1,94 @@
 """分类模块"""
 
-import re
-from typing import Any, Dict, List
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
 
 from ..ingest.models import Item
+from ..utils.keyword_matrix import use_matrix
 from ..utils.logger import get_logger
+from .cache import ClassificationCache, content_hash
+from .matcher import TopicMatcher, get_topic_matcher, topic_fingerprints, topics_fingerprint
 
 logger = get_logger("classify")
 
 
-def classify_item(item: Item, topics: List[Dict[str, Any]]) -> List[str]:
+def match_topics(
+    item: Item,
+    matcher: TopicMatcher,
+    keyword_topics: Optional[Set[str]] = None,
+) -> Set[str]:
+    """匹配Item命中的主题（不含来源继承的标签）
+
+    Args:
+        item: 待分类的Item
+        matcher: 已编译的主题匹配器
+        keyword_topics: 批量矩阵路径预先算出的关键词命中主题，为空时逐条匹配
+
+    Returns:
+        命中的主题名集合
+    """
+    tags = set()
+
+    # 合并所有可搜索文本（Item文本视图中缓存，跨阶段共享）
+    searchable_text = item.text.classify_text
+    searchable_text_lower = item.text.classify_lower
+
+    # 关键词匹配：一次扫描得到所有命中的主题
+    if keyword_topics is None:
+        keyword_hits = matcher.match_keywords(searchable_text_lower)
+        for topic_name, keyword in keyword_hits.items():
+            logger.debug(f"关键词匹配: {topic_name} ('{keyword}' in '{item.title}')")
+            tags.add(topic_name)
+    else:
+        keyword_hits = keyword_topics
+        for topic_name in keyword_hits:
+            logger.debug(f"关键词匹配: {topic_name} ('{item.title}')")
+            tags.add(topic_name)
+
+    # 正则表达式匹配（仅对关键词未命中的主题，正则已预编译）
+    pattern_hits = matcher.match_patterns(searchable_text, skip=set(keyword_hits))
+    for topic_name, matched_text in pattern_hits.items():
+        logger.debug(f"正则匹配: {topic_name} ('{matched_text}' in '{item.title}')")
+        tags.add(topic_name)
+
+    return tags
+
+
+def classify_item(
+    item: Item,
+    topics: List[Dict[str, Any]],
+    matcher: Optional[TopicMatcher] = None,
+    keyword_topics: Optional[Set[str]] = None,
+) -> List[str]:
     """为Item分配主题标签
 
     Args:
         item: 待分类的Item
         topics: 主题配置列表
+        matcher: 已编译的主题匹配器，为空时按主题配置指纹从缓存获取
+        keyword_topics: 批量矩阵路径预先算出的关键词命中主题，为空时逐条匹配
 
     Returns:
         主题标签列表
     """
-    tags = set()
+    if matcher is None:
+        matcher = get_topic_matcher(topics)
 
     # 从来源自动继承标签
-    source_tags = item.raw_data.get("source_tags", [])
-    tags.update(source_tags)
-
-    # 合并所有可搜索文本
-    searchable_text = " ".join(
-        filter(
-            None,
-            [
-                item.title,
-                item.summary or "",
-                item.content or "",
-                item.source,
-            ],
-        )
-    )
-    searchable_text_lower = searchable_text.lower()
-
-    # 遍历所有主题
-    for topic in topics:
-        topic_name = topic.get("name")
-        if not topic_name:
-            continue
-
-        matched = False
-
-        # 关键词匹配
-        keywords = topic.get("keywords", [])
-        for keyword in keywords:
-            if keyword.lower() in searchable_text_lower:
-                matched = True
-                logger.debug(f"关键词匹配: {topic_name} ('{keyword}' in '{item.title}')")
-                break
-
-        # 正则表达式匹配
-        if not matched:
-            patterns = topic.get("patterns", [])
-            for pattern in patterns:
-                try:
-                    if re.search(pattern, searchable_text, re.IGNORECASE):
-                        matched = True
-                        logger.debug(
-                            f"正则匹配: {topic_name} ('{pattern}' in '{item.title}')"
-                        )
-                        break
-                except re.error as e:
-                    logger.warning(f"正则表达式错误 '{pattern}': {e}")
-
-        if matched:
-            tags.add(topic_name)
+    tags = set(item.raw_data.get("source_tags", []))
+    tags.update(match_topics(item, matcher, keyword_topics))
 
     return list(tags)
 
 
-def classify_batch(items: List[Item], topics: List[Dict[str, Any]]) -> List[Item]:
+def classify_batch(items: List[Item], topics: List[Dict[str, Any]], store=None) -> List[Item]:
     """批量分类
 
     Args:
         items: Item列表
         topics: 主题配置列表
+        store: Storage实例，提供时按内容哈希读写分类缓存，只分类新条目或文本变化的条目；
+            主题配置变化时只重算定义变化的主题
 
     Returns:
         分类后的Item列表（原地修改）
@@ -88,9 +96,48 @@ def classify_batch(items: List[Item], topics: List[Dict[str, Any]]) -> List[Item
     logger.info(f"开始分类: {len(items)} 条数据，{len(topics)} 个主题")
 
     tag_counts = {}
+    matcher = get_topic_matcher(topics)
+
+    # 每个条目: (缓存中仍有效的主题标签, 需要重算的主题名；None表示完整分类)
+    cache = ClassificationCache(store, topics) if store is not None else None
+    if cache is not None:
+        cached = cache.lookup(items)
+    else:
+        cached = [(set(), None) for _ in items]
+    topic_tags: List[Set[str]] = [kept for kept, _ in cached]
+
+    # 完整分类：大批量时用稀疏矩阵一次算出所有条目的关键词命中主题
+    full = [index for index, (_, stale) in enumerate(cached) if stale is None]
+    batch_hits: List[Optional[Set[str]]] = [None] * len(full)
+    if use_matrix(len(full)):
+        batch_hits = matcher.match_keywords_batch(
+            [items[index].text.classify_lower for index in full]
+        )
+    for index, keyword_topics in zip(full, batch_hits):
+        topic_tags[index] = match_topics(items[index], matcher, keyword_topics)
+
+    # 部分重算：按需要重算的主题分组，每组只编译这些主题
+    partial: Dict[frozenset, List[int]] = defaultdict(list)
+    for index, (_, stale) in enumerate(cached):
+        if stale:
+            partial[frozenset(stale)].append(index)
+    for stale, indices in partial.items():
+        stale_matcher = get_topic_matcher([topic for topic in topics if topic.get("name") in stale])
+        for index in indices:
+            topic_tags[index] |= match_topics(items[index], stale_matcher)
+
+    if cache is not None:
+        changed = [index for index, (_, stale) in enumerate(cached) if stale is None or stale]
+        cache.save([items[index] for index in changed], [topic_tags[index] for index in changed])
+        partial_count = sum(len(indices) for indices in partial.values())
+        logger.info(
+            f"分类缓存: 命中 {len(items) - len(changed)} 条，"
+            f"部分重算 {partial_count} 条，完整分类 {len(full)} 条"
+        )
 
-    for item in items:
-        tags = classify_item(item, topics)
+    for item, tags in zip(items, topic_tags):
+        # 从来源自动继承标签
+        tags = list(set(item.raw_data.get("source_tags", [])) | tags)
         item.tags = tags
 
         # 统计标签
@@ -103,4 +150,14 @@ def classify_batch(items: List[Item], topics: List[Dict[str, Any]]) -> List[Item
     return items
 
 
-__all__ = ["classify_item", "classify_batch"]
+__all__ = [
+    "ClassificationCache",
+    "TopicMatcher",
+    "content_hash",
+    "get_topic_matcher",
+    "topic_fingerprints",
+    "topics_fingerprint",
+    "match_topics",
+    "classify_item",
+    "classify_batch",
+]
@@ -0,0 +1,115 @@
+"""分类结果缓存
+
+以分类文本（标题、摘要、正文、来源）的内容哈希为键，把主题标签持久化到 SQLite。
+缓存记录同时保存当时的主题配置指纹；配置变化后只重算定义发生变化的主题，
+其余主题的结果继续沿用。来源继承的标签不进缓存，每次按 raw_data 重新合并。
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..ingest.models import Item
+from ..utils.logger import get_logger
+from .matcher import topic_fingerprints
+
+logger = get_logger("classify.cache")
+
+
+def content_hash(item: Item) -> str:
+    """计算条目分类文本的内容哈希
+
+    Args:
+        item: Item
+
+    Returns:
+        SHA256哈希
+    """
+    return item.text.classify_hash
+
+
+class ClassificationCache:
+    """分类结果缓存"""
+
+    def __init__(self, store, topics: List[Dict[str, Any]]):
+        """初始化分类缓存
+
+        Args:
+            store: Storage实例
+            topics: 当前主题配置列表
+        """
+        self.store = store
+        self.topic_fingerprints = topic_fingerprints(topics)
+        self.fingerprint = hashlib.sha256(
+            json.dumps(self.topic_fingerprints, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        self._versions: Dict[str, Optional[Dict[str, str]]] = {
+            self.fingerprint: self.topic_fingerprints
+        }
+
+    def _stale_topics(self, fingerprint: str) -> Optional[Set[str]]:
+        """计算相对某个历史配置版本需要重算的主题
+
+        Args:
+            fingerprint: 缓存记录的主题配置指纹
+
+        Returns:
+            需要重算的主题名集合，版本未知时返回None（全部重算）
+        """
+        if fingerprint not in self._versions:
+            self._versions[fingerprint] = self.store.get_topic_fingerprints(fingerprint)
+        previous = self._versions[fingerprint]
+        if previous is None:
+            return None
+        return {
+            name
+            for name, topic_fingerprint in self.topic_fingerprints.items()
+            if previous.get(name) != topic_fingerprint
+        }
+
+    def lookup(self, items: List[Item]) -> List[Tuple[Set[str], Optional[Set[str]]]]:
+        """查询缓存
+
+        Args:
+            items: Item列表
+
+        Returns:
+            每个条目的 (仍然有效的主题标签, 需要重算的主题名)；
+            需要重算的主题为None表示未命中缓存，需要完整分类
+        """
+        hashes = [content_hash(item) for item in items]
+        cached = self.store.get_classify_cache(hashes)
+
+        results = []
+        for key in hashes:
+            entry = cached.get(key)
+            if entry is None:
+                results.append((set(), None))
+                continue
+            fingerprint, tags = entry
+            stale = self._stale_topics(fingerprint)
+            if stale is None:
+                results.append((set(), None))
+                continue
+            # 已删除或需要重算的主题不沿用旧结果
+            kept = {tag for tag in tags if tag in self.topic_fingerprints and tag not in stale}
+            results.append((kept, stale))
+        return results
+
+    def save(self, items: List[Item], topic_tags: List[Set[str]]) -> int:
+        """保存分类结果
+
+        Args:
+            items: Item列表
+            topic_tags: 每个条目的主题标签（不含来源继承的标签）
+
+        Returns:
+            保存的数量
+        """
+        entries = {content_hash(item): sorted(tags) for item, tags in zip(items, topic_tags)}
+        if not entries:
+            return 0
+        return self.store.save_classify_cache(entries, self.fingerprint, self.topic_fingerprints)
+
+
+__all__ = ["ClassificationCache", "content_hash"]
@@ -0,0 +1,222 @@
+"""主题匹配器
+
+把 topics.yaml 中所有主题的关键词编译为一个多关键词匹配器，
+一次扫描文本即可得到全部命中主题；每个主题的正则合并编译为一个正则。
+编译结果按主题配置指纹缓存，跨条目复用。
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+from ..utils.keyword_matrix import KeywordMatrix
+from ..utils.config import compile_topic_patterns
+from ..utils.keywords import KeywordMatcher
+from ..utils.logger import get_logger
+
+logger = get_logger("classify.matcher")
+
+# 缓存的编译结果数量上限（按主题配置指纹）
+MATCHER_CACHE_SIZE = 8
+
+_matcher_cache: "OrderedDict[str, TopicMatcher]" = OrderedDict()
+
+# 依赖分组编号的语法（反向引用、条件分组），合并后编号会错位
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def topics_fingerprint(topics: List[Dict[str, Any]]) -> str:
+    """计算主题配置指纹
+
+    Args:
+        topics: 主题配置列表
+
+    Returns:
+        SHA256指纹
+    """
+    payload = json.dumps(topics, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def topic_fingerprints(topics: List[Dict[str, Any]]) -> Dict[str, str]:
+    """计算每个主题的分类指纹
+
+    只包含影响分类结果的字段（关键词、正则），修改 boost 等字段不会使分类结果失效。
+    同名主题的定义会合并计算。
+
+    Args:
+        topics: 主题配置列表
+
+    Returns:
+        主题名 -> 指纹
+    """
+    definitions: Dict[str, List[Any]] = {}
+    for topic in topics:
+        name = topic.get("name")
+        if not name:
+            continue
+        definitions.setdefault(name, []).append(
+            [topic.get("keywords") or [], topic.get("patterns") or []]
+        )
+    return {name: topics_fingerprint(definition)[:16] for name, definition in definitions.items()}
+
+
+class TopicMatcher:
+    """主题关键词匹配器"""
+
+    def __init__(self, topics: List[Dict[str, Any]]):
+        """编译主题配置
+
+        Args:
+            topics: 主题配置列表
+        """
+        self.topic_names: List[str] = []
+        self.patterns: Dict[str, List[str]] = {}
+        # 主题名 -> 编译后的正则（通常每个主题合并为一个）
+        self.pattern_regexes: Dict[str, List[re.Pattern]] = {}
+        # 关键词（小写） -> 命中的主题名列表
+        self.keyword_topics: Dict[str, List[str]] = {}
+        # 含空关键词的主题（与 `"" in text` 一致，总是命中）
+        self.always_topics: Set[str] = set()
+
+        for topic in topics:
+            name = topic.get("name")
+            if not name:
+                continue
+            self.topic_names.append(name)
+            for keyword in topic.get("keywords") or []:
+                keyword = str(keyword).lower()
+                if not keyword:
+                    self.always_topics.add(name)
+                    continue
+                names = self.keyword_topics.setdefault(keyword, [])
+                if name not in names:
+                    names.append(name)
+            patterns = topic.get("patterns") or []
+            if patterns:
+                self.patterns.setdefault(name, []).extend(patterns)
+
+        for name, patterns in self.patterns.items():
+            regexes = _compile_patterns(name, patterns)
+            if regexes:
+                self.pattern_regexes[name] = regexes
+
+        self.keywords = KeywordMatcher(self.keyword_topics)
+        # 批量矩阵路径按需构建
+        self._matrix: Optional[KeywordMatrix] = None
+        self._incidence = None
+        logger.debug(
+            f"已编译主题匹配器: {len(self.topic_names)} 个主题，{len(self.keywords)} 个关键词"
+        )
+
+    def match_keywords(self, text_lower: str) -> Dict[str, str]:
+        """单遍匹配所有主题关键词
+
+        Args:
+            text_lower: 已转小写的可搜索文本
+
+        Returns:
+            命中的主题名 -> 命中的关键词
+        """
+        matched = {name: "" for name in self.always_topics}
+        for keyword in sorted(self.keywords.find(text_lower)):
+            for name in self.keyword_topics[keyword]:
+                matched.setdefault(name, keyword)
+        return matched
+
+    def match_keywords_batch(self, texts_lower: List[str]) -> List[Set[str]]:
+        """批量匹配主题关键词（稀疏矩阵路径，需要 numpy/scipy）
+
+        命中矩阵 (条目 × 关键词) 乘以关联矩阵 (关键词 × 主题)，非零即命中该主题。
+
+        Args:
+            texts_lower: 已转小写的可搜索文本列表
+
+        Returns:
+            每条文本命中的主题名集合
+        """
+        if self._matrix is None:
+            self._matrix = KeywordMatrix(self.keyword_topics)
+            self._incidence = self._matrix.incidence(self.keyword_topics, self.topic_names)
+
+        topic_hits = (self._matrix.hits(texts_lower) @ self._incidence).tocsr()
+        results = []
+        for row in range(topic_hits.shape[0]):
+            start, end = topic_hits.indptr[row], topic_hits.indptr[row + 1]
+            matched = {self.topic_names[col] for col in topic_hits.indices[start:end]}
+            matched.update(self.always_topics)
+            results.append(matched)
+        return results
+
+    def match_patterns(self, text: str, skip: Optional[Set[str]] = None) -> Dict[str, str]:
+        """匹配主题正则
+
+        Args:
+            text: 原始大小写的可搜索文本（正则不区分大小写）
+            skip: 无需再匹配的主题名（如已被关键词命中）
+
+        Returns:
+            命中的主题名 -> 命中的文本片段
+        """
+        matched = {}
+        for name, regexes in self.pattern_regexes.items():
+            if skip and name in skip:
+                continue
+            for regex in regexes:
+                match = regex.search(text)
+                if match:
+                    matched[name] = match.group()
+                    break
+        return matched
+
+
+def _compile_patterns(topic_name: str, patterns: List[str]) -> List[re.Pattern]:
+    """编译主题正则
+
+    优先把同一主题的所有正则合并为一个；合并失败（如使用了反向引用或全局内联标志）
+    时退回逐个编译的结果。逐个编译与加载配置时的校验共用 compile_topic_patterns，
+    经 Config 加载的正则已校验过，不会再次报告。
+
+    Args:
+        topic_name: 主题名
+        patterns: 正则表达式列表
+
+    Returns:
+        编译后的正则列表
+    """
+    compiled = compile_topic_patterns(topic_name, patterns)
+    if len(compiled) < 2 or any(_GROUP_REFERENCE_RE.search(regex.pattern) for regex in compiled):
+        return compiled
+    try:
+        return [re.compile("|".join(f"(?:{regex.pattern})" for regex in compiled), re.IGNORECASE)]
+    except re.error:
+        return compiled
+
+
+def get_topic_matcher(
+    topics: List[Dict[str, Any]], fingerprint: Optional[str] = None
+) -> TopicMatcher:
+    """获取（必要时编译）主题匹配器
+
+    Args:
+        topics: 主题配置列表
+        fingerprint: 预先计算的主题配置指纹
+
+    Returns:
+        TopicMatcher实例
+    """
+    fingerprint = fingerprint or topics_fingerprint(topics)
+    matcher = _matcher_cache.get(fingerprint)
+    if matcher is None:
+        matcher = TopicMatcher(topics)
+        _matcher_cache[fingerprint] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    else:
+        _matcher_cache.move_to_end(fingerprint)
+    return matcher
+
+
+__all__ = ["TopicMatcher", "get_topic_matcher", "topic_fingerprints", "topics_fingerprint"]
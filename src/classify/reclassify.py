@@ -0,0 +1,220 @@
+"""历史数据增量重新分类
+
+topics.yaml 变化后，对比上次分类时的主题定义快照，只找出可能受影响的历史条目：
+
+- 定义变化或被删除的主题：当前带有该标签的条目（可能失去标签）
+- 新增的关键词（含新主题的全部关键词）：通过文本全文索引查找包含这些关键词的条目（可能获得标签）
+- 新增的正则：无法走索引，只对这些正则扫描历史条目
+
+再对候选条目重新分类（复用分类缓存，只重算定义变化的主题），分批事务更新有变化的标签。
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from ..utils.logger import get_logger
+from . import classify_batch
+from .matcher import get_topic_matcher
+
+logger = get_logger("classify.reclassify")
+
+# 元数据表中保存主题定义快照的键
+SNAPSHOT_KEY = "topics_snapshot"
+
+
+@dataclass
+class TopicDiff:
+    """主题定义差异"""
+
+    # 定义变化或被删除的主题（已有标签可能失效）
+    changed_topics: Set[str] = field(default_factory=set)
+    # 新增的关键词（小写）
+    added_keywords: Set[str] = field(default_factory=set)
+    # 主题名 -> 新增的正则
+    added_patterns: Dict[str, List[str]] = field(default_factory=dict)
+    # 新增空关键词（总是命中）时需要检查全部条目
+    full_scan: bool = False
+
+    @property
+    def empty(self) -> bool:
+        """是否无差异"""
+        return not (
+            self.changed_topics or self.added_keywords or self.added_patterns or self.full_scan
+        )
+
+
+def topic_definitions(topics: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[str]]]:
+    """提取影响分类结果的主题定义（同名主题合并）
+
+    Args:
+        topics: 主题配置列表
+
+    Returns:
+        主题名 -> {"keywords": 小写关键词列表, "patterns": 正则列表}
+    """
+    definitions: Dict[str, Dict[str, List[str]]] = {}
+    for topic in topics:
+        name = topic.get("name")
+        if not name:
+            continue
+        definition = definitions.setdefault(name, {"keywords": [], "patterns": []})
+        for keyword in topic.get("keywords") or []:
+            keyword = str(keyword).lower()
+            if keyword not in definition["keywords"]:
+                definition["keywords"].append(keyword)
+        for pattern in topic.get("patterns") or []:
+            if pattern not in definition["patterns"]:
+                definition["patterns"].append(pattern)
+    for definition in definitions.values():
+        definition["keywords"].sort()
+    return definitions
+
+
+def diff_topics(
+    old: Dict[str, Dict[str, List[str]]], new: Dict[str, Dict[str, List[str]]]
+) -> TopicDiff:
+    """对比两个版本的主题定义
+
+    Args:
+        old: 上次分类时的主题定义
+        new: 当前主题定义
+
+    Returns:
+        TopicDiff
+    """
+    diff = TopicDiff()
+    for name, definition in new.items():
+        previous = old.get(name)
+        if previous == definition:
+            continue
+        if previous is not None:
+            diff.changed_topics.add(name)
+        previous = previous or {"keywords": [], "patterns": []}
+
+        added = set(definition["keywords"]) - set(previous["keywords"])
+        if "" in added:
+            diff.full_scan = True
+            added.discard("")
+        diff.added_keywords.update(added)
+
+        patterns = [p for p in definition["patterns"] if p not in previous["patterns"]]
+        if patterns:
+            diff.added_patterns[name] = patterns
+
+    diff.changed_topics.update(name for name in old if name not in new)
+    return diff
+
+
+def find_candidates(store, diff: TopicDiff, since: Optional[datetime] = None) -> Set[int]:
+    """查找可能受主题变化影响的历史条目
+
+    Args:
+        store: Storage实例
+        diff: 主题定义差异
+        since: 只检查该时间之后发布的条目
+
+    Returns:
+        条目ID集合
+    """
+    if diff.full_scan:
+        return set(store.get_item_ids(since))
+
+    candidates = set(store.get_item_ids_by_tags(diff.changed_topics, since))
+    candidates.update(store.search_item_ids(diff.added_keywords, since))
+
+    if diff.added_patterns:
+        # 正则无法走索引：只编译新增的正则，扫描剩余条目
+        matcher = get_topic_matcher(
+            [{"name": name, "patterns": patterns} for name, patterns in diff.added_patterns.items()]
+        )
+        remaining = [item_id for item_id in store.get_item_ids(since) if item_id not in candidates]
+        for start in range(0, len(remaining), 1000):
+            items = store.get_items_by_ids(remaining[start : start + 1000])
+            for item_id, item in items.items():
+                if matcher.match_patterns(item.text.classify_text):
+                    candidates.add(item_id)
+
+    return candidates
+
+
+def reclassify_history(
+    store,
+    topics: List[Dict[str, Any]],
+    since: Optional[datetime] = None,
+    full: bool = False,
+    dry_run: bool = False,
+    batch_size: int = 1000,
+) -> Dict[str, int]:
+    """按主题定义变化增量重新分类历史条目
+
+    Args:
+        store: Storage实例
+        topics: 当前主题配置列表
+        since: 只处理该时间之后发布的条目，为空时处理全部历史
+        full: 忽略快照，重新分类全部条目
+        dry_run: 只统计不写入
+        batch_size: 每批处理（及每个事务更新）的条目数
+
+    Returns:
+        统计信息: candidates 候选条目数, updated 标签有变化的条目数
+    """
+    current = topic_definitions(topics)
+    snapshot = store.get_meta(SNAPSHOT_KEY)
+
+    if full or snapshot is None:
+        if snapshot is None and not full:
+            logger.info("未找到主题定义快照，重新分类全部条目")
+        candidate_ids = set(store.get_item_ids(since))
+    else:
+        diff = diff_topics(json.loads(snapshot), current)
+        if diff.empty:
+            logger.info("主题定义未变化，无需重新分类")
+            return {"candidates": 0, "updated": 0}
+        logger.info(
+            f"主题定义变化: {len(diff.changed_topics)} 个主题修改/删除，"
+            f"新增 {len(diff.added_keywords)} 个关键词，"
+            f"{sum(len(p) for p in diff.added_patterns.values())} 个正则"
+        )
+        candidate_ids = find_candidates(store, diff, since)
+
+    logger.info(f"候选条目: {len(candidate_ids)} 条")
+
+    updated = 0
+    ordered = sorted(candidate_ids)
+    for start in range(0, len(ordered), batch_size):
+        items = store.get_items_by_ids(ordered[start : start + batch_size])
+        item_ids = list(items)
+        batch = [items[item_id] for item_id in item_ids]
+        before = {item_id: sorted(items[item_id].tags) for item_id in item_ids}
+
+        classify_batch(batch, topics, store=None if dry_run else store)
+
+        changes = {
+            item_id: item.tags
+            for item_id, item in zip(item_ids, batch)
+            if sorted(item.tags) != before[item_id]
+        }
+        if changes and not dry_run:
+            store.update_tags(changes, batch_size=batch_size)
+        updated += len(changes)
+
+    if not dry_run:
+        if since is None:
+            store.set_meta(SNAPSHOT_KEY, json.dumps(current, sort_keys=True, ensure_ascii=False))
+        else:
+            logger.info("仅处理了部分时间范围，保留原主题定义快照")
+
+    logger.info(f"重新分类完成: 候选 {len(candidate_ids)} 条，标签变化 {updated} 条")
+    return {"candidates": len(candidate_ids), "updated": updated}
+
+
+__all__ = [
+    "SNAPSHOT_KEY",
+    "TopicDiff",
+    "diff_topics",
+    "find_candidates",
+    "reclassify_history",
+    "topic_definitions",
+]
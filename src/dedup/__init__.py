@@ -1,13 +1,15 @@
 """去重模块"""
 
 import hashlib
-from typing import Any, Dict, List
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Set
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from ..ingest.models import Item
 from ..utils.logger import get_logger
+from .cluster import StoryClusterer
 
 logger = get_logger("dedup")
 
@@ -71,9 +73,131 @@ def compute_content_hash(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def url_host_key(normalized_url: str) -> str:
+    """提取URL的host分桶键
+
+    小写并去掉 ``www.`` 前缀，只有同一host下的URL才会进行模糊比较。
+
+    Args:
+        normalized_url: 规范化后的URL
+
+    Returns:
+        host分桶键
+    """
+    netloc = urlparse(normalized_url).netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return netloc
+
+
+class SimilarityIndex:
+    """按长度排序的文本索引
+
+    fuzz.ratio 的上界为 2*min(len1, len2)/(len1 + len2)，查询时先用二分查找
+    截取长度可能达到阈值的区间，再在区间内做一次模糊匹配。
+    """
+
+    def __init__(self, threshold: float):
+        """初始化索引
+
+        Args:
+            threshold: 相似度阈值 (0-1)
+        """
+        self.threshold = threshold
+        self._lengths: List[int] = []
+        self._texts: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, text: str):
+        """添加文本
+
+        Args:
+            text: 文本
+        """
+        position = bisect_right(self._lengths, len(text))
+        self._lengths.insert(position, len(text))
+        self._texts.insert(position, text)
+
+    def contains_similar(self, text: str) -> bool:
+        """检查索引中是否存在与text相似度达到阈值的文本
+
+        Args:
+            text: 文本
+
+        Returns:
+            是否存在
+        """
+        return _has_similar(text, self._candidates(len(text)), self.threshold)
+
+    def _candidates(self, length: int) -> List[str]:
+        if self.threshold <= 0:
+            return self._texts
+        ratio = self.threshold / (2 - self.threshold)
+        low = bisect_left(self._lengths, length * ratio - 1e-9)
+        high = bisect_right(self._lengths, length / ratio + 1e-9)
+        return self._texts[low:high]
+
+
+class UrlIndex:
+    """按host分桶的URL索引
+
+    精确匹配走集合查找，模糊匹配只在同一host的候选URL中进行。
+    """
+
+    def __init__(self, threshold: float = 0.9):
+        """初始化URL索引
+
+        Args:
+            threshold: 相似度阈值 (0-1)
+        """
+        self.threshold = threshold
+        self._exact: Set[str] = set()
+        self._by_host: Dict[str, SimilarityIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def add(self, url: str):
+        """添加URL
+
+        Args:
+            url: 原始URL
+        """
+        normalized = normalize_url(url)
+        if normalized in self._exact:
+            return
+        self._exact.add(normalized)
+        host = url_host_key(normalized)
+        if host not in self._by_host:
+            self._by_host[host] = SimilarityIndex(self.threshold)
+        self._by_host[host].add(normalized)
+
+    def contains_similar(self, url: str) -> bool:
+        """检查索引中是否存在与给定URL重复的URL
+
+        Args:
+            url: 原始URL
+
+        Returns:
+            是否重复
+        """
+        normalized = normalize_url(url)
+        if normalized in self._exact:
+            return True
+
+        candidates = self._by_host.get(url_host_key(normalized))
+        if candidates is None:
+            return False
+        return candidates.contains_similar(normalized)
+
+
 def is_duplicate_url(url1: str, url2: str, threshold: float = 0.9) -> bool:
     """检查URL是否重复
 
+    不同host的URL不做模糊比较。
+
     Args:
         url1: 第一个URL
         url2: 第二个URL
@@ -90,11 +214,35 @@ def is_duplicate_url(url1: str, url2: str, threshold: float = 0.9) -> bool:
     if norm_url1 == norm_url2:
         return True
 
+    # 不同host直接判定为不重复
+    if url_host_key(norm_url1) != url_host_key(norm_url2):
+        return False
+
     # 计算相似度
     similarity = fuzz.ratio(norm_url1, norm_url2) / 100.0
     return similarity >= threshold
 
 
+def normalize_title(title: str) -> str:
+    """规范化标题（小写、合并空白）
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        规范化后的标题
+    """
+    return " ".join((title or "").lower().split())
+
+
+def _has_similar(text: str, candidates: List[str], threshold: float) -> bool:
+    """检查候选列表中是否存在与text相似度达到阈值的文本"""
+    if not candidates:
+        return False
+    match = process.extractOne(text, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100)
+    return match is not None
+
+
 def is_duplicate_title(title1: str, title2: str, threshold: float = 0.85) -> bool:
     """检查标题是否重复
 
@@ -110,8 +258,8 @@ def is_duplicate_title(title1: str, title2: str, threshold: float = 0.85) -> boo
         return False
 
     # 标准化标题（小写、去除空白）
-    norm_title1 = " ".join(title1.lower().split())
-    norm_title2 = " ".join(title2.lower().split())
+    norm_title1 = normalize_title(title1)
+    norm_title2 = normalize_title(title2)
 
     # 完全相同
     if norm_title1 == norm_title2:
@@ -152,7 +300,9 @@ def is_duplicate_content(content1: str, content2: str, threshold: float = 0.95)
 
 
 def deduplicate(
-    items: List[Item], existing_items: List[Item] = None, config: Dict[str, Any] = None
+    items: List[Item],
+    existing_items: List[Item] = None,
+    config: Dict[str, Any] = None,
 ) -> List[Item]:
     """去重
 
@@ -171,8 +321,20 @@ def deduplicate(
     title_threshold = config.get("title_similarity_threshold", 0.85)
     content_threshold = config.get("content_similarity_threshold", 0.95)
 
-    # 合并所有需要对比的items
-    all_items = (existing_items or []) + items
+    # URL按host分桶建立索引，历史数据只规范化一次
+    batch_urls = UrlIndex(url_threshold)
+    history_urls = UrlIndex(url_threshold)
+    history_hashes: Set[str] = set()
+    history_short_contents = SimilarityIndex(content_threshold)
+    history_titles = SimilarityIndex(title_threshold)
+    for existing in existing_items or []:
+        history_urls.add(existing.url)
+        if existing.content:
+            history_hashes.add(compute_content_hash(existing.content))
+            if len(existing.content) < 1000:
+                history_short_contents.add(existing.content)
+        if existing.title:
+            history_titles.add(normalize_title(existing.title))
 
     unique_items = []
     duplicate_count = 0
@@ -183,39 +345,39 @@ def deduplicate(
         is_dup = False
 
         # 与所有之前的items对比
-        for j in range(i):
-            if is_duplicate_url(item.url, items[j].url, url_threshold):
-                logger.debug(f"URL重复: {item.title}")
-                is_dup = True
-                break
-            if is_duplicate_title(item.title, items[j].title, title_threshold):
-                logger.debug(f"标题重复: {item.title}")
-                is_dup = True
-                break
-            if item.content and items[j].content:
-                if is_duplicate_content(item.content, items[j].content, content_threshold):
-                    logger.debug(f"内容重复: {item.title}")
+        if batch_urls.contains_similar(item.url):
+            logger.debug(f"URL重复: {item.title}")
+            is_dup = True
+        else:
+            for j in range(i):
+                if is_duplicate_title(item.title, items[j].title, title_threshold):
+                    logger.debug(f"标题重复: {item.title}")
                     is_dup = True
                     break
+                if item.content and items[j].content:
+                    if is_duplicate_content(item.content, items[j].content, content_threshold):
+                        logger.debug(f"内容重复: {item.title}")
+                        is_dup = True
+                        break
+        batch_urls.add(item.url)
 
         # 与历史数据对比
         if not is_dup and existing_items:
-            for existing in existing_items:
-                if is_duplicate_url(item.url, existing.url, url_threshold):
-                    logger.debug(f"URL与历史重复: {item.title}")
-                    is_dup = True
-                    break
-                if is_duplicate_title(item.title, existing.title, title_threshold):
-                    logger.debug(f"标题与历史重复: {item.title}")
-                    is_dup = True
-                    break
-                if item.content and existing.content:
-                    if is_duplicate_content(
-                        item.content, existing.content, content_threshold
-                    ):
-                        logger.debug(f"内容与历史重复: {item.title}")
-                        is_dup = True
-                        break
+            if history_urls.contains_similar(item.url):
+                logger.debug(f"URL与历史重复: {item.title}")
+                is_dup = True
+            elif item.title and history_titles.contains_similar(normalize_title(item.title)):
+                logger.debug(f"标题与历史重复: {item.title}")
+                is_dup = True
+            elif item.content and (
+                compute_content_hash(item.content) in history_hashes
+                or (
+                    len(item.content) < 1000
+                    and history_short_contents.contains_similar(item.content)
+                )
+            ):
+                logger.debug(f"内容与历史重复: {item.title}")
+                is_dup = True
 
         if is_dup:
             duplicate_count += 1
@@ -229,9 +391,14 @@ def deduplicate(
 
 __all__ = [
     "normalize_url",
+    "url_host_key",
+    "SimilarityIndex",
+    "UrlIndex",
     "compute_content_hash",
     "is_duplicate_url",
+    "normalize_title",
     "is_duplicate_title",
     "is_duplicate_content",
     "deduplicate",
+    "StoryClusterer",
 ]
@@ -0,0 +1,375 @@
+"""去重基准测试
+
+生成确定性的合成语料（历史数据 + 新数据，新数据中埋入已知重复），
+对优化前的逐对比较去重（基准引擎 pairwise）和当前的 deduplicate 计时，
+并按埋入的重复计算精确率/召回率，用于确认性能优化没有改变去重结果。
+
+用法:
+    python -m src.dedup.benchmark --sizes 1000,10000,100000
+"""
+
+import argparse
+import random
+import string
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set
+
+from rapidfuzz import fuzz
+
+from ..ingest.models import Item
+from . import compute_content_hash, deduplicate, normalize_title, normalize_url
+
+HOSTS = [
+    "openai.com",
+    "anthropic.com",
+    "blog.google",
+    "ai.meta.com",
+    "github.com",
+    "arxiv.org",
+    "huggingface.co",
+    "techcrunch.com",
+    "theverge.com",
+    "venturebeat.com",
+]
+DUPLICATE_KINDS = ("repost", "tracking_url", "title_paraphrase", "title_edits", "long_content")
+BASE_TIME = datetime(2026, 4, 9, 8, 0)
+
+
+@dataclass
+class Corpus:
+    """合成语料"""
+
+    history: List[Item]
+    new_items: List[Item]
+    # 新数据中埋入的重复: url -> 重复类型
+    planted: Dict[str, str] = field(default_factory=dict)
+
+
+class CorpusGenerator:
+    """确定性合成语料生成器"""
+
+    def __init__(self, seed: int = 42, vocabulary_size: int = 5000):
+        """初始化生成器
+
+        Args:
+            seed: 随机种子
+            vocabulary_size: 伪词表大小
+        """
+        self.rng = random.Random(seed)
+        vocabulary: Set[str] = set()
+        while len(vocabulary) < vocabulary_size:
+            length = self.rng.randint(4, 10)
+            vocabulary.add("".join(self.rng.choices(string.ascii_lowercase, k=length)))
+        self.vocabulary = sorted(vocabulary)
+        self._serial = 0
+
+    def _words(self, count: int) -> List[str]:
+        return self.rng.sample(self.vocabulary, count)
+
+    def _sentence(self) -> str:
+        return " ".join(self._words(self.rng.randint(8, 16))).capitalize() + "."
+
+    def _content(self, long: bool) -> str:
+        target = self.rng.randint(1500, 4000) if long else self.rng.randint(200, 900)
+        sentences = []
+        while sum(len(s) + 1 for s in sentences) < target:
+            sentences.append(self._sentence())
+        return " ".join(sentences)
+
+    def unique_item(self) -> Item:
+        """生成与其他条目不重复的条目"""
+        self._serial += 1
+        host = self.rng.choice(HOSTS)
+        title_words = self._words(self.rng.randint(6, 9))
+        slug = "-".join(title_words[:5])
+        return Item(
+            url=f"https://{host}/posts/{self._serial}/{slug}",
+            title=" ".join(title_words).title(),
+            published=BASE_TIME - timedelta(minutes=self._serial),
+            source=host,
+            summary=self._sentence(),
+            content=self._content(long=self.rng.random() < 0.3),
+            raw_data={"authority_score": self.rng.randint(50, 100)},
+        )
+
+    def duplicate_of(self, original: Item, kind: str) -> Item:
+        """按指定类型生成原条目的重复"""
+        self._serial += 1
+        host = self.rng.choice([h for h in HOSTS if h not in original.url])
+        url = f"https://{host}/mirror/{self._serial}/{self._words(1)[0]}"
+        title = " ".join(self._words(7)).title()
+        content = self._content(long=False)
+
+        if kind == "repost":
+            url = original.url
+            title = original.title
+        elif kind == "tracking_url":
+            scheme_swapped = original.url.replace("https://", "http://", 1)
+            url = f"{scheme_swapped}/?utm_source=twitter&utm_medium=social&fbclid={self._serial}"
+        elif kind == "title_paraphrase":
+            title = self._paraphrase(original.title)
+        elif kind == "title_edits":
+            title = self._spread_edits(original.title)
+        elif kind == "long_content":
+            if original.content and len(original.content) < 1000:
+                original.content = self._content(long=True)
+            content = original.content
+        else:
+            raise ValueError(f"未知的重复类型: {kind}")
+
+        return Item(
+            url=url,
+            title=title,
+            published=BASE_TIME + timedelta(minutes=self._serial),
+            source=host,
+            summary=self._sentence(),
+            content=content,
+            raw_data={"authority_score": self.rng.randint(50, 100)},
+        )
+
+    def _paraphrase(self, title: str) -> str:
+        variant = self.rng.randint(0, 2)
+        if variant == 0:
+            return title.upper() + "!"
+        if variant == 1:
+            return f"{title} - Blog"
+        words = title.split()
+        index = self.rng.randrange(len(words))
+        words[index] = words[index][:-1] if len(words[index]) > 4 else words[index] + "s"
+        return "  ".join(words)
+
+    def _spread_edits(self, title: str, chars_per_edit: int = 16) -> str:
+        """每 chars_per_edit 个字符替换一个字母，改动分散在整个标题上
+
+        每处替换的插入删除距离为2，默认密度下相似度约 1 - 1/chars_per_edit（约0.94），
+        仍高于默认阈值，但不会留下足够长的完整片段，能检验检索引擎是否漏召回。
+        """
+        chars = list(title)
+        edits = max(2, len(chars) // chars_per_edit)
+        bounds = [len(chars) * index // edits for index in range(edits + 1)]
+        for start, end in zip(bounds, bounds[1:]):
+            positions = [index for index in range(start, end) if chars[index].isalpha()]
+            if not positions:
+                continue
+            index = self.rng.choice(positions)
+            current = chars[index].lower()
+            chars[index] = self.rng.choice([c for c in string.ascii_lowercase if c != current])
+        return "".join(chars)
+
+    def generate(self, history_size: int, new_size: int, duplicate_ratio: float = 0.3) -> Corpus:
+        """生成语料
+
+        Args:
+            history_size: 历史数据条数
+            new_size: 新数据条数
+            duplicate_ratio: 新数据中埋入重复的比例
+
+        Returns:
+            Corpus
+        """
+        history = [self.unique_item() for _ in range(history_size)]
+        new_items: List[Item] = []
+        planted: Dict[str, str] = {}
+
+        duplicate_count = int(new_size * duplicate_ratio) if history else 0
+        for index in range(duplicate_count):
+            kind = DUPLICATE_KINDS[index % len(DUPLICATE_KINDS)]
+            duplicate = self.duplicate_of(self.rng.choice(history), kind)
+            planted[duplicate.url] = kind
+            new_items.append(duplicate)
+
+        while len(new_items) < new_size:
+            new_items.append(self.unique_item())
+
+        self.rng.shuffle(new_items)
+        return Corpus(history=history, new_items=new_items, planted=planted)
+
+
+def _pairwise_deduplicate(
+    items: List[Item], existing_items: List[Item], config: Dict
+) -> List[Item]:
+    """优化前的去重逻辑：每条新数据与之前的新数据、以及每条历史数据逐对比较
+
+    URL/标题规范化和内容哈希只计算一次，判定规则与优化前的 deduplicate 一致。
+    """
+    url_threshold = config.get("url_similarity_threshold", 0.9) * 100
+    title_threshold = config.get("title_similarity_threshold", 0.85) * 100
+    content_threshold = config.get("content_similarity_threshold", 0.95) * 100
+
+    def prepare(item: Item) -> tuple:
+        content_hash = compute_content_hash(item.content) if item.content else ""
+        return normalize_url(item.url), normalize_title(item.title), item.content, content_hash
+
+    def is_duplicate(current: tuple, other: tuple) -> bool:
+        url, title, content, content_hash = current
+        other_url, other_title, other_content, other_hash = other
+        if fuzz.ratio(url, other_url) >= url_threshold:
+            return True
+        if title and other_title and fuzz.ratio(title, other_title) >= title_threshold:
+            return True
+        if not content or not other_content:
+            return False
+        if content_hash == other_hash:
+            return True
+        return (
+            len(content) < 1000
+            and len(other_content) < 1000
+            and fuzz.ratio(content, other_content) >= content_threshold
+        )
+
+    history = [prepare(existing) for existing in existing_items]
+    history_urls = {prepared[0] for prepared in history}
+    seen: List[tuple] = []
+    unique_items = []
+    for item in items:
+        current = prepare(item)
+        if current[0] not in history_urls and not any(
+            is_duplicate(current, other) for other in seen + history
+        ):
+            unique_items.append(item)
+        seen.append(current)
+    return unique_items
+
+
+def _engine_pairwise(corpus: Corpus, config: Dict) -> Callable[[], List[Item]]:
+    return lambda: _pairwise_deduplicate(corpus.new_items, corpus.history, config)
+
+
+def _engine_scan(corpus: Corpus, config: Dict) -> Callable[[], List[Item]]:
+    return lambda: deduplicate(corpus.new_items, corpus.history, config)
+
+
+# 引擎名 -> 准备函数（准备阶段不计时，返回待计时的去重调用）；第一个引擎为基准
+ENGINES: Dict[str, Callable[[Corpus, Dict], Callable[[], List[Item]]]] = {
+    "pairwise": _engine_pairwise,
+    "scan": _engine_scan,
+}
+
+
+def evaluate(
+    corpus: Corpus, kept: List[Item], baseline: Optional[List[Item]] = None
+) -> Dict[str, float]:
+    """按埋入的重复计算精确率/召回率
+
+    Args:
+        corpus: 语料
+        kept: 去重后保留的条目
+        baseline: 基准引擎保留的条目，给出时额外统计相对基准的召回差异
+
+    Returns:
+        指标字典
+    """
+    kept_ids = {id(item) for item in kept}
+    predicted = {item.url for item in corpus.new_items if id(item) not in kept_ids}
+    planted = set(corpus.planted)
+    true_positive = len(predicted & planted)
+
+    metrics = {
+        "predicted": len(predicted),
+        "planted": len(planted),
+        "precision": true_positive / len(predicted) if predicted else 1.0,
+        "recall": true_positive / len(planted) if planted else 1.0,
+    }
+    for kind in DUPLICATE_KINDS:
+        urls = {url for url, planted_kind in corpus.planted.items() if planted_kind == kind}
+        if urls:
+            metrics[f"recall_{kind}"] = len(predicted & urls) / len(urls)
+
+    if baseline is not None:
+        baseline_ids = {id(item) for item in baseline}
+        baseline_predicted = {item.url for item in corpus.new_items if id(item) not in baseline_ids}
+        baseline_recall = len(baseline_predicted & planted) / len(planted) if planted else 1.0
+        metrics["recall_delta"] = metrics["recall"] - baseline_recall
+        # 基准识别出、本引擎漏掉的埋入重复
+        metrics["missed_vs_baseline"] = len((baseline_predicted - predicted) & planted)
+    return metrics
+
+
+def run_benchmark(
+    sizes: List[int],
+    new_size: int = 200,
+    engines: Optional[List[str]] = None,
+    seed: int = 42,
+    config: Optional[Dict] = None,
+) -> List[Dict]:
+    """运行去重基准
+
+    Args:
+        sizes: 历史数据规模列表
+        new_size: 每轮新数据条数
+        engines: 引擎名列表，默认全部
+        seed: 随机种子
+        config: 去重配置
+
+    Returns:
+        每个(规模, 引擎)一行的结果列表
+    """
+    config = config or {}
+    engines = engines or list(ENGINES)
+    results = []
+
+    for size in sizes:
+        corpus = CorpusGenerator(seed).generate(size, new_size)
+        baseline = None
+        for name in engines:
+            run = ENGINES[name](corpus, config)
+            started = time.perf_counter()
+            kept = run()
+            elapsed = time.perf_counter() - started
+
+            if baseline is None:
+                baseline = kept
+            row = {
+                "history": size,
+                "new": len(corpus.new_items),
+                "engine": name,
+                "seconds": elapsed,
+                "same_as_baseline": [item.url for item in kept] == [item.url for item in baseline],
+            }
+            row.update(evaluate(corpus, kept, baseline))
+            results.append(row)
+    return results
+
+
+def format_results(results: List[Dict]) -> str:
+    """格式化结果表格（delta/missed 为相对第一个引擎的召回差异和漏召回数）"""
+    header = (
+        f"{'history':>8} {'new':>5} {'engine':>8} {'seconds':>9} {'prec':>6} {'recall':>6} "
+        + " ".join(f"{kind[:12]:>12}" for kind in DUPLICATE_KINDS)
+        + f" {'delta':>7} {'missed':>6}  same"
+    )
+    lines = [header]
+    for row in results:
+        kinds = " ".join(f"{row.get(f'recall_{kind}', 0.0):>12.3f}" for kind in DUPLICATE_KINDS)
+        lines.append(
+            f"{row['history']:>8} {row['new']:>5} {row['engine']:>8} {row['seconds']:>9.3f} "
+            f"{row['precision']:>6.3f} {row['recall']:>6.3f} {kinds} {row['recall_delta']:>+7.3f} "
+            f"{row['missed_vs_baseline']:>6}  {row['same_as_baseline']}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="去重基准测试")
+    parser.add_argument(
+        "--sizes", type=str, default="1000,10000,100000", help="历史数据规模，逗号分隔"
+    )
+    parser.add_argument("--new-items", type=int, default=200, help="每轮新数据条数")
+    parser.add_argument("--engines", type=str, default=",".join(ENGINES), help="引擎名，逗号分隔")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        new_size=args.new_items,
+        engines=args.engines.split(","),
+        seed=args.seed,
+    )
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""跨来源事件聚类
+
+同一事件常同时出现在官方博客、GitHub Release、多条新闻和论文中。
+这里把 news_search 的事件判重规则推广为聚类阶段：按事件词建立倒排索引做分块，
+再按共享词数与公司标签把新条目增量归入已有聚类（含历史聚类），每个聚类只保留
+一个代表条目，其余条目作为相关链接挂在代表条目上。
+"""
+
+import hashlib
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+from ..ingest.models import Item
+from ..ingest.news_search_fetcher import (
+    EVENT_MIN_SHARED_TOKENS_WITH_COMPANY,
+    extract_company_tags,
+    extract_event_tokens,
+    is_same_event,
+)
+from ..utils.logger import get_logger
+
+logger = get_logger("dedup.cluster")
+
+
+def _cluster_id_for(url: str) -> str:
+    """根据代表条目URL生成聚类ID"""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+class StoryClusterer:
+    """事件聚类器"""
+
+    def __init__(
+        self,
+        history_members: Optional[List[Dict[str, Any]]] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ):
+        """初始化事件聚类器
+
+        Args:
+            history_members: 历史聚类成员（来自Storage.get_story_members）
+            config: 去重配置
+        """
+        config = config or {}
+        self.text_chars = config.get("cluster_summary_chars", 280)
+
+        self._members: List[Dict[str, Any]] = []
+        self._token_index: Dict[str, List[int]] = defaultdict(list)
+        self._history_clusters: Set[str] = set()
+        self.new_members: List[Dict[str, Any]] = []
+
+        for member in history_members or []:
+            self._add_member(member)
+            self._history_clusters.add(member["cluster_id"])
+
+    def _add_member(self, member: Dict[str, Any]):
+        """将成员加入倒排索引"""
+        index = len(self._members)
+        self._members.append(member)
+        for token in member["tokens"]:
+            self._token_index[token].append(index)
+
+    def signature(self, item: Item) -> Dict[str, Any]:
+        """计算条目的事件签名
+
+        Args:
+            item: Item
+
+        Returns:
+            包含 tokens 与 companies 的成员字典（尚未分配聚类）
+        """
+        summary = (item.summary or "")[: self.text_chars]
+        tokens = extract_event_tokens(item.title, summary)
+        companies = extract_company_tags(f"{item.title} {summary}")
+        return {
+            "url": item.url,
+            "source": item.source,
+            "title": item.title,
+            "published": item.published,
+            "tokens": sorted(tokens),
+            "companies": sorted(companies),
+            "cluster_id": None,
+        }
+
+    def assign(self, item: Item) -> Dict[str, Any]:
+        """将条目增量归入聚类
+
+        只与共享事件词的成员比较；同一来源的成员不参与合并，
+        同源重复由URL/标题去重负责。
+
+        Args:
+            item: Item
+
+        Returns:
+            已分配 cluster_id 的成员字典
+        """
+        member = self.signature(item)
+        companies = set(member["companies"])
+
+        shared = Counter()
+        for token in member["tokens"]:
+            for index in self._token_index.get(token, ()):
+                shared[index] += 1
+
+        best_index = None
+        best_shared = 0
+        for index, count in shared.items():
+            if count < EVENT_MIN_SHARED_TOKENS_WITH_COMPANY or count <= best_shared:
+                continue
+            candidate = self._members[index]
+            if candidate["source"] == member["source"]:
+                continue
+            if is_same_event(count, bool(companies & set(candidate["companies"]))):
+                best_index = index
+                best_shared = count
+
+        if best_index is not None:
+            member["cluster_id"] = self._members[best_index]["cluster_id"]
+        else:
+            member["cluster_id"] = _cluster_id_for(item.url)
+
+        self._add_member(member)
+        self.new_members.append(member)
+        return member
+
+    def cluster(self, items: List[Item]) -> List[Item]:
+        """对一批条目聚类，只返回每个新聚类的代表条目
+
+        归入历史聚类的条目视为已报道事件的后续报道，不再输出。
+
+        Args:
+            items: 去重后的Item列表
+
+        Returns:
+            代表条目列表（保持原有顺序），其余成员写入代表条目的 raw_data["related_links"]
+        """
+        clusters: Dict[str, List[Item]] = defaultdict(list)
+        order: List[str] = []
+        followups = 0
+
+        for item in items:
+            cluster_id = self.assign(item)["cluster_id"]
+            if cluster_id in self._history_clusters:
+                followups += 1
+                logger.debug(f"归入历史事件: {item.title}")
+                continue
+            if cluster_id not in clusters:
+                order.append(cluster_id)
+            clusters[cluster_id].append(item)
+
+        representatives = []
+        for cluster_id in order:
+            members = clusters[cluster_id]
+            representative = min(members, key=_representative_key)
+            related = [member for member in members if member is not representative]
+            representative.raw_data["story_cluster_id"] = cluster_id
+            if related:
+                representative.raw_data["related_links"] = [
+                    {"title": member.title, "url": member.url, "source": member.source}
+                    for member in related
+                ]
+                logger.debug(f"合并 {len(related)} 条相关报道: {representative.title}")
+            representatives.append(representative)
+
+        rep_ids = {id(item) for item in representatives}
+        representatives = [item for item in items if id(item) in rep_ids]
+
+        logger.info(
+            f"事件聚类完成: {len(items)} 条 -> {len(representatives)} 个事件，"
+            f"合并 {len(items) - len(representatives) - followups} 条相关报道，"
+            f"{followups} 条归入历史事件"
+        )
+
+        return representatives
+
+    def members_to_save(self, saved_items: List[Item]) -> List[Dict[str, Any]]:
+        """筛选需要入库的新成员
+
+        只保留代表条目实际入库的聚类和历史聚类的成员。代表条目被过滤或未发布的聚类不入库，
+        否则之后几天的报道会被当作已报道事件的后续报道丢弃。
+
+        Args:
+            saved_items: 实际入库的Item列表
+
+        Returns:
+            成员列表
+        """
+        kept = {item.raw_data.get("story_cluster_id") for item in saved_items}
+        kept |= self._history_clusters
+        return [member for member in self.new_members if member["cluster_id"] in kept]
+
+
+def _representative_key(item: Item):
+    """代表条目排序键：权威度高优先，其次发布更早、内容更完整"""
+    published = item.published
+    if published.tzinfo is not None:
+        published = published.replace(tzinfo=None)
+    return (
+        -item.raw_data.get("authority_score", 50),
+        published,
+        -len(item.content or ""),
+    )
+
+
+__all__ = ["StoryClusterer"]
@@ -1,8 +1,119 @@
 """数据模型"""
 
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ItemText:
+    """Item文本的规范化视图
+
+    分类、评分、必读判断、发布和通知都要反复拼接并小写同一批字段，
+    这里惰性计算一次后共享。视图以源字段为键，字段被修改后由 Item.text 自动重建。
+    """
+
+    __slots__ = ("key", "_cache")
+
+    def __init__(self, key: Tuple):
+        """初始化文本视图
+
+        Args:
+            key: 源字段元组，见 ItemText.key_for
+        """
+        self.key = key
+        self._cache: Dict[str, Any] = {}
+
+    @staticmethod
+    def key_for(item: "Item") -> Tuple:
+        """构造源字段元组"""
+        return (
+            item.title,
+            item.summary,
+            item.content,
+            item.source,
+            item.ai_summary,
+            tuple(item.key_points),
+        )
+
+    def _get(self, name: str, build):
+        value = self._cache.get(name)
+        if value is None:
+            value = build()
+            self._cache[name] = value
+        return value
+
+    @property
+    def classify_text(self) -> str:
+        """分类用文本：标题、摘要、正文、来源"""
+        title, summary, content, source = self.key[:4]
+        return self._get(
+            "classify_text",
+            lambda: " ".join(filter(None, [title, summary or "", content or "", source])),
+        )
+
+    @property
+    def classify_lower(self) -> str:
+        """分类用文本（小写）"""
+        return self._get("classify_lower", lambda: self.classify_text.lower())
+
+    @property
+    def classify_hash(self) -> str:
+        """分类用文本的SHA256哈希（分类缓存键）"""
+        return self._get(
+            "classify_hash", lambda: hashlib.sha256(self.classify_text.encode("utf-8")).hexdigest()
+        )
+
+    @property
+    def searchable(self) -> str:
+        """评分用文本：标题、摘要、正文"""
+        title, summary, content = self.key[:3]
+        return self._get(
+            "searchable", lambda: " ".join(filter(None, [title, summary or "", content or ""]))
+        )
+
+    @property
+    def searchable_lower(self) -> str:
+        """评分用文本（小写）"""
+        return self._get("searchable_lower", lambda: self.searchable.lower())
+
+    @property
+    def title_lower(self) -> str:
+        """标题（小写）"""
+        return self._get("title_lower", lambda: (self.key[0] or "").lower())
+
+    @property
+    def summary_lower(self) -> str:
+        """原始摘要（小写）"""
+        return self._get("summary_lower", lambda: (self.key[1] or "").lower())
+
+    @property
+    def source_lower(self) -> str:
+        """来源（小写）"""
+        return self._get("source_lower", lambda: (self.key[3] or "").lower())
+
+    @property
+    def title_summary_lower(self) -> str:
+        """标题 + 原始摘要（小写）"""
+        title, summary = self.key[:2]
+        return self._get("title_summary_lower", lambda: (title + " " + (summary or "")).lower())
+
+    @property
+    def headline_lower(self) -> str:
+        """标题 + AI摘要（无则原始摘要），小写"""
+        title, summary = self.key[:2]
+        ai_summary = self.key[4]
+        return self._get("headline_lower", lambda: f"{title} {ai_summary or summary or ''}".lower())
+
+    @property
+    def brief_lower(self) -> str:
+        """标题 + AI摘要 + 关键点，小写"""
+        title, summary = self.key[:2]
+        ai_summary, key_points = self.key[4:6]
+        return self._get(
+            "brief_lower",
+            lambda: f"{title} {ai_summary or summary or ''} {' '.join(key_points)}".lower(),
+        )
 
 
 @dataclass
@@ -27,6 +138,21 @@ class Item:
     key_points: List[str] = field(default_factory=list)
     action: Optional[str] = None
 
+    # 文本视图缓存（不参与序列化与比较）
+    _text_view: Optional[ItemText] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text(self) -> ItemText:
+        """规范化文本视图（惰性计算，源字段变化后自动重建）
+
+        Returns:
+            ItemText实例
+        """
+        key = ItemText.key_for(self)
+        if self._text_view is None or self._text_view.key != key:
+            self._text_view = ItemText(key)
+        return self._text_view
+
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典
 
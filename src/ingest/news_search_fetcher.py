@@ -177,6 +177,8 @@ COMPANY_ALIASES = {
     "alibaba": ("alibaba", "qwen"),
 }
 MAX_ITEMS_PER_COMPANY = 2
+EVENT_MIN_SHARED_TOKENS = 5
+EVENT_MIN_SHARED_TOKENS_WITH_COMPANY = 3
 
 
 def _now_utc(now: Optional[datetime] = None) -> datetime:
@@ -446,6 +448,12 @@ def is_low_quality_title(title: str) -> bool:
     return False
 
 
+def is_same_event(shared_tokens: int, shares_company: bool) -> bool:
+    if shares_company and shared_tokens >= EVENT_MIN_SHARED_TOKENS_WITH_COMPANY:
+        return True
+    return shared_tokens >= EVENT_MIN_SHARED_TOKENS
+
+
 def is_duplicate_event(candidate: dict[str, str], existing_items: list[dict[str, str]]) -> bool:
     candidate_text = _event_text(
         candidate.get("title", ""),
@@ -464,9 +472,7 @@ def is_duplicate_event(candidate: dict[str, str], existing_items: list[dict[str,
         existing_tokens = extract_event_tokens(existing_text)
         existing_companies = extract_company_tags(existing_text)
         overlap = candidate_tokens & existing_tokens
-        if candidate_companies & existing_companies and len(overlap) >= 3:
-            return True
-        if len(overlap) >= 5:
+        if is_same_event(len(overlap), bool(candidate_companies & existing_companies)):
             return True
     return False
 
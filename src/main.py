@@ -11,6 +11,8 @@ except ImportError:  # pragma: no cover - compatibility when dependency is not i
     load_dotenv = None
 
 from . import classify, dedup, ingest, notify, publish, score, storage, summarize
+from .classify.reclassify import reclassify_history
+from .summarize.telemetry import DEFAULT_BATCH_DISCOUNT, format_report, summarize_calls
 from .utils import Config, get_logger, setup_logger
 
 
@@ -103,13 +105,25 @@ def run_daily(args):
 
         items = dedup.deduplicate(items, existing_items, dedup_config)
 
+        # 跨来源事件聚类：每个事件只保留一个代表条目
+        clusterer = None
+        if dedup_config.get("story_clustering", True):
+            cluster_since = datetime.now() - timedelta(
+                days=dedup_config.get("cluster_lookback_days", 3)
+            )
+            clusterer = dedup.StoryClusterer(
+                store.get_story_members(since=cluster_since), dedup_config
+            )
+            items = clusterer.cluster(items)
+
         if not items:
             logger.warning("去重后无数据，终止")
             return
 
         # 3. 分类
         logger.info("步骤 3/7: 分类")
-        items = classify.classify_batch(items, config.topics)
+        # 分类缓存按内容哈希复用历史结果（dry-run 时不读写数据库）
+        items = classify.classify_batch(items, config.topics, store=None if args.dry_run else store)
 
         # 4. 评分
         logger.info("步骤 4/7: 评分")
@@ -117,29 +131,46 @@ def run_daily(args):
         preferences = config.get_preferences()
         items = score.score_batch(items, scoring_config, config.topics, preferences)
 
+        # 过滤不会发布的条目（之后的摘要、通知、入库都不再处理它们）
+        items = score.filter_items(items, config.get_filter_rules())
+        if not items:
+            logger.warning("过滤后无数据，终止")
+            return
+
         # 5. 标记必读
         logger.info("步骤 5/7: 标记必读")
         must_read_rules = config.get_must_read_rules()
         topics_dict = {t["name"]: t for t in config.topics}
         items = score.mark_must_read(items, must_read_rules, topics_dict)
 
+        output_config = config.get_output_config("daily")
+
         # 6. 生成摘要
         if not args.no_summary:
             logger.info("步骤 6/7: 生成摘要")
+            # 只为报告会展示的条目（及少量候补）生成摘要，其余条目入库后由周报按需补齐
+            publishable = publish.select_publishable(items, output_config, limit=args.limit)
             llm_config = config.get_llm_config()
-            items = summarize.summarize_batch(items, llm_config)
+            summarize.summarize_batch(
+                publishable,
+                llm_config,
+                store=None if args.dry_run else store,
+                run_id=summarize.new_run_id("daily", started_at),
+            )
         else:
             logger.info("步骤 6/7: 跳过摘要生成 (--no-summary)")
 
         # 7. 发布
         logger.info("步骤 7/7: 生成报告")
         output_dir = Path(args.output_dir) / "daily"
-        output_config = config.get_output_config("daily")
 
         # 限制输出数量
         if args.limit:
             items = items[: args.limit]
 
+        # 只为输出的条目生成评分理由
+        score.attach_reasons(items)
+
         report_path = publish.generate_daily_report(items, str(output_dir), datetime.now(), output_config)
 
         logger.info(f"✅ 日报已生成: {report_path}")
@@ -159,6 +190,8 @@ def run_daily(args):
         if not args.dry_run:
             logger.info("保存到数据库...")
             store.save_items(items)
+            if clusterer:
+                store.save_story_members(clusterer.members_to_save(items))
 
             # 记录运行日志
             finished_at = datetime.now()
@@ -215,10 +248,26 @@ def run_weekly(args):
         since_delta = parse_time_delta(args.since)
         since = datetime.now() - since_delta
 
+        # 先取回已结束的批处理摘要作业（summarize --batch 提交）
+        if not args.dry_run:
+            try:
+                summarize.collect_batch_results(
+                    config.get_llm_config(),
+                    store,
+                    run_id=summarize.new_run_id("weekly", started_at),
+                )
+            except Exception as e:
+                logger.warning(f"取回批处理摘要失败: {e}")
+
         # 从数据库查询一周内的数据
         logger.info(f"从数据库查询数据 (时间范围: {args.since})")
         items = store.get_items(since=since)
 
+        if items:
+            # 入库时的分数按当时的新鲜度计算，按当前时间只重算新鲜度并重新排序
+            scorer = score.Scorer(config.get_scoring_config(), config.topics)
+            scorer.rescore_freshness(items, preferences=config.get_preferences())
+
         if not items:
             logger.warning("数据库中无数据，尝试实时采集...")
 
@@ -234,7 +283,11 @@ def run_weekly(args):
             # 处理流程（简化版）
             dedup_config = config.get_dedup_config()
             items = dedup.deduplicate(items, None, dedup_config)
-            items = classify.classify_batch(items, config.topics)
+            if dedup_config.get("story_clustering", True):
+                items = dedup.StoryClusterer(None, dedup_config).cluster(items)
+            items = classify.classify_batch(
+                items, config.topics, store=None if args.dry_run else store
+            )
 
             scoring_config = config.get_scoring_config()
             preferences = config.get_preferences()
@@ -250,9 +303,29 @@ def run_weekly(args):
         if args.limit:
             items = items[: args.limit]
 
+        output_config = config.get_output_config("weekly")
+
+        # 日报只为当天展示的条目生成了摘要，周报展示的条目缺摘要时按需补齐
+        if not args.no_summary:
+            # 仍在批处理作业中的条目等作业结果，不再走实时接口重复付费
+            queued = [url for job in store.get_open_summary_batches() for url in job["entries"]]
+            missing = publish.select_missing_summaries(items, output_config, queued)
+            if missing:
+                logger.info(f"补齐 {len(missing)} 条缺少摘要的条目")
+                summarize.summarize_batch(
+                    missing,
+                    config.get_llm_config(),
+                    store=None if args.dry_run else store,
+                    run_id=summarize.new_run_id("weekly", started_at),
+                )
+                if not args.dry_run:
+                    store.update_summaries(missing)
+
+        # 只为输出的条目生成评分理由
+        score.attach_reasons(items)
+
         # 生成周报
         output_dir = Path(args.output_dir) / "weekly"
-        output_config = config.get_output_config("weekly")
 
         # 计算本周开始日期（周一）
         today = datetime.now()
@@ -285,6 +358,129 @@ def run_weekly(args):
         sys.exit(1)
 
 
+def run_summarize(args):
+    """为已入库但缺少摘要的条目补齐摘要
+
+    Args:
+        args: 命令行参数
+    """
+    logger = get_logger()
+    run_id = summarize.new_run_id("summarize")
+
+    logger.info("=" * 60)
+    logger.info("开始补齐摘要")
+    logger.info("=" * 60)
+
+    try:
+        config = Config(args.config_dir)
+
+        db_path = Path(args.config_dir) / "ai-intake.db"
+        store = storage.Storage(str(db_path))
+        llm_config = config.get_llm_config()
+
+        # 批处理模式：先取回之前提交的作业结果
+        if args.batch:
+            applied = summarize.collect_batch_results(llm_config, store, run_id=run_id)
+            if applied:
+                logger.info(f"✅ 已写回 {applied} 条批处理摘要")
+
+        since = datetime.now() - parse_time_delta(args.since)
+        items = [item for item in store.get_items(since=since) if not item.ai_summary]
+        if args.limit:
+            items = items[: args.limit]
+
+        if not items:
+            logger.info("没有缺少摘要的条目")
+        elif args.batch:
+            job_ids = summarize.submit_batch_jobs(items, llm_config, store)
+            logger.info(
+                f"✅ 已提交 {len(job_ids)} 个批处理作业，下次运行 summarize --batch 或 weekly 时取回结果"
+            )
+        else:
+            logger.info(f"为 {len(items)} 条缺少摘要的条目生成摘要")
+            summarize.summarize_batch(items, llm_config, store=store, run_id=run_id)
+            store.update_summaries(items)
+
+        store.close()
+
+    except Exception as e:
+        logger.error(f"补齐摘要失败: {e}", exc_info=True)
+        sys.exit(1)
+
+
+def run_llm_report(args):
+    """输出LLM调用汇总（按运行、层级、模型的延迟、token用量和费用）
+
+    Args:
+        args: 命令行参数
+    """
+    logger = get_logger()
+
+    try:
+        config = Config(args.config_dir)
+
+        db_path = Path(args.config_dir) / "ai-intake.db"
+        store = storage.Storage(str(db_path))
+        since = datetime.now() - parse_time_delta(args.since)
+        calls = store.get_llm_calls(since=since, run_id=args.run)
+        store.close()
+
+        if not calls:
+            logger.info(f"{args.since} 内没有LLM调用记录")
+            return
+
+        llm_config = config.get_llm_config()
+        pricing = llm_config.get("pricing") or {}
+        batch_discount = llm_config.get("batch_discount", DEFAULT_BATCH_DISCOUNT)
+        for group_by in (("run_id", "tier", "model"), ("model",)):
+            rows = summarize_calls(calls, pricing, group_by, batch_discount)
+            print(format_report(rows, group_by))
+            print()
+
+    except Exception as e:
+        logger.error(f"生成LLM调用汇总失败: {e}", exc_info=True)
+        sys.exit(1)
+
+
+def run_reclassify(args):
+    """按 topics.yaml 的变化增量重新分类历史数据
+
+    Args:
+        args: 命令行参数
+    """
+    logger = get_logger()
+
+    logger.info("=" * 60)
+    logger.info("开始重新分类历史数据")
+    logger.info("=" * 60)
+
+    try:
+        config = Config(args.config_dir)
+
+        db_path = Path(args.config_dir) / "ai-intake.db"
+        store = storage.Storage(str(db_path))
+
+        since = datetime.now() - parse_time_delta(args.since) if args.since else None
+        stats = reclassify_history(
+            store,
+            config.topics,
+            since=since,
+            full=args.full,
+            dry_run=args.dry_run,
+        )
+
+        if args.dry_run:
+            logger.info(f"Dry-run模式: {stats['updated']} 条数据的标签将会变化")
+        else:
+            logger.info(f"✅ 已更新 {stats['updated']} 条数据的标签")
+
+        store.close()
+
+    except Exception as e:
+        logger.error(f"重新分类失败: {e}", exc_info=True)
+        sys.exit(1)
+
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(
@@ -362,6 +558,11 @@ def main():
         default=None,
         help="输出条目数量限制",
     )
+    weekly_parser.add_argument(
+        "--no-summary",
+        action="store_true",
+        help="不为缺少摘要的条目补齐摘要",
+    )
     weekly_parser.add_argument(
         "--config-dir",
         type=str,
@@ -385,6 +586,92 @@ def main():
         help="详细日志输出",
     )
 
+    # summarize 命令
+    summarize_parser = subparsers.add_parser("summarize", help="为已入库但缺少摘要的条目补齐摘要")
+    summarize_parser.add_argument(
+        "--since",
+        type=str,
+        default="7d",
+        help="只处理该时间范围内的数据 (例如: 7d, 30d)",
+    )
+    summarize_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="最多处理的条目数（按分数从高到低）",
+    )
+    summarize_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="通过提供商的异步批处理接口提交（OpenAI Batch / Anthropic Message Batches），后续运行时取回结果",
+    )
+    summarize_parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=".",
+        help="配置文件目录路径",
+    )
+    summarize_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="详细日志输出",
+    )
+
+    # llm-report 命令
+    llm_report_parser = subparsers.add_parser(
+        "llm-report", help="按运行、层级和模型汇总LLM调用的延迟、token用量和费用"
+    )
+    llm_report_parser.add_argument(
+        "--since",
+        type=str,
+        default="30d",
+        help="统计时间范围 (例如: 7d, 30d)",
+    )
+    llm_report_parser.add_argument(
+        "--run",
+        type=str,
+        default=None,
+        help="只统计指定运行ID",
+    )
+    llm_report_parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=".",
+        help="配置文件目录路径",
+    )
+
+    # reclassify 命令
+    reclassify_parser = subparsers.add_parser(
+        "reclassify", help="topics.yaml 变化后增量重新分类历史数据"
+    )
+    reclassify_parser.add_argument(
+        "--since",
+        type=str,
+        default=None,
+        help="只处理该时间范围内的数据 (例如: 30d)，默认全部历史",
+    )
+    reclassify_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="忽略主题定义快照，重新分类全部数据",
+    )
+    reclassify_parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=".",
+        help="配置文件目录路径",
+    )
+    reclassify_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Dry-run模式，只统计不写入数据库",
+    )
+    reclassify_parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="详细日志输出",
+    )
+
     args = parser.parse_args()
 
     # 设置日志级别
@@ -402,6 +689,12 @@ def main():
         run_daily(args)
     elif args.command == "weekly":
         run_weekly(args)
+    elif args.command == "summarize":
+        run_summarize(args)
+    elif args.command == "llm-report":
+        run_llm_report(args)
+    elif args.command == "reclassify":
+        run_reclassify(args)
     else:
         parser.print_help()
         sys.exit(1)
@@ -360,7 +360,7 @@ def _short_summary(item: Item, max_len: int) -> str:
 
 
 def _headline_phrase(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''}".lower()
+    text = item.text.headline_lower
     if any(word in text for word in ["safety", "security", "policy", "guardrail", "teen"]):
         return "AI 安全与治理"
     if any(word in text for word in ["commerce", "shopping", "comparison", "discovery"]):
@@ -377,7 +377,7 @@ def _headline_phrase(item: Item) -> str:
 def _watch_point(item: Item) -> str:
     if item.action:
         return item.action
-    text = f"{item.title} {item.ai_summary or item.summary or ''}".lower()
+    text = item.text.headline_lower
     if any(word in text for word in ["safety", "teen", "security", "policy"]):
         return "需要评估是否影响现有安全审核和接入基线"
     if any(word in text for word in ["commerce", "shopping", "comparison", "discovery"]):
@@ -392,7 +392,7 @@ def _watch_point(item: Item) -> str:
 
 
 def _integration_note(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
     conclusion = _watch_point(item)
 
     if "system card" in text:
@@ -415,7 +415,7 @@ def _integration_note(item: Item) -> str:
 
 
 def _demo_hint(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
 
     if "gpt-" in text or "claude" in text or "gemini" in text or "llama" in text:
         return "拿同一个 Bug 描述，分别让新旧模型生成修复方案和测试用例，直接比结果。"
@@ -440,7 +440,7 @@ def _code_demo_line(item: Item) -> str:
 
 
 def _code_demo(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
 
     if "gpt-" in text or "claude" in text or "gemini" in text or "llama" in text:
         return "client=OpenAI(api_key=os.getenv('OPENAI_API_KEY'), base_url=os.getenv('OPENAI_BASE_URL')); resp=client.chat.completions.create(model=os.getenv('OPENAI_MODEL','gpt-5.4'), messages=[{'role':'user','content':'修复登录Bug并补3条测试用例'}])"
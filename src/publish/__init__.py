@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..ingest.models import Item
 from ..utils.logger import get_logger
@@ -13,6 +13,60 @@ from ..utils.logger import get_logger
 logger = get_logger("publish")
 
 
+def select_publishable(
+    items: List[Item],
+    config: Dict[str, Any],
+    limit: Optional[int] = None,
+    margin: Optional[int] = None,
+) -> List[Item]:
+    """按输出配置预先选出报告会展示的条目（已按分数降序），外加 margin 条候补。
+
+    与报告生成使用同样的规则：先按 --limit 截断，再取 score >= min_score 的前 max_items 条。
+    候补为截断线之后紧接着的条目，margin 默认读取配置 summary_margin。
+    必看条目（is_must_read）不论分数和位置都会选中，通知会把它们排在最前面。
+    """
+    min_score = config.get("min_score", 60)
+    max_items = config.get("max_items", 20)
+    if margin is None:
+        margin = config.get("summary_margin", 5)
+
+    candidates = items[:limit] if limit else items
+    published = [item for item in candidates if item.score >= min_score][:max_items]
+    selected_ids = {id(item) for item in published}
+    spare = [item for item in candidates if id(item) not in selected_ids][: max(margin, 0)]
+    selected_ids.update(id(item) for item in spare)
+    must_read = [item for item in candidates if item.is_must_read and id(item) not in selected_ids]
+    selected_ids.update(id(item) for item in must_read)
+
+    # 保持原有的分数顺序
+    selected = [item for item in candidates if id(item) in selected_ids]
+    logger.info(
+        "可发布条目: %s 条，候补 %s 条，额外必看 %s 条，共 %s 条",
+        len(published),
+        len(spare),
+        len(must_read),
+        len(items),
+    )
+    return selected
+
+
+def select_missing_summaries(
+    items: List[Item], config: Dict[str, Any], queued_urls: Iterable[str] = ()
+) -> List[Item]:
+    """选出报告会展示但缺少摘要、需要补齐的条目（周报回填用，不含候补，含必看条目）。
+
+    仍在批处理作业中的条目（queued_urls）等作业结果，不重复走实时接口。
+    """
+    queued = set(queued_urls)
+    unsummarized = [
+        item for item in select_publishable(items, config, margin=0) if not item.ai_summary
+    ]
+    missing = [item for item in unsummarized if item.url not in queued]
+    if len(missing) < len(unsummarized):
+        logger.info("%s 条在未结束的批处理作业中，等待作业结果", len(unsummarized) - len(missing))
+    return missing
+
+
 def generate_daily_report(
     items: List[Item], output_dir: str, date: datetime, config: Dict[str, Any]
 ) -> str:
@@ -166,6 +220,12 @@ def _format_focus_item(item: Item, idx: int, markdown_config: Dict[str, Any]) ->
     elif item.action and markdown_config.get("include_action", True):
         lines.append(f"- 关键点：{item.action}")
 
+    related_links = item.raw_data.get("related_links", [])
+    if related_links and markdown_config.get("include_related_links", False):
+        lines.append("- 相关报道：")
+        for link in related_links[:5]:
+            lines.append(f"  - [{link['title']}]({link['url']}) - {link['source']}")
+
     lines.append("")
     return lines
 
@@ -191,7 +251,7 @@ def _primary_topic(item: Item) -> str:
 
 
 def _headline_phrase(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''}".lower()
+    text = item.text.headline_lower
     if any(word in text for word in ["safety", "security", "policy", "guardrail", "teen"]):
         return "AI 安全与治理"
     if any(word in text for word in ["commerce", "shopping", "comparison", "discovery"]):
@@ -204,7 +264,7 @@ def _headline_phrase(item: Item) -> str:
 
 
 def _why_it_matters(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''}".lower()
+    text = item.text.headline_lower
     if any(word in text for word in ["safety", "teen", "security", "governance", "policy"]):
         return "这类变化可能会逐步变成合规、审核或产品安全的默认基线。"
     if any(word in text for word in ["commerce", "shopping", "comparison", "product discovery"]):
@@ -219,7 +279,7 @@ def _why_it_matters(item: Item) -> str:
 def _watch_point(item: Item) -> str:
     if item.action:
         return item.action
-    text = f"{item.title} {item.ai_summary or item.summary or ''}".lower()
+    text = item.text.headline_lower
     if any(word in text for word in ["safety", "teen", "security", "policy"]):
         return "需要评估是否影响现有安全审核、策略配置和接入门槛。"
     if any(word in text for word in ["commerce", "shopping", "comparison", "discovery"]):
@@ -234,7 +294,7 @@ def _watch_point(item: Item) -> str:
 
 
 def _integration_note(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
     conclusion = _watch_point(item)
 
     if "system card" in text:
@@ -257,7 +317,7 @@ def _integration_note(item: Item) -> str:
 
 
 def _demo_hint(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
 
     if "gpt-" in text or "claude" in text or "gemini" in text or "llama" in text:
         return "拿同一个 Bug 描述，分别让新旧模型生成修复方案和测试用例，直接比结果。"
@@ -275,7 +335,7 @@ def _demo_hint(item: Item) -> str:
 
 
 def _code_demo(item: Item) -> str:
-    text = f"{item.title} {item.ai_summary or item.summary or ''} {' '.join(item.key_points)}".lower()
+    text = item.text.brief_lower
 
     if "gpt-" in text or "claude" in text or "gemini" in text or "llama" in text:
         return "client=OpenAI(api_key=os.getenv('OPENAI_API_KEY'), base_url=os.getenv('OPENAI_BASE_URL')); resp=client.chat.completions.create(model=os.getenv('OPENAI_MODEL','gpt-5.4'), messages=[{'role':'user','content':'修复登录Bug并补3条测试用例'}])"
@@ -432,7 +492,7 @@ def _generate_watchlist(items: List[Item], count: int) -> List[str]:
     keywords = ["upcoming", "soon", "next", "beta", "rc", "preview", "roadmap"]
 
     for item in items:
-        text = (item.title + " " + (item.summary or "")).lower()
+        text = item.text.title_summary_lower
         if any(keyword in text for keyword in keywords):
             watchlist.append(f"{item.source}: {item.title}")
 
@@ -448,4 +508,9 @@ def _generate_watchlist(items: List[Item], count: int) -> List[str]:
     return watchlist[:count]
 
 
-__all__ = ["generate_daily_report", "generate_weekly_report"]
+__all__ = [
+    "generate_daily_report",
+    "generate_weekly_report",
+    "select_missing_summaries",
+    "select_publishable",
+]
@@ -3,14 +3,72 @@
 import math
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only when dependency is missing
+    np = None
 
 from ..ingest.models import Item
+from ..utils.keyword_matrix import MATRIX_MIN_ITEMS, KeywordMatrix, use_matrix
+from ..utils.keywords import KeywordMatcher
 from ..utils.logger import get_logger
+from .rules import RuleSet
 
 logger = get_logger("score")
 
 
+# 研究/工程关键词各档的加分
+RESEARCH_TIERS = [("high_value", 5), ("medium_value", 3), ("low_value", 1)]
+ENGINEERING_TIERS = [("critical", 7), ("high_value", 5), ("medium_value", 3)]
+
+# 各维度上限
+RESEARCH_CAP = 25
+ENGINEERING_CAP = 35
+PREFERENCE_CAP = 10
+
+# 评分理由的信号关键词: (理由, 关键词列表)，按顺序取第一个命中的
+ENGINEERING_REASONS = [
+    ("工程信号: 破坏性变更", ["breaking", "deprecat"]),
+    ("工程信号: 新版本发布", ["release", "launch", "available"]),
+    ("工程信号: 性能优化", ["performance", "faster", "speedup"]),
+]
+RESEARCH_REASONS = [
+    ("研究信号: 突破性成果", ["sota", "state-of-the-art", "breakthrough"]),
+    ("研究信号: 评测结果", ["benchmark", "evaluation"]),
+]
+
+
+class _CompiledKeywords:
+    """编译后的评分关键词表
+
+    研究/工程各档关键词、优先公司、优先工具合并为一个匹配器，一次扫描得到命中集合。
+    命中集合中总是包含空字符串，对应配置中的空关键词（与 ``"" in text`` 一致，总是命中）。
+    """
+
+    def __init__(
+        self,
+        research_weights: Dict[str, float],
+        engineering_weights: Dict[str, float],
+        vendors: List[str],
+        tools: List[str],
+    ):
+        self.vendors = {str(vendor).lower() for vendor in vendors}
+        self.tools = {str(tool).lower() for tool in tools}
+        self.matcher = KeywordMatcher(
+            list(research_weights)
+            + list(engineering_weights)
+            + list(self.vendors)
+            + list(self.tools)
+        )
+
+    def find(self, text_lower: str) -> Set[str]:
+        hits = self.matcher.find(text_lower)
+        hits.add("")
+        return hits
+
+
 class Scorer:
     """评分器"""
 
@@ -30,44 +88,91 @@ class Scorer:
         self.engineering_keywords = config.get("engineering_keywords", {})
         self.freshness_config = config.get("freshness", {})
 
-    def score_item(self, item: Item, preferences: Dict[str, Any]) -> float:
+        # 关键词（小写） -> 加分；同一关键词出现在多档或多次时累加，与逐个累加一致
+        self.research_weights = _keyword_weights(self.research_keywords, RESEARCH_TIERS)
+        self.engineering_weights = _keyword_weights(self.engineering_keywords, ENGINEERING_TIERS)
+
+        # 主题名 -> boost（只保留不为1.0的）
+        self.topic_boosts = {
+            name: topic.get("boost", 1.0)
+            for name, topic in self.topics.items()
+            if topic.get("boost", 1.0) != 1.0
+        }
+
+        self._compiled: Optional[_CompiledKeywords] = None
+        self._compiled_key: Optional[Tuple] = None
+
+    def _keywords_for(self, preferences: Dict[str, Any]) -> _CompiledKeywords:
+        """获取（必要时编译）包含当前偏好的关键词表"""
+        vendors = preferences.get("priority_vendors", [])
+        tools = preferences.get("priority_tools", [])
+        key = (tuple(vendors), tuple(tools))
+        if self._compiled is None or self._compiled_key != key:
+            self._compiled = _CompiledKeywords(
+                self.research_weights, self.engineering_weights, vendors, tools
+            )
+            self._compiled_key = key
+        return self._compiled
+
+    def keyword_hits(self, item: Item, preferences: Optional[Dict[str, Any]] = None) -> Set[str]:
+        """单遍扫描得到Item命中的全部评分关键词
+
+        Args:
+            item: Item
+            preferences: 个人偏好配置
+
+        Returns:
+            命中的关键词集合（小写，含表示空关键词的空字符串）
+        """
+        if preferences is None and self._compiled is not None:
+            # 研究/工程关键词包含在任一已编译的关键词表中，复用即可
+            return self._compiled.find(item.text.searchable_lower)
+        return self._keywords_for(preferences or {}).find(item.text.searchable_lower)
+
+    def score_item(
+        self,
+        item: Item,
+        preferences: Dict[str, Any],
+        keyword_scores: Optional[Tuple[float, float, float]] = None,
+        now: Optional[datetime] = None,
+    ) -> float:
         """为Item评分
 
+        评分理由不在这里生成，发布前对需要输出的条目调用 attach_reasons。
+
         Args:
             item: 待评分的Item
             preferences: 个人偏好配置
+            keyword_scores: 批量矩阵路径预先算出的 (研究信号, 工程信号, 偏好关键词) 得分，
+                为空时逐条计算
+            now: 计算新鲜度的参考时间，默认当前时间
 
         Returns:
             评分 (0-100)
         """
-        # 计算各维度得分
-        research_score = self._score_research_signal(item)
-        engineering_score = self._score_engineering_signal(item)
+        # 计算各维度得分：关键词相关维度共用一次扫描的命中集合
+        if keyword_scores is None:
+            hits = self.keyword_hits(item, preferences)
+            research_score = self._score_research_signal(item, hits)
+            engineering_score = self._score_engineering_signal(item, hits)
+            preference_keyword_score = self._score_preference_keywords(hits)
+        else:
+            research_score, engineering_score, preference_keyword_score = keyword_scores
         authority_score = self._score_authority(item)
-        freshness_score = self._score_freshness(item)
-        preference_score = self._score_preference(item, preferences)
+        freshness_score = self._score_freshness(item, now)
+        preference_score = self._score_preference(item, preferences, preference_keyword_score)
 
-        # 加权求和
-        total_score = (
+        # 与时间无关的部分（研究、工程、权威、偏好）单独保存，之后可只重算新鲜度
+        base_score = (
             research_score * self.weights.get("research_signal", 0.25)
             + engineering_score * self.weights.get("engineering_signal", 0.35)
             + authority_score * self.weights.get("authority", 0.20)
-            + freshness_score * self.weights.get("freshness", 0.10)
             + preference_score * self.weights.get("preference", 0.10)
         ) * 100
+        boost = self._topic_boost(item)
+        total_score = self._combine(base_score, freshness_score, boost)
 
-        # 主题boost加权
-        for tag in item.tags:
-            topic = self.topics.get(tag)
-            if topic:
-                boost = topic.get("boost", 1.0)
-                if boost != 1.0:
-                    total_score *= boost
-
-        # 限制在0-100范围内
-        total_score = max(0, min(100, total_score))
-
-        # 记录评分详解
+        # 记录评分详解（base_score、boost 不取整，供 rescore_freshness 精确重算）
         item.score = total_score
         item.score_breakdown = {
             "total": round(total_score, 1),
@@ -76,82 +181,71 @@ class Scorer:
             "authority": round(authority_score, 1),
             "freshness": round(freshness_score, 1),
             "preference": round(preference_score, 1),
-            "reasons": self._generate_reasons(
-                item, research_score, engineering_score, authority_score, preference_score
-            ),
+            "base_score": base_score,
+            "boost": boost,
         }
 
         return total_score
 
-    def _score_research_signal(self, item: Item) -> float:
+    def _topic_boost(self, item: Item) -> float:
+        """按标签顺序累乘主题boost
+
+        Args:
+            item: Item
+
+        Returns:
+            boost乘积（无boost时为1.0）
+        """
+        boost = 1.0
+        for tag in item.tags:
+            topic_boost = self.topic_boosts.get(tag)
+            if topic_boost is not None:
+                boost *= topic_boost
+        return boost
+
+    def _combine(self, base_score, freshness_score, boost):
+        """合成总分: (时间无关部分 + 加权新鲜度) × 主题boost，限制在0-100
+
+        逐条路径传入float，向量化路径传入数组，运算顺序相同保证结果一致。
+        """
+        total = (base_score + freshness_score * self.weights.get("freshness", 0.10) * 100) * boost
+        if np is not None and isinstance(total, np.ndarray):
+            return np.clip(total, 0, 100)
+        return max(0, min(100, total))
+
+    def _score_research_signal(self, item: Item, hits: Optional[Set[str]] = None) -> float:
         """计算研究信号评分
 
         Args:
             item: Item
+            hits: 已算出的关键词命中集合，为空时重新扫描
 
         Returns:
             评分 (0-25)
         """
+        if hits is None:
+            hits = self.keyword_hits(item)
         score = 0.0
-        text = self._get_searchable_text(item).lower()
-
-        # 高价值关键词 (+5分)
-        for keyword in self.research_keywords.get("high_value", []):
-            if keyword.lower() in text:
-                score += 5
-                if score >= 25:
-                    return 25
-
-        # 中等价值关键词 (+3分)
-        for keyword in self.research_keywords.get("medium_value", []):
-            if keyword.lower() in text:
-                score += 3
-                if score >= 25:
-                    return 25
-
-        # 低价值关键词 (+1分)
-        for keyword in self.research_keywords.get("low_value", []):
-            if keyword.lower() in text:
-                score += 1
-                if score >= 25:
-                    return 25
-
-        return min(score, 25)
-
-    def _score_engineering_signal(self, item: Item) -> float:
+        for keyword in hits:
+            score += self.research_weights.get(keyword, 0)
+        return min(score, RESEARCH_CAP)
+
+    def _score_engineering_signal(self, item: Item, hits: Optional[Set[str]] = None) -> float:
         """计算工程信号评分
 
         Args:
             item: Item
+            hits: 已算出的关键词命中集合，为空时重新扫描
 
         Returns:
             评分 (0-35)
         """
+        if hits is None:
+            hits = self.keyword_hits(item)
         score = 0.0
-        text = self._get_searchable_text(item).lower()
-
-        # 关键信号 (+7分)
-        for keyword in self.engineering_keywords.get("critical", []):
-            if keyword.lower() in text:
-                score += 7
-                if score >= 35:
-                    return 35
-
-        # 高价值信号 (+5分)
-        for keyword in self.engineering_keywords.get("high_value", []):
-            if keyword.lower() in text:
-                score += 5
-                if score >= 35:
-                    return 35
-
-        # 中等价值信号 (+3分)
-        for keyword in self.engineering_keywords.get("medium_value", []):
-            if keyword.lower() in text:
-                score += 3
-                if score >= 35:
-                    return 35
-
-        return min(score, 35)
+        for keyword in hits:
+            score += self.engineering_weights.get(keyword, 0)
+        return min(score, ENGINEERING_CAP)
 
     def _score_authority(self, item: Item) -> float:
         """计算来源权威度评分
@@ -166,11 +260,12 @@ class Scorer:
         # 映射50-100到0-20
         return (authority - 50) * 0.4
 
-    def _score_freshness(self, item: Item) -> float:
+    def _score_freshness(self, item: Item, now: Optional[datetime] = None) -> float:
         """计算新鲜度评分
 
         Args:
             item: Item
+            now: 参考时间，默认当前时间
 
         Returns:
             评分 (0-10)
@@ -178,7 +273,7 @@ class Scorer:
         max_score = self.freshness_config.get("max_score", 10)
         decay_hours = self.freshness_config.get("decay_hours", 48)
 
-        now = datetime.now()
+        now = now or datetime.now()
 
         # 处理时区问题：如果published有时区信息，移除时区使其变为naive datetime
         published = item.published
@@ -192,30 +287,43 @@ class Scorer:
 
         return max(0, min(max_score, score))
 
-    def _score_preference(self, item: Item, preferences: Dict[str, Any]) -> float:
+    def _score_preference_keywords(self, hits: Set[str]) -> float:
+        """根据关键词命中集合计算优先公司/工具得分
+
+        Args:
+            hits: 关键词命中集合
+
+        Returns:
+            优先公司 (+3分) 与优先工具 (+2分) 之和
+        """
+        compiled = self._compiled
+        score = 0.0
+        if not compiled.vendors.isdisjoint(hits):
+            score += 3
+        if not compiled.tools.isdisjoint(hits):
+            score += 2
+        return score
+
+    def _score_preference(
+        self,
+        item: Item,
+        preferences: Dict[str, Any],
+        keyword_score: Optional[float] = None,
+    ) -> float:
         """计算个人偏好评分
 
         Args:
             item: Item
             preferences: 个人偏好配置
+            keyword_score: 预先算出的优先公司/工具得分，为空时扫描计算
 
         Returns:
             评分 (0-10)
         """
-        score = 0.0
-        text = self._get_searchable_text(item).lower()
-
-        # 优先公司 (+3分)
-        for vendor in preferences.get("priority_vendors", []):
-            if vendor.lower() in text:
-                score += 3
-                break
-
-        # 优先工具 (+2分)
-        for tool in preferences.get("priority_tools", []):
-            if tool.lower() in text:
-                score += 2
-                break
+        if keyword_score is not None:
+            score = keyword_score
+        else:
+            score = self._score_preference_keywords(self.keyword_hits(item, preferences))
 
         # 优先主题 (+2分)
         priority_topics = preferences.get("priority_topics", [])
@@ -231,92 +339,343 @@ class Scorer:
                 score -= 2
                 break
 
-        return max(0, min(10, score))
+        return max(0, min(PREFERENCE_CAP, score))
+
+    def batch_keyword_scores(
+        self, items: List[Item], preferences: Dict[str, Any]
+    ) -> List[Tuple[float, float, float]]:
+        """用稀疏命中矩阵批量计算关键词相关得分（需要 numpy/scipy）
 
-    def _get_searchable_text(self, item: Item) -> str:
-        """获取可搜索文本
+        研究/工程信号为命中关键词的加分之和再截断到上限，与逐条计算一致；
+        优先公司/工具只要命中任一关键词即加分。
 
         Args:
-            item: Item
+            items: Item列表
+            preferences: 个人偏好配置
 
         Returns:
-            合并后的文本
+            每个条目的 (研究信号, 工程信号, 偏好关键词) 得分
         """
-        return " ".join(
-            filter(
-                None,
-                [
-                    item.title,
-                    item.summary or "",
-                    item.content or "",
-                ],
+        compiled = self._keywords_for(preferences)
+        matrix = KeywordMatrix(compiled.matcher.keywords)
+        hits = matrix.hits([item.text.searchable_lower for item in items])
+
+        # 空关键词总是命中，作为常数项
+        research_scores = (
+            hits @ matrix.weights(self.research_weights.items()) + self.research_weights.get("", 0)
+        ).clip(max=RESEARCH_CAP)
+        engineering_scores = (
+            hits @ matrix.weights(self.engineering_weights.items())
+            + self.engineering_weights.get("", 0)
+        ).clip(max=ENGINEERING_CAP)
+        vendor_hits = (hits @ matrix.indicator(compiled.vendors) > 0) | ("" in compiled.vendors)
+        tool_hits = (hits @ matrix.indicator(compiled.tools) > 0) | ("" in compiled.tools)
+        preference_scores = 3.0 * vendor_hits + 2.0 * tool_hits
+
+        return [
+            (float(research), float(engineering), float(preference))
+            for research, engineering, preference in zip(
+                research_scores, engineering_scores, preference_scores
             )
+        ]
+
+    def score_items(
+        self, items: List[Item], preferences: Dict[str, Any], now: Optional[datetime] = None
+    ) -> Optional["np.ndarray"]:
+        """批量评分（不排序）
+
+        所有条目使用同一个参考时间。条目数达到 MATRIX_MIN_ITEMS 且安装了 NumPy 时，
+        各维度得分、主题boost、加权求和与截断都按数组计算，结果与逐条评分完全一致。
+
+        Args:
+            items: Item列表
+            preferences: 个人偏好配置
+            now: 计算新鲜度的参考时间，默认当前时间
+
+        Returns:
+            向量化路径返回总分数组（与items顺序一致），逐条路径返回None
+        """
+        now = now or datetime.now()
+        if np is None or len(items) < MATRIX_MIN_ITEMS:
+            for item in items:
+                self.score_item(item, preferences, now=now)
+            return None
+        return self._score_vectorized(items, preferences, now)
+
+    def _score_vectorized(
+        self, items: List[Item], preferences: Dict[str, Any], now: datetime
+    ) -> "np.ndarray":
+        """向量化批量评分
+
+        Args:
+            items: Item列表
+            preferences: 个人偏好配置
+            now: 参考时间
+
+        Returns:
+            总分数组
+        """
+        # 关键词相关维度：有SciPy时走稀疏矩阵，否则逐条单遍扫描
+        if use_matrix(len(items)):
+            keyword_scores = self.batch_keyword_scores(items, preferences)
+        else:
+            keyword_scores = []
+            for item in items:
+                hits = self.keyword_hits(item, preferences)
+                keyword_scores.append(
+                    (
+                        self._score_research_signal(item, hits),
+                        self._score_engineering_signal(item, hits),
+                        self._score_preference_keywords(hits),
+                    )
+                )
+        research, engineering, preference_keywords = (
+            np.array(column, dtype=np.float64) for column in zip(*keyword_scores)
         )
 
-    def _generate_reasons(
+        authority = (
+            np.array([item.raw_data.get("authority_score", 50) for item in items], dtype=np.float64)
+            - 50
+        ) * 0.4
+        freshness = self._freshness_array(items, now)
+
+        # 偏好：关键词得分 + 优先主题(+2) - 低优先级主题(-2)，再截断
+        priority_topics = set(preferences.get("priority_topics", []))
+        low_priority_topics = set(preferences.get("low_priority_topics", []))
+        priority = np.fromiter(
+            (not priority_topics.isdisjoint(item.tags) for item in items),
+            dtype=bool,
+            count=len(items),
+        )
+        low_priority = np.fromiter(
+            (not low_priority_topics.isdisjoint(item.tags) for item in items),
+            dtype=bool,
+            count=len(items),
+        )
+        preference = np.clip(
+            preference_keywords + 2.0 * priority - 2.0 * low_priority, 0, PREFERENCE_CAP
+        )
+
+        # 与逐条路径相同的运算顺序
+        base = (
+            research * self.weights.get("research_signal", 0.25)
+            + engineering * self.weights.get("engineering_signal", 0.35)
+            + authority * self.weights.get("authority", 0.20)
+            + preference * self.weights.get("preference", 0.10)
+        ) * 100
+        boost = np.fromiter(
+            (self._topic_boost(item) for item in items), dtype=np.float64, count=len(items)
+        )
+        total = self._combine(base, freshness, boost)
+
+        # 记录评分详解
+        dimensions = {
+            "research_signal": research.tolist(),
+            "engineering_signal": engineering.tolist(),
+            "authority": authority.tolist(),
+            "freshness": freshness.tolist(),
+            "preference": preference.tolist(),
+        }
+        for index, (item, total_score, base_score, item_boost) in enumerate(
+            zip(items, total.tolist(), base.tolist(), boost.tolist())
+        ):
+            item.score = total_score
+            item.score_breakdown = {"total": round(total_score, 1)}
+            for name, values in dimensions.items():
+                item.score_breakdown[name] = round(values[index], 1)
+            item.score_breakdown["base_score"] = base_score
+            item.score_breakdown["boost"] = item_boost
+
+        return total
+
+    def _freshness_array(self, items: List[Item], now: datetime) -> "np.ndarray":
+        """批量计算新鲜度评分
+
+        年龄按数组计算；指数仍逐个调用 math.exp（np.exp 与 math.exp 的结果可能相差1ulp），
+        保证与逐条路径完全一致。
+
+        Args:
+            items: Item列表
+            now: 参考时间
+
+        Returns:
+            新鲜度评分数组 (0-max_score)
+        """
+        max_score = self.freshness_config.get("max_score", 10)
+        decay_hours = self.freshness_config.get("decay_hours", 48)
+
+        published = np.array(
+            [
+                item.published.replace(tzinfo=None) if item.published.tzinfo else item.published
+                for item in items
+            ],
+            dtype="datetime64[us]",
+        )
+        age_hours = (np.datetime64(now, "us") - published) / np.timedelta64(1, "s") / 3600
+
+        exponents = (-age_hours / decay_hours).tolist()
+        score = max_score * np.fromiter(
+            map(math.exp, exponents), dtype=np.float64, count=len(items)
+        )
+
+        return np.clip(score, 0, max_score)
+
+    def rescore_freshness(
         self,
-        item: Item,
-        research_score: float,
-        engineering_score: float,
-        authority_score: float,
-        preference_score: float,
-    ) -> List[str]:
-        """生成评分理由
+        items: List[Item],
+        now: Optional[datetime] = None,
+        preferences: Optional[Dict[str, Any]] = None,
+    ) -> List[Item]:
+        """按新的参考时间只重算新鲜度和总分，不重新匹配关键词
+
+        依赖评分详解中保存的 base_score 和 boost，结果与在 now 时刻完整评分一致。
+        缺少这两项的旧数据在提供 preferences 时完整重新评分，否则保持原分数。
 
         Args:
-            item: Item
-            research_score: 研究信号评分
-            engineering_score: 工程信号评分
-            authority_score: 权威度评分
-            preference_score: 偏好评分
+            items: 已评分的Item列表
+            now: 参考时间，默认当前时间
+            preferences: 个人偏好配置（仅用于旧数据的完整评分）
 
         Returns:
-            理由列表
+            Item列表（原地修改，并按分数降序稳定排序）
         """
-        reasons = []
-
-        # 权威度
-        if authority_score >= 15:
-            reasons.append(f"来自高权威源: {item.source}")
-        elif authority_score >= 10:
-            reasons.append(f"来自中等权威源: {item.source}")
-
-        # 工程信号
-        if engineering_score >= 20:
-            text_lower = self._get_searchable_text(item).lower()
-            if any(kw in text_lower for kw in ["breaking", "deprecat"]):
-                reasons.append("工程信号: 破坏性变更")
-            elif any(kw in text_lower for kw in ["release", "launch", "available"]):
-                reasons.append("工程信号: 新版本发布")
-            elif any(kw in text_lower for kw in ["performance", "faster", "speedup"]):
-                reasons.append("工程信号: 性能优化")
+        now = now or datetime.now()
+        rescorable = []
+        legacy = []
+        for item in items:
+            breakdown = item.score_breakdown or {}
+            if "base_score" in breakdown and "boost" in breakdown:
+                rescorable.append(item)
+            else:
+                legacy.append(item)
+
+        if legacy:
+            if preferences is not None:
+                self.score_items(legacy, preferences, now=now)
             else:
-                reasons.append("工程信号: 重要更新")
-
-        # 研究信号
-        if research_score >= 15:
-            text_lower = self._get_searchable_text(item).lower()
-            if any(kw in text_lower for kw in ["sota", "state-of-the-art", "breakthrough"]):
-                reasons.append("研究信号: 突破性成果")
-            elif any(kw in text_lower for kw in ["benchmark", "evaluation"]):
-                reasons.append("研究信号: 评测结果")
+                logger.debug(f"{len(legacy)} 条数据缺少 base_score，保持原分数")
+
+        if rescorable:
+            base_scores = [item.score_breakdown["base_score"] for item in rescorable]
+            boosts = [item.score_breakdown["boost"] for item in rescorable]
+            if np is not None and len(rescorable) >= MATRIX_MIN_ITEMS:
+                freshness = self._freshness_array(rescorable, now)
+                totals = self._combine(
+                    np.array(base_scores, dtype=np.float64),
+                    freshness,
+                    np.array(boosts, dtype=np.float64),
+                ).tolist()
+                freshness = freshness.tolist()
             else:
-                reasons.append("研究信号: 新研究")
+                freshness = [self._score_freshness(item, now) for item in rescorable]
+                totals = [
+                    self._combine(base_score, freshness_score, boost)
+                    for base_score, freshness_score, boost in zip(base_scores, freshness, boosts)
+                ]
+            for item, total_score, freshness_score in zip(rescorable, totals, freshness):
+                item.score = total_score
+                item.score_breakdown["total"] = round(total_score, 1)
+                item.score_breakdown["freshness"] = round(freshness_score, 1)
+
+        items.sort(key=lambda x: x.score, reverse=True)
+        logger.info(
+            f"已按当前时间重算新鲜度: {len(rescorable)} 条，无 base_score 的旧数据 {len(legacy)} 条"
+        )
+        return items
+
+
+def _keyword_weights(
+    keywords: Dict[str, List[str]], tiers: List[Tuple[str, float]]
+) -> Dict[str, float]:
+    """把分档关键词配置展开为 关键词（小写） -> 加分
+
+    Args:
+        keywords: 档位 -> 关键词列表
+        tiers: (档位, 每个关键词的加分) 列表
 
-        # 主题
-        if item.tags:
-            top_tags = ", ".join(item.tags[:3])
-            reasons.append(f"命中关注主题: {top_tags}")
+    Returns:
+        关键词 -> 累计加分
+    """
+    weights: Dict[str, float] = {}
+    for tier, weight in tiers:
+        for keyword in keywords.get(tier, []):
+            keyword = str(keyword).lower()
+            weights[keyword] = weights.get(keyword, 0) + weight
+    return weights
 
-        # 偏好
-        if preference_score >= 5:
-            reasons.append("符合个人偏好")
 
-        return reasons
+def generate_reasons(item: Item) -> List[str]:
+    """根据评分详解生成评分理由
+
+    只在条目需要输出时调用；关键词判断复用Item文本视图中缓存的小写文本。
+
+    Args:
+        item: 已评分的Item
+
+    Returns:
+        理由列表
+    """
+    breakdown = item.score_breakdown
+    reasons = []
+
+    # 权威度
+    authority_score = breakdown.get("authority", 0)
+    if authority_score >= 15:
+        reasons.append(f"来自高权威源: {item.source}")
+    elif authority_score >= 10:
+        reasons.append(f"来自中等权威源: {item.source}")
+
+    text_lower = item.text.searchable_lower
+
+    # 工程信号
+    if breakdown.get("engineering_signal", 0) >= 20:
+        reasons.append(_first_reason(text_lower, ENGINEERING_REASONS, "工程信号: 重要更新"))
+
+    # 研究信号
+    if breakdown.get("research_signal", 0) >= 15:
+        reasons.append(_first_reason(text_lower, RESEARCH_REASONS, "研究信号: 新研究"))
+
+    # 主题
+    if item.tags:
+        top_tags = ", ".join(item.tags[:3])
+        reasons.append(f"命中关注主题: {top_tags}")
+
+    # 偏好
+    if breakdown.get("preference", 0) >= 5:
+        reasons.append("符合个人偏好")
+
+    return reasons
+
+
+def _first_reason(text_lower: str, signals: List[Tuple[str, List[str]]], default: str) -> str:
+    """按顺序返回第一个命中关键词的理由"""
+    for reason, keywords in signals:
+        if any(keyword in text_lower for keyword in keywords):
+            return reason
+    return default
+
+
+def attach_reasons(items: List[Item]) -> List[Item]:
+    """为需要输出的条目补充评分理由（已有理由的条目保持不变）
+
+    Args:
+        items: 已评分的Item列表
+
+    Returns:
+        Item列表（原地修改）
+    """
+    for item in items:
+        if item.score_breakdown and "reasons" not in item.score_breakdown:
+            item.score_breakdown["reasons"] = generate_reasons(item)
+    return items
 
 
 def score_batch(
-    items: List[Item], config: Dict[str, Any], topics: List[Dict[str, Any]], preferences: Dict[str, Any]
+    items: List[Item],
+    config: Dict[str, Any],
+    topics: List[Dict[str, Any]],
+    preferences: Dict[str, Any],
+    now: Optional[datetime] = None,
 ) -> List[Item]:
     """批量评分
 
@@ -325,6 +684,7 @@ def score_batch(
         config: 评分配置
         topics: 主题配置列表
         preferences: 个人偏好配置
+        now: 计算新鲜度的参考时间，默认当前时间
 
     Returns:
         评分后的Item列表（原地修改，并按分数降序排序）
@@ -333,11 +693,14 @@ def score_batch(
 
     scorer = Scorer(config, topics)
 
-    for item in items:
-        scorer.score_item(item, preferences)
+    # 大批量时按数组批量计算，所有条目使用同一个参考时间
+    totals = scorer.score_items(items, preferences, now=now)
 
-    # 按分数降序排序
-    items.sort(key=lambda x: x.score, reverse=True)
+    # 按分数降序排序（稳定排序，同分保持原顺序）
+    if totals is not None:
+        items[:] = [items[index] for index in np.argsort(-totals, kind="stable")]
+    else:
+        items.sort(key=lambda x: x.score, reverse=True)
 
     # 统计
     if items:
@@ -364,6 +727,8 @@ def mark_must_read(items: List[Item], rules: List[Dict[str, str]], topics: Dict[
     """
     logger.info(f"开始标记必读: {len(items)} 条数据，{len(rules)} 条规则")
 
+    # 规则条件只解析编译一次
+    rule_set = RuleSet(rules)
     must_read_count = 0
 
     for item in items:
@@ -382,55 +747,79 @@ def mark_must_read(items: List[Item], rules: List[Dict[str, str]], topics: Dict[
 
         # 再检查通用必读规则
         if not item.is_must_read:
-            for rule in rules:
-                condition = rule.get("condition", "")
-                reason = rule.get("reason", "")
-
-                if _eval_condition(condition, item):
-                    item.is_must_read = True
-                    logger.debug(f"必读 ({reason}): {item.title}")
-                    must_read_count += 1
-                    break
+            rule = rule_set.first_match(item)
+            if rule is not None:
+                item.is_must_read = True
+                logger.debug(f"必读 ({rule.reason}): {item.title}")
+                must_read_count += 1
 
     logger.info(f"标记完成: {must_read_count} 条必读")
 
     return items
 
 
-def _eval_condition(condition: str, item: Item) -> bool:
-    """评估必读条件
+# 过滤规则额外可用的变量
+FILTER_VARIABLES = {"age_days", "is_duplicate"}
+
+
+def filter_items(
+    items: List[Item], rules: List[Dict[str, str]], now: Optional[datetime] = None
+) -> List[Item]:
+    """按过滤规则剔除不会发布的条目
+
+    在评分之后、摘要和入库之前执行，被过滤的条目不再调用LLM，也不写入数据库。
+    条件除必读规则的变量外还可以使用 age_days（发布至今的天数）和
+    is_duplicate（去重阶段已剔除重复条目，这里只读取 raw_data 中的标记）。
 
     Args:
-        condition: 条件表达式
-        item: Item
+        items: 已评分的Item列表
+        rules: 过滤规则列表
+        now: 计算 age_days 的参考时间，默认当前时间
 
     Returns:
-        是否满足条件
+        保留的Item列表（保持原有顺序）
     """
-    try:
-        # 定义可用的函数和变量
-        context = {
-            "score": item.score,
-            "authority_score": item.raw_data.get("authority_score", 50),
-            "source": item.source,
-            "title": item.title.lower(),
-            "tags": item.tags,
-            "contains": lambda keyword: keyword.lower() in item.title.lower()
-            or keyword.lower() in (item.summary or "").lower(),
-            "source_contains": lambda keyword: keyword.lower() in item.source.lower(),
-            "contains_any": lambda keywords: any(
-                kw.lower() in item.title.lower() or kw.lower() in (item.summary or "").lower()
-                for kw in keywords
-            ),
-        }
-
-        # 安全评估
-        result = eval(condition, {"__builtins__": {}}, context)
-        return bool(result)
+    if not rules or not items:
+        return items
 
-    except Exception as e:
-        logger.warning(f"评估条件失败 '{condition}': {e}")
-        return False
+    now = now or datetime.now()
+    rule_set = RuleSet(rules, variables=FILTER_VARIABLES)
+    # 规则 id -> 剔除数量
+    dropped: Dict[int, int] = {}
+    kept = []
 
-
-__all__ = ["Scorer", "score_batch", "mark_must_read"]
+    for item in items:
+        published = item.published
+        if published.tzinfo is not None:
+            published = published.replace(tzinfo=None)
+        env = {
+            "age_days": (now - published).total_seconds() / 86400,
+            "is_duplicate": bool(item.raw_data.get("is_duplicate", False)),
+        }
+        rule = rule_set.first_match(item, env)
+        if rule is None:
+            kept.append(item)
+            continue
+        dropped[id(rule)] = dropped.get(id(rule), 0) + 1
+        logger.debug(f"过滤 ({rule.reason}): {item.title}")
+
+    for compiled in rule_set.rules:
+        count = dropped.get(id(compiled), 0)
+        if count:
+            logger.info(f"过滤规则 '{compiled.reason}' ({compiled.condition}): 剔除 {count} 条")
+    logger.info(
+        f"过滤完成: 保留 {len(kept)} 条，剔除 {len(items) - len(kept)} 条"
+        f"（省去对应的摘要调用和数据库写入）"
+    )
+
+    return kept
+
+
+__all__ = [
+    "Scorer",
+    "score_batch",
+    "filter_items",
+    "mark_must_read",
+    "generate_reasons",
+    "attach_reasons",
+]
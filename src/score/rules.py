@@ -0,0 +1,326 @@
+"""规则条件编译
+
+rules.yaml 中 must_read_rules / filter_rules 的条件是一小段 Python 表达式，例如::
+
+    score >= 88 and (contains('security') or contains('cve'))
+
+规则加载时解析一次：AST 只允许白名单内的节点、变量和函数，编译为闭包谓词，
+逐条目评估时不再解析字符串或调用 eval。同时从顶层 and 中提取前置条件
+（分数下限、标题/摘要至少命中其中一个的关键词组），前置条件不满足的规则直接跳过。
+"""
+
+import ast
+import operator
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
+
+from ..ingest.models import Item
+from ..utils.keywords import KeywordMatcher
+from ..utils.logger import get_logger
+
+logger = get_logger("score.rules")
+
+# 编译后的谓词: (条目, 附加变量) -> 值
+Predicate = Callable[[Item, Dict[str, Any]], Any]
+
+# 条件中可用的变量: 名称 -> 取值函数
+VARIABLES: Dict[str, Predicate] = {
+    "score": lambda item, env: item.score,
+    "authority_score": lambda item, env: item.raw_data.get("authority_score", 50),
+    "source": lambda item, env: item.source,
+    "title": lambda item, env: item.text.title_lower,
+    "tags": lambda item, env: item.tags,
+}
+
+_COMPARE_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+
+
+@dataclass
+class CompiledRule:
+    """编译后的规则"""
+
+    condition: str
+    reason: str
+    predicate: Predicate
+    # 分数下限（score >= N 或 score > N 是顶层 and 的一项）
+    min_score: Optional[float] = None
+    # 每组关键词至少有一个出现在标题或摘要中（小写）
+    keyword_groups: List[FrozenSet[str]] = field(default_factory=list)
+
+    def evaluate(self, item: Item, env: Optional[Dict[str, Any]] = None) -> bool:
+        """评估条件
+
+        Args:
+            item: Item
+            env: 附加变量
+
+        Returns:
+            是否满足条件（评估出错时记录警告并返回False）
+        """
+        try:
+            return bool(self.predicate(item, env or {}))
+        except Exception as e:
+            logger.warning(f"评估条件失败 '{self.condition}': {e}")
+            return False
+
+
+class RuleSet:
+    """一组按顺序匹配的规则"""
+
+    def __init__(self, rules: List[Dict[str, Any]], variables: Optional[Set[str]] = None):
+        """编译规则列表，无效规则记录警告后忽略
+
+        Args:
+            rules: 规则配置列表（condition, reason）
+            variables: 额外允许的变量名（值在评估时通过 env 传入）
+        """
+        self.rules: List[CompiledRule] = []
+        for rule in rules:
+            condition = rule.get("condition", "")
+            try:
+                self.rules.append(compile_rule(condition, rule.get("reason", ""), variables))
+            except (SyntaxError, ValueError) as e:
+                logger.warning(f"规则条件无效，已忽略 '{condition}': {e}")
+
+        # 所有规则的前置关键词合并为一个匹配器，每个条目最多扫描一次
+        keywords = {kw for rule in self.rules for group in rule.keyword_groups for kw in group}
+        self._keywords = KeywordMatcher(keywords) if keywords else None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def first_match(
+        self, item: Item, env: Optional[Dict[str, Any]] = None
+    ) -> Optional[CompiledRule]:
+        """返回第一条满足的规则
+
+        Args:
+            item: Item
+            env: 附加变量
+
+        Returns:
+            满足的规则，没有时返回None
+        """
+        hits: Optional[Set[str]] = None
+        for rule in self.rules:
+            if rule.min_score is not None and item.score < rule.min_score:
+                continue
+            if rule.keyword_groups:
+                if hits is None:
+                    hits = self._keywords.find(item.text.title_lower)
+                    hits |= self._keywords.find(item.text.summary_lower)
+                if any(hits.isdisjoint(group) for group in rule.keyword_groups):
+                    continue
+            if rule.evaluate(item, env):
+                return rule
+        return None
+
+
+def compile_rule(
+    condition: str, reason: str = "", variables: Optional[Set[str]] = None
+) -> CompiledRule:
+    """解析并编译一条规则
+
+    Args:
+        condition: 条件表达式
+        reason: 规则说明
+        variables: 额外允许的变量名（值在评估时通过 env 传入）
+
+    Returns:
+        CompiledRule
+
+    Raises:
+        SyntaxError: 表达式语法错误
+        ValueError: 使用了不允许的语法、变量或函数
+    """
+    tree = ast.parse(condition.strip(), mode="eval")
+    predicate = _compile_node(tree.body, set(variables or ()))
+
+    min_score = None
+    keyword_groups = []
+    for term in _conjuncts(tree.body):
+        bound = _score_bound(term)
+        if bound is not None:
+            min_score = bound if min_score is None else max(min_score, bound)
+            continue
+        group = _keyword_group(term)
+        if group is not None:
+            keyword_groups.append(group)
+
+    return CompiledRule(condition, reason, predicate, min_score, keyword_groups)
+
+
+def _compile_node(node: ast.AST, extra_variables: Set[str]) -> Predicate:
+    """把白名单内的 AST 节点编译为闭包"""
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value, extra_variables) for value in node.values]
+        if isinstance(node.op, ast.And):
+
+            def all_of(item, env):
+                value = None
+                for operand in operands:
+                    value = operand(item, env)
+                    if not value:
+                        return value
+                return value
+
+            return all_of
+
+        def any_of(item, env):
+            value = None
+            for operand in operands:
+                value = operand(item, env)
+                if value:
+                    return value
+            return value
+
+        return any_of
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand, extra_variables)
+        if isinstance(node.op, ast.Not):
+            return lambda item, env: not operand(item, env)
+        if isinstance(node.op, ast.USub):
+            return lambda item, env: -operand(item, env)
+        raise ValueError(f"不支持的运算符: {type(node.op).__name__}")
+
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left, extra_variables)
+        steps = []
+        for op, comparator in zip(node.ops, node.comparators):
+            if type(op) not in _COMPARE_OPERATORS:
+                raise ValueError(f"不支持的比较运算符: {type(op).__name__}")
+            steps.append((_COMPARE_OPERATORS[type(op)], _compile_node(comparator, extra_variables)))
+
+        def compare(item, env):
+            current = left(item, env)
+            for compare_op, right in steps:
+                value = right(item, env)
+                if not compare_op(current, value):
+                    return False
+                current = value
+            return True
+
+        return compare
+
+    if isinstance(node, ast.Name):
+        if node.id in VARIABLES:
+            return VARIABLES[node.id]
+        if node.id in extra_variables:
+            name = node.id
+            return lambda item, env: env[name]
+        raise ValueError(f"未知变量: {node.id}")
+
+    if isinstance(node, ast.Constant):
+        if not isinstance(node.value, (str, int, float, bool, type(None))):
+            raise ValueError(f"不支持的常量: {node.value!r}")
+        value = node.value
+        return lambda item, env: value
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        elements = [_compile_node(element, extra_variables) for element in node.elts]
+        return lambda item, env: [element(item, env) for element in elements]
+
+    if isinstance(node, ast.Call):
+        return _compile_call(node)
+
+    raise ValueError(f"不支持的语法: {type(node).__name__}")
+
+
+def _compile_call(node: ast.Call) -> Predicate:
+    """编译函数调用（参数必须是字符串常量，编译时统一转小写）"""
+    if not isinstance(node.func, ast.Name) or node.keywords or len(node.args) != 1:
+        raise ValueError("函数调用只支持 contains/source_contains/contains_any 的单个位置参数")
+    name = node.func.id
+    argument = node.args[0]
+
+    if name in ("contains", "source_contains"):
+        keyword = _string_constant(argument).lower()
+        if name == "source_contains":
+            return lambda item, env: keyword in item.text.source_lower
+        return lambda item, env: (
+            keyword in item.text.title_lower or keyword in item.text.summary_lower
+        )
+
+    if name == "contains_any":
+        if not isinstance(argument, (ast.List, ast.Tuple)):
+            raise ValueError("contains_any 的参数必须是字符串列表")
+        keywords = tuple(_string_constant(element).lower() for element in argument.elts)
+
+        def contains_any(item, env):
+            title, summary = item.text.title_lower, item.text.summary_lower
+            return any(keyword in title or keyword in summary for keyword in keywords)
+
+        return contains_any
+
+    raise ValueError(f"未知函数: {name}")
+
+
+def _string_constant(node: ast.AST) -> str:
+    """读取字符串常量参数"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    raise ValueError("函数参数必须是字符串常量")
+
+
+def _conjuncts(node: ast.AST) -> List[ast.AST]:
+    """展开顶层 and"""
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        return [term for value in node.values for term in _conjuncts(value)]
+    return [node]
+
+
+def _score_bound(node: ast.AST) -> Optional[float]:
+    """识别 score >= N / score > N，返回分数下限"""
+    if (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.ops[0], (ast.Gt, ast.GtE))
+        and isinstance(node.left, ast.Name)
+        and node.left.id == "score"
+        and isinstance(node.comparators[0], ast.Constant)
+        and isinstance(node.comparators[0].value, (int, float))
+        and not isinstance(node.comparators[0].value, bool)
+    ):
+        return node.comparators[0].value
+    return None
+
+
+def _keyword_group(node: ast.AST) -> Optional[FrozenSet[str]]:
+    """识别只由 contains/contains_any 组成的 or，返回其中的关键词（小写）"""
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.Or):
+        keywords: Set[str] = set()
+        for value in node.values:
+            group = _keyword_group(value)
+            if group is None:
+                return None
+            keywords |= group
+        return frozenset(keywords)
+
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        argument = node.args[0]
+        if node.func.id == "contains":
+            keywords = [argument.value]
+        elif node.func.id == "contains_any":
+            keywords = [element.value for element in argument.elts]
+        else:
+            return None
+        keywords = {keyword.lower() for keyword in keywords}
+        # 空关键词总是命中，无法作为前置条件
+        if "" in keywords or not keywords:
+            return None
+        return frozenset(keywords)
+
+    return None
+
+
+__all__ = ["CompiledRule", "RuleSet", "VARIABLES", "compile_rule"]
@@ -4,7 +4,7 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..ingest.models import Item
 from ..utils.logger import get_logger
@@ -15,20 +15,26 @@ logger = get_logger("storage")
 class Storage:
     """存储管理器"""
 
-    def __init__(self, db_path: str = "ai-intake.db"):
+    def __init__(self, db_path: str = "ai-intake.db", text_index: bool = True):
         """初始化存储管理器
 
         Args:
             db_path: 数据库文件路径
+            text_index: 是否维护条目文本全文索引（用于增量重新分类；
+                每条写入约增加1ms，批量导入基准数据时可关闭）
         """
         self.db_path = db_path
+        self.text_index = text_index
         self.conn: Optional[sqlite3.Connection] = None
+        self.text_fts_enabled = False
         self._init_db()
 
     def _init_db(self):
         """初始化数据库"""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row  # 返回字典形式
+        # INSERT OR REPLACE 删除旧行时也触发删除触发器，保持全文索引同步
+        self.conn.execute("PRAGMA recursive_triggers = ON")
 
         # 创建表
         self.conn.executescript(
@@ -74,18 +80,165 @@ class Storage:
                 error_log TEXT
             );
 
+            -- 事件聚类成员表
+            CREATE TABLE IF NOT EXISTS story_members (
+                url TEXT PRIMARY KEY,
+                cluster_id TEXT NOT NULL,
+                source TEXT NOT NULL,
+                title TEXT NOT NULL,
+                published DATETIME NOT NULL,
+                tokens TEXT,
+                companies TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- 分类缓存表（按分类文本内容哈希）
+            CREATE TABLE IF NOT EXISTS classify_cache (
+                content_hash TEXT PRIMARY KEY,
+                topics_fingerprint TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- 主题配置版本表（配置指纹 -> 各主题指纹）
+            CREATE TABLE IF NOT EXISTS topic_versions (
+                fingerprint TEXT PRIMARY KEY,
+                topic_fingerprints TEXT NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- LLM摘要缓存表（按 提示词内容 + 提供商 + 模型 + 提示词版本 的哈希）
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                cache_key TEXT PRIMARY KEY,
+                summary TEXT,
+                key_points TEXT,
+                action TEXT,
+                prompt_tokens INTEGER DEFAULT 0,
+                completion_tokens INTEGER DEFAULT 0,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- LLM批处理作业表（OpenAI Batch / Anthropic Message Batches）
+            CREATE TABLE IF NOT EXISTS summary_batches (
+                job_id TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                status TEXT NOT NULL,
+                request_count INTEGER DEFAULT 0,
+                submitted_at DATETIME NOT NULL,
+                finished_at DATETIME
+            );
+
+            -- 批处理作业包含的条目（条目URL -> 摘要缓存键，缓存键同时作为请求的 custom_id）
+            CREATE TABLE IF NOT EXISTS summary_batch_items (
+                job_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                PRIMARY KEY (job_id, url)
+            );
+
+            -- LLM调用遥测表（每次调用一行）
+            CREATE TABLE IF NOT EXISTS llm_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                mode TEXT NOT NULL,
+                tier TEXT DEFAULT 'default',
+                items INTEGER DEFAULT 1,
+                prompt_tokens INTEGER DEFAULT 0,
+                completion_tokens INTEGER DEFAULT 0,
+                cached_tokens INTEGER DEFAULT 0,
+                cache_write_tokens INTEGER DEFAULT 0,
+                latency REAL,
+                retries INTEGER DEFAULT 0,
+                parse_failures INTEGER DEFAULT 0,
+                error TEXT,
+                created_at DATETIME NOT NULL
+            );
+
+            -- 元数据表
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
             -- 创建索引
             CREATE INDEX IF NOT EXISTS idx_items_published ON items(published DESC);
             CREATE INDEX IF NOT EXISTS idx_items_score ON items(score DESC);
             CREATE INDEX IF NOT EXISTS idx_items_source ON items(source);
             CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
             CREATE INDEX IF NOT EXISTS idx_tags_item_id ON tags(item_id);
+            CREATE INDEX IF NOT EXISTS idx_story_members_published ON story_members(published DESC);
+            CREATE INDEX IF NOT EXISTS idx_story_members_cluster ON story_members(cluster_id);
+            CREATE INDEX IF NOT EXISTS idx_llm_calls_created ON llm_calls(created_at);
         """
         )
 
+        if self.text_index:
+            self._init_text_fts()
+
         self.conn.commit()
         logger.debug(f"数据库已初始化: {self.db_path}")
 
+    def _init_text_fts(self):
+        """初始化条目文本trigram全文索引
+
+        外部内容表，索引 items 的标题、摘要、正文、来源（即分类文本的各字段），
+        由触发器随 items 的增删改同步，用于主题关键词变化后查找可能受影响的历史条目。
+        """
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_text_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS items_text_fts USING fts5(
+                    title, summary, content, source,
+                    content = 'items',
+                    content_rowid = 'id',
+                    tokenize = 'trigram'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS items_text_fts_insert AFTER INSERT ON items BEGIN
+                    INSERT INTO items_text_fts (rowid, title, summary, content, source)
+                    VALUES (new.id, new.title, new.summary, new.content, new.source);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS items_text_fts_delete AFTER DELETE ON items BEGIN
+                    INSERT INTO items_text_fts (items_text_fts, rowid, title, summary, content, source)
+                    VALUES ('delete', old.id, old.title, old.summary, old.content, old.source);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS items_text_fts_update AFTER UPDATE ON items BEGIN
+                    INSERT INTO items_text_fts (items_text_fts, rowid, title, summary, content, source)
+                    VALUES ('delete', old.id, old.title, old.summary, old.content, old.source);
+                    INSERT INTO items_text_fts (rowid, title, summary, content, source)
+                    VALUES (new.id, new.title, new.summary, new.content, new.source);
+                END;
+            """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite不支持FTS5 trigram，重新分类将扫描全部历史: {e}")
+            return
+
+        self.text_fts_enabled = True
+
+        # 旧数据库首次启用时回填索引
+        if not exists:
+            self.conn.execute("INSERT INTO items_text_fts (items_text_fts) VALUES ('rebuild')")
+            logger.debug("已为历史数据建立文本索引")
+
+    def optimize_indexes(self):
+        """合并全文索引段
+
+        大量写入后FTS5会积累多个索引段，合并后查询明显更快。
+        """
+        if self.text_fts_enabled:
+            self.conn.execute("INSERT INTO items_text_fts (items_text_fts) VALUES ('optimize')")
+        self.conn.commit()
+
     def save_items(self, items: List[Item]) -> int:
         """保存Item列表
 
@@ -213,20 +366,24 @@ class Storage:
 
         return items
 
-    def _row_to_item(self, row: sqlite3.Row) -> Optional[Item]:
+    def _row_to_item(self, row: sqlite3.Row, tags: Optional[List[str]] = None) -> Optional[Item]:
         """将数据库行转换为Item
 
         Args:
             row: 数据库行
+            tags: 已批量加载的标签，为空时单独查询
 
         Returns:
             Item实例
         """
         try:
             # 查询标签
-            item_id = row["id"]
-            tags_cursor = self.conn.execute("SELECT tag FROM tags WHERE item_id = ?", (item_id,))
-            tags = [r["tag"] for r in tags_cursor.fetchall()]
+            if tags is None:
+                item_id = row["id"]
+                tags_cursor = self.conn.execute(
+                    "SELECT tag FROM tags WHERE item_id = ?", (item_id,)
+                )
+                tags = [r["tag"] for r in tags_cursor.fetchall()]
 
             item = Item(
                 url=row["url"],
@@ -252,6 +409,568 @@ class Storage:
             logger.error(f"转换数据库行失败: {e}")
             return None
 
+    def save_story_members(self, members: List[Dict[str, Any]]) -> int:
+        """保存事件聚类成员
+
+        Args:
+            members: 成员字典列表（来自StoryClusterer.new_members）
+
+        Returns:
+            成功保存的数量
+        """
+        rows = [
+            (
+                member["url"],
+                member["cluster_id"],
+                member["source"],
+                member["title"],
+                member["published"].isoformat(),
+                json.dumps(member["tokens"], ensure_ascii=False),
+                json.dumps(member["companies"], ensure_ascii=False),
+            )
+            for member in members
+        ]
+
+        try:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO story_members
+                (url, cluster_id, source, title, published, tokens, companies)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"保存事件聚类失败: {e}")
+            return 0
+
+        logger.debug(f"已保存 {len(rows)} 条事件聚类成员")
+        return len(rows)
+
+    def get_story_members(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """查询事件聚类成员
+
+        Args:
+            since: 开始时间
+
+        Returns:
+            成员字典列表
+        """
+        query = "SELECT * FROM story_members"
+        params = []
+        if since:
+            query += " WHERE published >= ?"
+            params.append(since.isoformat())
+
+        members = []
+        for row in self.conn.execute(query, params).fetchall():
+            members.append(
+                {
+                    "url": row["url"],
+                    "cluster_id": row["cluster_id"],
+                    "source": row["source"],
+                    "title": row["title"],
+                    "published": datetime.fromisoformat(row["published"]),
+                    "tokens": json.loads(row["tokens"] or "[]"),
+                    "companies": json.loads(row["companies"] or "[]"),
+                }
+            )
+
+        logger.debug(f"查询到 {len(members)} 条事件聚类成员")
+        return members
+
+    def get_classify_cache(self, content_hashes: Iterable[str]) -> Dict[str, Tuple[str, List[str]]]:
+        """批量查询分类缓存
+
+        Args:
+            content_hashes: 内容哈希列表
+
+        Returns:
+            内容哈希 -> (主题配置指纹, 主题标签列表)
+        """
+        hashes = list(dict.fromkeys(content_hashes))
+        cached = {}
+        # 分块查询，避免超出SQLite参数数量上限
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT content_hash, topics_fingerprint, tags FROM classify_cache "
+                f"WHERE content_hash IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                cached[row["content_hash"]] = (row["topics_fingerprint"], json.loads(row["tags"]))
+        return cached
+
+    def save_classify_cache(
+        self,
+        entries: Dict[str, List[str]],
+        fingerprint: str,
+        topic_fingerprints: Dict[str, str],
+    ) -> int:
+        """保存分类缓存
+
+        Args:
+            entries: 内容哈希 -> 主题标签列表
+            fingerprint: 主题配置指纹
+            topic_fingerprints: 主题名 -> 主题指纹（用于判断配置变化影响的主题）
+
+        Returns:
+            成功保存的数量
+        """
+        now = datetime.now().isoformat()
+        try:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO topic_versions (fingerprint, topic_fingerprints) VALUES (?, ?)",
+                (fingerprint, json.dumps(topic_fingerprints, sort_keys=True, ensure_ascii=False)),
+            )
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO classify_cache (content_hash, topics_fingerprint, tags, updated_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                [
+                    (content_hash, fingerprint, json.dumps(sorted(tags), ensure_ascii=False), now)
+                    for content_hash, tags in entries.items()
+                ],
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"保存分类缓存失败: {e}")
+            return 0
+
+        logger.debug(f"已保存 {len(entries)} 条分类缓存")
+        return len(entries)
+
+    def get_topic_fingerprints(self, fingerprint: str) -> Optional[Dict[str, str]]:
+        """查询某个主题配置版本的各主题指纹
+
+        Args:
+            fingerprint: 主题配置指纹
+
+        Returns:
+            主题名 -> 主题指纹，未记录时返回None
+        """
+        row = self.conn.execute(
+            "SELECT topic_fingerprints FROM topic_versions WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return json.loads(row["topic_fingerprints"]) if row else None
+
+    def get_summary_cache(self, cache_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """批量查询摘要缓存
+
+        Args:
+            cache_keys: 缓存键列表
+
+        Returns:
+            缓存键 -> 摘要结果（summary, key_points, action, usage）
+        """
+        keys = list(dict.fromkeys(cache_keys))
+        cached = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT * FROM summary_cache WHERE cache_key IN ({placeholders})", chunk
+            ).fetchall()
+            for row in rows:
+                cached[row["cache_key"]] = {
+                    "summary": row["summary"] or "",
+                    "key_points": json.loads(row["key_points"] or "[]"),
+                    "action": row["action"] or "",
+                    "usage": {
+                        "prompt_tokens": row["prompt_tokens"] or 0,
+                        "completion_tokens": row["completion_tokens"] or 0,
+                    },
+                }
+        return cached
+
+    def save_summary_cache(self, entries: Dict[str, Dict[str, Any]]) -> int:
+        """保存摘要缓存
+
+        Args:
+            entries: 缓存键 -> 摘要结果（summary, key_points, action, 可选 usage）
+
+        Returns:
+            成功保存的数量
+        """
+        now = datetime.now().isoformat()
+        try:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO summary_cache
+                (cache_key, summary, key_points, action, prompt_tokens, completion_tokens, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        cache_key,
+                        result.get("summary", ""),
+                        json.dumps(result.get("key_points", []), ensure_ascii=False),
+                        result.get("action", ""),
+                        (result.get("usage") or {}).get("prompt_tokens", 0),
+                        (result.get("usage") or {}).get("completion_tokens", 0),
+                        now,
+                    )
+                    for cache_key, result in entries.items()
+                ],
+            )
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"保存摘要缓存失败: {e}")
+            return 0
+
+        logger.debug(f"已保存 {len(entries)} 条摘要缓存")
+        return len(entries)
+
+    def save_summary_batch(
+        self, job_id: str, provider: str, model: str, entries: Dict[str, str]
+    ) -> int:
+        """记录已提交的批处理作业
+
+        Args:
+            job_id: 作业ID
+            provider: LLM提供商
+            model: 模型名
+            entries: 条目URL -> 摘要缓存键
+
+        Returns:
+            作业包含的条目数
+        """
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO summary_batches
+                (job_id, provider, model, status, request_count, submitted_at)
+                VALUES (?, ?, ?, 'in_progress', ?, ?)
+            """,
+                (job_id, provider, model, len(set(entries.values())), datetime.now().isoformat()),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO summary_batch_items (job_id, url, cache_key) VALUES (?, ?, ?)",
+                [(job_id, url, cache_key) for url, cache_key in entries.items()],
+            )
+        return len(entries)
+
+    def get_open_summary_batches(self) -> List[Dict[str, Any]]:
+        """查询尚未结束的批处理作业
+
+        Returns:
+            作业列表（job_id, provider, model, submitted_at, entries: 条目URL -> 摘要缓存键）
+        """
+        jobs = []
+        for row in self.conn.execute(
+            "SELECT * FROM summary_batches WHERE status = 'in_progress' ORDER BY submitted_at"
+        ).fetchall():
+            entries = {
+                item["url"]: item["cache_key"]
+                for item in self.conn.execute(
+                    "SELECT url, cache_key FROM summary_batch_items WHERE job_id = ?",
+                    (row["job_id"],),
+                ).fetchall()
+            }
+            jobs.append(
+                {
+                    "job_id": row["job_id"],
+                    "provider": row["provider"],
+                    "model": row["model"],
+                    "submitted_at": row["submitted_at"],
+                    "entries": entries,
+                }
+            )
+        return jobs
+
+    def finish_summary_batch(self, job_id: str, status: str):
+        """标记批处理作业已结束
+
+        Args:
+            job_id: 作业ID
+            status: 最终状态
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE summary_batches SET status = ?, finished_at = ? WHERE job_id = ?",
+                (status, datetime.now().isoformat(), job_id),
+            )
+
+    def save_llm_calls(self, calls: List[Dict[str, Any]]) -> int:
+        """保存LLM调用记录
+
+        Args:
+            calls: 调用记录（字段同 llm_calls 表）
+
+        Returns:
+            成功保存的数量
+        """
+        columns = (
+            "run_id",
+            "provider",
+            "model",
+            "mode",
+            "tier",
+            "items",
+            "prompt_tokens",
+            "completion_tokens",
+            "cached_tokens",
+            "cache_write_tokens",
+            "latency",
+            "retries",
+            "parse_failures",
+            "error",
+            "created_at",
+        )
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    f"INSERT INTO llm_calls ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(call[column] for column in columns) for call in calls],
+                )
+        except Exception as e:
+            logger.error(f"保存LLM调用记录失败: {e}")
+            return 0
+
+        logger.debug(f"已保存 {len(calls)} 条LLM调用记录")
+        return len(calls)
+
+    def get_llm_calls(
+        self, since: Optional[datetime] = None, run_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """查询LLM调用记录
+
+        Args:
+            since: 开始时间
+            run_id: 只查询该运行的记录
+
+        Returns:
+            调用记录列表（按时间排序）
+        """
+        query = "SELECT * FROM llm_calls WHERE 1=1"
+        params = []
+        if since:
+            query += " AND created_at >= ?"
+            params.append(since.isoformat())
+        if run_id:
+            query += " AND run_id = ?"
+            params.append(run_id)
+        query += " ORDER BY created_at, id"
+        return [dict(row) for row in self.conn.execute(query, params).fetchall()]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """读取元数据
+
+        Args:
+            key: 键
+
+        Returns:
+            值，不存在时返回None
+        """
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, key: str, value: str):
+        """写入元数据
+
+        Args:
+            key: 键
+            value: 值
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value, updated_at) VALUES (?, ?, ?)",
+            (key, value, datetime.now().isoformat()),
+        )
+        self.conn.commit()
+
+    def get_item_ids(self, since: Optional[datetime] = None) -> List[int]:
+        """查询条目ID
+
+        Args:
+            since: 开始时间
+
+        Returns:
+            条目ID列表
+        """
+        query = "SELECT id FROM items"
+        params = []
+        if since:
+            query += " WHERE published >= ?"
+            params.append(since.isoformat())
+        return [row[0] for row in self.conn.execute(query, params).fetchall()]
+
+    def get_item_ids_by_tags(
+        self, tags: Iterable[str], since: Optional[datetime] = None
+    ) -> List[int]:
+        """查询带有任一标签的条目ID
+
+        Args:
+            tags: 标签列表
+            since: 开始时间
+
+        Returns:
+            条目ID列表
+        """
+        tags = list(tags)
+        if not tags:
+            return []
+        placeholders = ",".join("?" * len(tags))
+        query = (
+            "SELECT DISTINCT tags.item_id FROM tags JOIN items ON items.id = tags.item_id "
+            f"WHERE tags.tag IN ({placeholders})"
+        )
+        params: List[Any] = list(tags)
+        if since:
+            query += " AND items.published >= ?"
+            params.append(since.isoformat())
+        return [row[0] for row in self.conn.execute(query, params).fetchall()]
+
+    def search_item_ids(
+        self, keywords: Iterable[str], since: Optional[datetime] = None
+    ) -> List[int]:
+        """查询标题、摘要、正文或来源包含任一关键词的条目ID（不区分大小写）
+
+        优先走文本trigram索引；不足3个字符的关键词无法走trigram索引，用LIKE扫描。
+
+        Args:
+            keywords: 关键词列表
+            since: 开始时间
+
+        Returns:
+            条目ID列表
+        """
+        keywords = sorted({str(keyword).lower() for keyword in keywords if str(keyword)})
+        indexed = [k for k in keywords if self.text_fts_enabled and len(k) >= 3]
+        scanned = [k for k in keywords if k not in indexed]
+
+        since_clause = ""
+        since_params: List[Any] = []
+        if since:
+            since_clause = " AND items.published >= ?"
+            since_params = [since.isoformat()]
+
+        ids = set()
+        # 分块组合OR查询，避免单条查询过长
+        for start in range(0, len(indexed), 50):
+            match = " OR ".join(
+                '"' + keyword.replace('"', '""') + '"' for keyword in indexed[start : start + 50]
+            )
+            rows = self.conn.execute(
+                "SELECT items.id FROM items_text_fts JOIN items ON items.id = items_text_fts.rowid "
+                "WHERE items_text_fts MATCH ?" + since_clause,
+                [match] + since_params,
+            ).fetchall()
+            ids.update(row[0] for row in rows)
+
+        for keyword in scanned:
+            rows = self.conn.execute(
+                "SELECT id FROM items WHERE instr(lower(title || ' ' || coalesce(summary, '') || ' ' "
+                "|| coalesce(content, '') || ' ' || source), ?) > 0" + since_clause,
+                [keyword] + since_params,
+            ).fetchall()
+            ids.update(row[0] for row in rows)
+
+        return sorted(ids)
+
+    def get_items_by_ids(self, item_ids: Iterable[int]) -> Dict[int, Item]:
+        """按ID批量查询Item（标签批量加载）
+
+        Args:
+            item_ids: 条目ID列表
+
+        Returns:
+            条目ID -> Item
+        """
+        item_ids = list(item_ids)
+        items = {}
+        for start in range(0, len(item_ids), 500):
+            chunk = item_ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            tags: Dict[int, List[str]] = {}
+            for row in self.conn.execute(
+                f"SELECT item_id, tag FROM tags WHERE item_id IN ({placeholders}) ORDER BY id",
+                chunk,
+            ).fetchall():
+                tags.setdefault(row["item_id"], []).append(row["tag"])
+            for row in self.conn.execute(
+                f"SELECT * FROM items WHERE id IN ({placeholders})", chunk
+            ).fetchall():
+                item = self._row_to_item(row, tags.get(row["id"], []))
+                if item:
+                    items[row["id"]] = item
+        return items
+
+    def get_items_by_urls(self, urls: Iterable[str]) -> Dict[str, Item]:
+        """按URL批量查询Item
+
+        Args:
+            urls: URL列表
+
+        Returns:
+            URL -> Item
+        """
+        urls = list(urls)
+        item_ids = []
+        for start in range(0, len(urls), 500):
+            chunk = urls[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            item_ids.extend(
+                row[0]
+                for row in self.conn.execute(
+                    f"SELECT id FROM items WHERE url IN ({placeholders})", chunk
+                ).fetchall()
+            )
+        return {item.url: item for item in self.get_items_by_ids(item_ids).values()}
+
+    def update_tags(self, tag_updates: Dict[int, List[str]], batch_size: int = 1000) -> int:
+        """批量更新条目标签
+
+        Args:
+            tag_updates: 条目ID -> 新标签列表
+            batch_size: 每个事务更新的条目数
+
+        Returns:
+            更新的条目数
+        """
+        updates = list(tag_updates.items())
+        for start in range(0, len(updates), batch_size):
+            chunk = updates[start : start + batch_size]
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM tags WHERE item_id = ?", [(item_id,) for item_id, _ in chunk]
+                )
+                self.conn.executemany(
+                    "INSERT INTO tags (item_id, tag) VALUES (?, ?)",
+                    [(item_id, tag) for item_id, tags in chunk for tag in tags],
+                )
+        logger.debug(f"已更新 {len(updates)} 条数据的标签")
+        return len(updates)
+
+    def update_summaries(self, items: List[Item]) -> int:
+        """更新已入库条目的摘要字段（按URL匹配，不改动其他字段和ID）
+
+        Args:
+            items: Item列表
+
+        Returns:
+            更新的条目数
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE items SET ai_summary = ?, key_points = ?, action = ? WHERE url = ?",
+                [
+                    (
+                        item.ai_summary,
+                        json.dumps(item.key_points, ensure_ascii=False),
+                        item.action,
+                        item.url,
+                    )
+                    for item in items
+                ],
+            )
+        logger.debug(f"已更新 {cursor.rowcount} 条数据的摘要")
+        return cursor.rowcount
+
     def export_jsonl(self, items: List[Item], output_path: str):
         """导出为JSONL格式
 
@@ -330,7 +1049,33 @@ class Storage:
                 (cutoff.isoformat(),),
             )
             deleted = cursor.rowcount
+            self.conn.execute(
+                "DELETE FROM classify_cache WHERE updated_at < ?",
+                (cutoff.isoformat(),),
+            )
+            self.conn.execute(
+                "DELETE FROM summary_cache WHERE updated_at < ?",
+                (cutoff.isoformat(),),
+            )
+            self.conn.execute(
+                "DELETE FROM llm_calls WHERE created_at < ?",
+                (cutoff.isoformat(),),
+            )
+            self.conn.execute(
+                "DELETE FROM summary_batch_items WHERE job_id IN "
+                "(SELECT job_id FROM summary_batches WHERE status != 'in_progress' AND submitted_at < ?)",
+                (cutoff.isoformat(),),
+            )
+            self.conn.execute(
+                "DELETE FROM summary_batches WHERE status != 'in_progress' AND submitted_at < ?",
+                (cutoff.isoformat(),),
+            )
+            self.conn.execute(
+                "DELETE FROM topic_versions WHERE fingerprint NOT IN "
+                "(SELECT DISTINCT topics_fingerprint FROM classify_cache)"
+            )
             self.conn.commit()
+            self.optimize_indexes()
 
             logger.info(f"已清理 {deleted} 条 {days} 天前的数据")
 
@@ -2,16 +2,68 @@
 
 import json
 import re
-from typing import Any, Dict, List, Optional
-
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..ingest.models import Item
+from ..utils.keywords import KeywordMatcher
 from ..utils.logger import get_logger
+from .batch_api import ENDED, IN_PROGRESS, batch_backend
+from .cache import SummaryCache, saved_tokens
+from .concurrency import AdaptiveConcurrency, retry_after_seconds
+from .content import select_content
+from .ollama_pool import OllamaPool
+from .telemetry import LLMTelemetry, new_run_id
+from .tokens import estimate_tokens
 
 logger = get_logger("summarize")
 
 
+# 摘要提示词中所有条目共用的说明
+SUMMARY_INSTRUCTIONS = """你是一个偏工程实战的 AI 研发负责人。请阅读以下 AI 信息并输出可直接执行的中文结论：
+
+1. 中文摘要 (100-160字，说明它是什么，以及对研发、测试、接入、回归的直接影响)
+2. 工程师要点 (3条，每条不超过28字，只写工程上最值得记的点)
+3. 行动建议 (1条，不超过36字，必须是直接结论)
+
+行动建议写法要求：
+- 优先写：建议本周做 PoC / 暂不跟进 / 仅记录
+- 或写：可用于研发验收 / 不适合回归测试 / 可纳入自动化测试候选
+- 或写：需要评估升级影响 / 暂时不用投入接入
+- 不要写“继续观察”“关注后续”“等后续更新”这类空话
+- 如果信息不足，也要明确写“暂不跟进，等官方文档/价格/API细节”"""
+
+SUMMARY_JSON_FORMAT = """{
+  "summary": "中文摘要...",
+  "key_points": ["要点1", "要点2", "要点3"],
+  "action": "直接结论"
+}"""
+
+BATCH_JSON_FORMAT = """[
+  {"id": 1, "summary": "中文摘要...", "key_points": ["要点1", "要点2", "要点3"], "action": "直接结论"}
+]"""
+
+# 系统提示词只包含静态说明，所有请求完全相同，便于提供商做前缀缓存；条目内容放在用户消息
+SYSTEM_PROMPT = (
+    f"{SUMMARY_INSTRUCTIONS}\n\n输出JSON格式:\n{SUMMARY_JSON_FORMAT}\n\n只输出JSON，不要其他内容。"
+)
+BATCH_SYSTEM_PROMPT = (
+    f"{SUMMARY_INSTRUCTIONS}\n\n用户消息中会给出多条编号的信息，请逐条按上述要求输出。\n\n"
+    f"输出JSON数组，每条信息一个对象，id 与信息编号一致:\n{BATCH_JSON_FORMAT}\n\n"
+    "只输出JSON数组，不要其他内容。"
+)
+
+
+# 分级路由的层级名
+DEFAULT_TIER = "default"
+PREMIUM_TIER = "premium"
+ECONOMY_TIER = "economy"
+EXTRACTIVE_TIER = "extractive"
+# 层级配置中用于分级的键，其余键（model、max_tokens 等）覆盖该层级的LLM配置
+ROUTING_RULE_KEYS = {"min_score", "top_n"}
+
+
 class BaseSummarizer:
     """摘要器基类"""
 
@@ -30,6 +82,9 @@ class BaseSummarizer:
 class LLMSummarizer(BaseSummarizer):
     """LLM摘要器"""
 
+    # 提示词模板版本：修改 _build_prompt / _build_content 的输出时递增，使摘要缓存失效
+    PROMPT_VERSION = "3"
+
     def __init__(self, config: Dict[str, Any]):
         """初始化LLM摘要器
 
@@ -44,6 +99,11 @@ class LLMSummarizer(BaseSummarizer):
         self.timeout = config.get("timeout", 30)
         self.api_key = config.get("api_key")
         self.base_url = config.get("base_url")
+        # 正文按token预算选取，命中评分关键词的句子优先
+        self.content_token_budget = config.get("content_token_budget", 800)
+        self.min_output_tokens = config.get("min_output_tokens", 350)
+        content_keywords = config.get("content_keywords") or []
+        self.content_keywords = KeywordMatcher(content_keywords) if content_keywords else None
 
         if self.provider in {"openai", "openai_compatible", "anthropic"} and not self.api_key:
             raise ValueError(f"缺少{self.provider} API密钥")
@@ -61,8 +121,14 @@ class LLMSummarizer(BaseSummarizer):
 
             self.client = Anthropic(api_key=self.api_key, timeout=self.timeout)
         elif self.provider == "ollama":
-            self.client = None
+            # 可配置多个服务地址，请求按负载分发并在超时时切换
             self.base_url = (self.base_url or "http://localhost:11434").rstrip("/")
+            self.client = OllamaPool(
+                config.get("base_urls") or [self.base_url],
+                timeout=self.timeout,
+                keep_alive=config.get("keep_alive", "30m"),
+                pool_size=config.get("max_concurrency", 8),
+            )
         else:
             raise ValueError(f"不支持的LLM提供商: {self.provider}")
 
@@ -76,52 +142,153 @@ class LLMSummarizer(BaseSummarizer):
             包含summary, key_points, action的字典
         """
         try:
-            # 构建prompt
+            # 构建prompt并调用LLM
             content = self._build_content(item)
-            prompt = self._build_prompt(item, content)
-
-            # 调用LLM
-            if self.provider in {"openai", "openai_compatible"}:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                )
-                result_text = response.choices[0].message.content
-            elif self.provider == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    messages=[{"role": "user", "content": prompt}],
-                )
-                result_text = response.content[0].text
-            elif self.provider == "ollama":
-                response = requests.post(
-                    f"{self.base_url}/api/chat",
-                    json={
-                        "model": self.model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "stream": False,
-                        "options": {"temperature": self.temperature},
-                    },
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
-                payload = response.json()
-                result_text = payload.get("message", {}).get("content", "")
-            else:
-                raise ValueError(f"不支持的提供商: {self.provider}")
+            result_text, usage = self._complete(
+                SYSTEM_PROMPT, self._build_prompt(item, content), self.output_tokens(content)
+            )
 
             # 解析结果
             result = self._parse_result(result_text)
+            result["usage"] = usage
             return result
 
         except Exception as e:
             logger.error(f"LLM摘要生成失败: {e}")
             raise
 
+    def summarize_many(self, items: List[Item]) -> Tuple[Dict[int, Dict[str, Any]], Dict[str, int]]:
+        """把多条信息合并为一个请求生成摘要
+
+        共用一份说明，要求模型返回按编号对应的JSON数组。
+
+        Args:
+            items: Item列表
+
+        Returns:
+            (条目在列表中的下标 -> 摘要结果，输出中缺失或无效的条目不包含在内；整个请求的token用量)
+        """
+        prompt = self._build_batch_prompt(items)
+        max_tokens = sum(self.output_tokens(self._build_content(item)) for item in items)
+        result_text, usage = self._complete(BATCH_SYSTEM_PROMPT, prompt, max_tokens)
+        results = self._parse_batch_result(result_text, len(items))
+
+        # 请求的token用量按条目平均分摊（用于缓存节省统计）
+        for result in results.values():
+            result["usage"] = {name: count // len(items) for name, count in usage.items()}
+            result["batched"] = True
+        return results, usage
+
+    def _complete(self, system: str, prompt: str, max_tokens: int) -> Tuple[str, Dict[str, int]]:
+        """调用LLM
+
+        静态的系统提示词放在最前面：Anthropic 显式标记 cache_control 断点，
+        OpenAI 及兼容服务（vLLM、Ollama 等）按相同前缀自动复用缓存。
+
+        Args:
+            system: 系统提示词（所有请求相同）
+            prompt: 用户消息（条目内容）
+            max_tokens: 最大输出token数
+
+        Returns:
+            (模型输出文本, token用量: prompt_tokens, completion_tokens, cached_tokens)
+        """
+        params = self.request_params(system, prompt, max_tokens)
+        if self.provider in {"openai", "openai_compatible"}:
+            return self.read_response(self.client.chat.completions.create(**params))
+        if self.provider == "anthropic":
+            return self.read_response(self.client.messages.create(**params))
+        if self.provider == "ollama":
+            return self.read_response(self.client.post("/api/chat", params))
+        raise ValueError(f"不支持的提供商: {self.provider}")
+
+    def request_params(self, system: str, prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """构建一次摘要请求的参数（实时调用和批处理接口共用）
+
+        Args:
+            system: 系统提示词
+            prompt: 用户消息
+            max_tokens: 最大输出token数
+
+        Returns:
+            提供商请求体
+        """
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        if self.provider == "anthropic":
+            return {
+                "model": self.model,
+                "max_tokens": max_tokens,
+                "temperature": self.temperature,
+                "system": [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+                ],
+                "messages": messages[1:],
+            }
+        if self.provider == "ollama":
+            return {
+                "model": self.model,
+                "messages": messages,
+                "stream": False,
+                "options": {"temperature": self.temperature},
+            }
+        return {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+        }
+
+    def read_response(self, response: Any) -> Tuple[str, Dict[str, int]]:
+        """读取模型输出和token用量（兼容SDK响应对象和批处理结果中的JSON）
+
+        Args:
+            response: 提供商响应
+
+        Returns:
+            (模型输出文本, token用量: prompt_tokens, completion_tokens, cached_tokens,
+            cache_write_tokens；prompt_tokens 包含缓存读写部分)
+        """
+        if self.provider == "ollama":
+            return _field(_field(response, "message"), "content") or "", {
+                "prompt_tokens": _field(response, "prompt_eval_count") or 0,
+                "completion_tokens": _field(response, "eval_count") or 0,
+                "cached_tokens": 0,
+                "cache_write_tokens": 0,
+            }
+
+        usage = _field(response, "usage")
+        if self.provider == "anthropic":
+            # Anthropic 的 input_tokens 不含缓存读写部分
+            cache_read = _field(usage, "cache_read_input_tokens") or 0
+            cache_write = _field(usage, "cache_creation_input_tokens") or 0
+            text = _field(_field(response, "content")[0], "text")
+            return text, {
+                "prompt_tokens": (_field(usage, "input_tokens") or 0) + cache_read + cache_write,
+                "completion_tokens": _field(usage, "output_tokens") or 0,
+                "cached_tokens": cache_read,
+                "cache_write_tokens": cache_write,
+            }
+
+        details = _field(usage, "prompt_tokens_details")
+        text = _field(_field(_field(response, "choices")[0], "message"), "content")
+        return text, {
+            "prompt_tokens": _field(usage, "prompt_tokens") or 0,
+            "completion_tokens": _field(usage, "completion_tokens") or 0,
+            "cached_tokens": _field(details, "cached_tokens") or 0,
+            "cache_write_tokens": 0,
+        }
+
+    def prompt_for(self, item: Item) -> str:
+        """构建发给模型的完整提示词（系统提示词 + 用户消息，用作缓存键）
+
+        Args:
+            item: Item
+
+        Returns:
+            提示词
+        """
+        return f"{SYSTEM_PROMPT}\n\n{self._build_prompt(item, self._build_content(item))}"
+
     def _build_content(self, item: Item) -> str:
         """构建输入内容
 
@@ -133,15 +300,15 @@ class LLMSummarizer(BaseSummarizer):
         """
         # 优先使用content，其次summary，最后title
         if item.content and len(item.content) > 100:
-            # 限制长度避免token超限
-            return item.content[:3000]
+            # 首段 + 命中评分关键词最多的句子，控制在token预算内
+            return select_content(item.content, self.content_token_budget, self.content_keywords)
         elif item.summary:
             return item.summary
         else:
             return item.title
 
     def _build_prompt(self, item: Item, content: str) -> str:
-        """构建提示词
+        """构建用户消息（说明和输出格式在 SYSTEM_PROMPT 中）
 
         Args:
             item: Item
@@ -150,32 +317,48 @@ class LLMSummarizer(BaseSummarizer):
         Returns:
             提示词
         """
-        return f"""你是一个偏工程实战的 AI 研发负责人。请阅读以下 AI 信息并输出可直接执行的中文结论：
+        return _item_block(item, content)
 
-1. 中文摘要 (100-160字，说明它是什么，以及对研发、测试、接入、回归的直接影响)
-2. 工程师要点 (3条，每条不超过28字，只写工程上最值得记的点)
-3. 行动建议 (1条，不超过36字，必须是直接结论)
+    def _build_batch_prompt(self, items: List[Item]) -> str:
+        """构建多条信息合并的用户消息（说明和输出格式在 BATCH_SYSTEM_PROMPT 中）
 
-行动建议写法要求：
-- 优先写：建议本周做 PoC / 暂不跟进 / 仅记录
-- 或写：可用于研发验收 / 不适合回归测试 / 可纳入自动化测试候选
-- 或写：需要评估升级影响 / 暂时不用投入接入
-- 不要写“继续观察”“关注后续”“等后续更新”这类空话
-- 如果信息不足，也要明确写“暂不跟进，等官方文档/价格/API细节”
+        Args:
+            items: Item列表
 
-标题: {item.title}
-来源: {item.source}
-原文:
-{content}
+        Returns:
+            提示词
+        """
+        blocks = "\n\n".join(
+            f"[{index}]\n{_item_block(item, self._build_content(item))}"
+            for index, item in enumerate(items, 1)
+        )
+        return f"下面共有 {len(items)} 条信息。\n\n{blocks}"
 
-输出JSON格式:
-{{
-  "summary": "中文摘要...",
-  "key_points": ["要点1", "要点2", "要点3"],
-  "action": "直接结论"
-}}
+    def request_tokens(self, item: Item) -> int:
+        """估算单个条目在合并请求中占用的token数（输入 + 输出上限）
 
-只输出JSON，不要其他内容。"""
+        Args:
+            item: Item
+
+        Returns:
+            token数
+        """
+        content = self._build_content(item)
+        return estimate_tokens(_item_block(item, content)) + self.output_tokens(content)
+
+    def output_tokens(self, content: str) -> int:
+        """按输入正文长度确定输出token上限
+
+        输出格式固定（摘要、3条要点、1条建议），短正文用下限即可，长正文适当放宽，
+        不超过配置的 max_tokens。
+
+        Args:
+            content: 送给模型的正文
+
+        Returns:
+            max_tokens
+        """
+        return min(self.max_tokens, max(self.min_output_tokens, estimate_tokens(content) // 2))
 
     def _parse_result(self, result_text: str) -> Dict[str, Any]:
         """解析LLM返回结果
@@ -207,8 +390,56 @@ class LLMSummarizer(BaseSummarizer):
                 "summary": result_text[:200],
                 "key_points": [],
                 "action": "",
+                "parse_failed": True,
             }
 
+    def _parse_batch_result(self, result_text: str, count: int) -> Dict[int, Dict[str, Any]]:
+        """解析合并请求的JSON数组
+
+        Args:
+            result_text: LLM返回的文本
+            count: 请求中的条目数
+
+        Returns:
+            条目下标 -> 摘要结果，缺失、重复或字段不全的条目不包含在内
+        """
+        try:
+            json_match = re.search(r"\[.*\]", result_text, re.DOTALL)
+            entries = json.loads(json_match.group(0) if json_match else result_text)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"解析批量LLM结果失败: {e}, 原始文本: {result_text[:200]}")
+            return {}
+
+        results: Dict[int, Dict[str, Any]] = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or not all(
+                field in entry for field in ("summary", "key_points", "action")
+            ):
+                continue
+            try:
+                index = int(entry.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < count and index not in results:
+                results[index] = {
+                    "summary": entry["summary"],
+                    "key_points": entry["key_points"],
+                    "action": entry["action"],
+                }
+        return results
+
+
+def _item_block(item: Item, content: str) -> str:
+    """单条信息在提示词中的内容"""
+    return f"标题: {item.title}\n来源: {item.source}\n原文:\n{content}"
+
+
+def _field(value: Any, name: str) -> Any:
+    """读取SDK对象属性或字典字段"""
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
 
 class ExtractiveSummarizer(BaseSummarizer):
     """抽取式摘要器（Fallback）"""
@@ -281,7 +512,7 @@ class ExtractiveSummarizer(BaseSummarizer):
         Returns:
             行动建议
         """
-        text = (item.title + " " + (item.summary or "")).lower()
+        text = item.text.title_summary_lower
 
         if "benchmark" in text or "evaluation" in text or "testing" in text or "test" in text:
             return "可纳入研发验收或自动化测试候选"
@@ -297,12 +528,205 @@ class ExtractiveSummarizer(BaseSummarizer):
             return "暂不跟进，除非它影响现有研发流程"
 
 
-def summarize_batch(items: List[Item], config: Dict[str, Any]) -> List[Item]:
+def _apply_result(item: Item, result: Dict[str, Any]):
+    """把摘要结果写回条目"""
+    item.ai_summary = result.get("summary", "")
+    item.key_points = result.get("key_points", [])
+    item.action = result.get("action", "")
+
+
+def _call_llm(
+    call,
+    controller: Optional[AdaptiveConcurrency],
+    retries: int,
+    label: str,
+    units: int = 1,
+    telemetry: Optional[LLMTelemetry] = None,
+    stats=None,
+):
+    """在并发控制下调用LLM，被限流时按 Retry-After 重试，其他错误直接抛出
+
+    Args:
+        call: 无参调用
+        controller: 并发控制器，为空时直接调用
+        retries: 被限流后的最大重试次数
+        label: 日志中的说明
+        units: 一次请求包含的条目数（延迟按条目平均后反馈给控制器）
+        telemetry: 调用记录，为空时不记录
+        stats: 从 call 的返回值读取 (token用量, 解析失败条目数)
+
+    Returns:
+        call 的返回值
+    """
+    for attempt in range(retries + 1):
+        if controller:
+            controller.acquire()
+        started = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            latency = time.monotonic() - started
+            delay = retry_after_seconds(e)
+            if controller:
+                controller.release(error=True, retry_after=delay)
+            if delay is not None and attempt < retries:
+                logger.info(f"被限流，稍后重试 ({attempt + 1}/{retries}): {label}")
+                continue
+            if telemetry:
+                error = f"{type(e).__name__}: {e}"[:200]
+                telemetry.record(units, latency, retries=attempt, error=error)
+            raise
+        latency = time.monotonic() - started
+        if controller:
+            controller.release(latency=latency / units)
+        if telemetry:
+            usage, parse_failures = stats(result) if stats else (None, 0)
+            telemetry.record(units, latency, attempt, usage, parse_failures)
+        return result
+
+
+def _summarize_item(
+    summarizer: BaseSummarizer,
+    item: Item,
+    controller: Optional[AdaptiveConcurrency],
+    retries: int,
+    fallback_enabled: bool,
+    telemetry: Optional[LLMTelemetry] = None,
+) -> Optional[Dict[str, Any]]:
+    """为单个条目生成摘要（限流时按 Retry-After 重试，失败时降级到抽取式摘要）
+
+    Args:
+        summarizer: 摘要器
+        item: Item（结果原地写回）
+        controller: 并发控制器，为空时直接调用
+        retries: 被限流后的最大重试次数
+        fallback_enabled: 失败时是否降级到抽取式摘要
+        telemetry: 调用记录，为空时不记录
+
+    Returns:
+        成功时返回摘要结果，失败时返回None
+    """
+    try:
+        result = _call_llm(
+            lambda: summarizer.summarize(item),
+            controller,
+            retries,
+            item.title,
+            telemetry=telemetry,
+            stats=lambda result: (result.get("usage"), int(bool(result.get("parse_failed")))),
+        )
+    except Exception as e:
+        logger.error(f"生成摘要失败 '{item.title}': {e}")
+    else:
+        _apply_result(item, result)
+        return result
+
+    # 降级到extractive
+    if fallback_enabled:
+        try:
+            _apply_result(item, ExtractiveSummarizer().summarize(item))
+            logger.info(f"使用fallback成功: {item.title}")
+        except Exception as e2:
+            logger.error(f"Fallback也失败: {e2}")
+    return None
+
+
+def _summarize_group(
+    summarizer: LLMSummarizer,
+    group: List[Item],
+    controller: Optional[AdaptiveConcurrency],
+    retries: int,
+    fallback_enabled: bool,
+    telemetry: Optional[LLMTelemetry] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """用一个合并请求为一组条目生成摘要，请求失败或输出缺失的条目单独重试
+
+    Args:
+        summarizer: LLM摘要器
+        group: Item列表（结果原地写回）
+        controller: 并发控制器
+        retries: 被限流后的最大重试次数
+        fallback_enabled: 单独重试也失败时是否降级到抽取式摘要
+        telemetry: 调用记录，为空时不记录
+
+    Returns:
+        与 group 对应的摘要结果列表（失败为None）
+    """
+    if len(group) == 1:
+        return [
+            _summarize_item(summarizer, group[0], controller, retries, fallback_enabled, telemetry)
+        ]
+
+    try:
+        results, _ = _call_llm(
+            lambda: summarizer.summarize_many(group),
+            controller,
+            retries,
+            f"{len(group)} 条合并请求",
+            units=len(group),
+            telemetry=telemetry,
+            stats=lambda outcome: (outcome[1], len(group) - len(outcome[0])),
+        )
+    except Exception as e:
+        logger.warning(f"合并请求失败，{len(group)} 条逐条重试: {e}")
+        results = {}
+
+    missing = len(group) - len(results)
+    if results and missing:
+        logger.info(f"合并请求输出缺少 {missing} 条，逐条重试")
+
+    outcomes = []
+    for index, item in enumerate(group):
+        result = results.get(index)
+        if result is None:
+            result = _summarize_item(
+                summarizer, item, controller, retries, fallback_enabled, telemetry
+            )
+        else:
+            _apply_result(item, result)
+        outcomes.append(result)
+    return outcomes
+
+
+def plan_request_groups(
+    items: List[Item], sizes: List[int], max_items: int, token_budget: int, overhead: int
+) -> List[List[Item]]:
+    """按token预算把条目依次打包为合并请求
+
+    Args:
+        items: Item列表
+        sizes: 每个条目估算占用的token数（输入 + 输出上限）
+        max_items: 每个请求最多的条目数
+        token_budget: 每个请求的token预算（含共用说明）
+        overhead: 共用说明的token数
+
+    Returns:
+        条目分组（单个条目超出预算时单独成组）
+    """
+    groups: List[List[Item]] = []
+    current: List[Item] = []
+    used = overhead
+    for item, size in zip(items, sizes):
+        if current and (len(current) >= max_items or used + size > token_budget):
+            groups.append(current)
+            current, used = [], overhead
+        current.append(item)
+        used += size
+    if current:
+        groups.append(current)
+    return groups
+
+
+def summarize_batch(
+    items: List[Item], config: Dict[str, Any], store=None, run_id: Optional[str] = None
+) -> List[Item]:
     """批量生成摘要
 
     Args:
         items: Item列表
         config: LLM配置
+        store: Storage实例，传入时先查摘要缓存，并缓存新生成的结果和LLM调用记录
+        run_id: 调用记录所属的运行ID，默认按当前时间生成
 
     Returns:
         生成摘要后的Item列表（原地修改）
@@ -313,6 +737,102 @@ def summarize_batch(items: List[Item], config: Dict[str, Any]) -> List[Item]:
 
     logger.info(f"开始生成摘要: {len(items)} 条数据")
 
+    routing = config.get("routing") or {}
+    if not routing or not routing.get("enabled", True):
+        return _summarize_with_model(items, config, store, run_id)
+
+    # 按分数分级：高价值条目用主模型，中等分数用低价模型，其余用抽取式摘要
+    run_id = run_id or new_run_id("summarize")
+    tiers = route_by_score(items, routing)
+    logger.info(
+        "分级路由: "
+        + ", ".join(f"{tier} {len(tier_items)} 条" for tier, tier_items in tiers.items())
+    )
+    for tier, tier_items in tiers.items():
+        if not tier_items:
+            continue
+        if tier == EXTRACTIVE_TIER:
+            _summarize_extractive(tier_items, config, store, run_id)
+            continue
+        overrides = {
+            key: value
+            for key, value in (routing.get(tier) or {}).items()
+            if key not in ROUTING_RULE_KEYS
+        }
+        _summarize_with_model(tier_items, {**config, **overrides}, store, run_id, tier)
+    return items
+
+
+def _summarize_extractive(items: List[Item], config: Dict[str, Any], store, run_id: str):
+    """为分到 extractive 层级的条目生成抽取式摘要
+
+    不调用模型；调用记录中写入一行（mode 为 extractive、条目数为本层级条目数），
+    llm-report 据此显示有多少条目没有走LLM。
+    """
+    summarizer = ExtractiveSummarizer()
+    for item in items:
+        _summarize_item(summarizer, item, None, 0, False)
+    if store is not None and config.get("telemetry", True):
+        telemetry = LLMTelemetry(
+            run_id, EXTRACTIVE_TIER, EXTRACTIVE_TIER, mode=EXTRACTIVE_TIER, tier=EXTRACTIVE_TIER
+        )
+        telemetry.record(len(items), None)
+        telemetry.save(store)
+
+
+def route_by_score(items: List[Item], routing: Dict[str, Any]) -> Dict[str, List[Item]]:
+    """按分数把条目分到摘要层级
+
+    必读条目、分数排名前 premium.top_n 的条目和分数不低于 premium.min_score 的条目进入 premium；
+    其余分数不低于 economy.min_score 的条目进入 economy；剩下的进入 extractive（不调用模型）。
+
+    Args:
+        items: Item列表
+        routing: 路由配置（llm.routing）
+
+    Returns:
+        层级名 -> Item列表（保持原顺序）
+    """
+    premium = routing.get(PREMIUM_TIER) or {}
+    economy = routing.get(ECONOMY_TIER)
+    ranked = sorted(items, key=lambda item: -item.score)
+    top = {id(item) for item in ranked[: premium.get("top_n", 0)]}
+
+    tiers: Dict[str, List[Item]] = {PREMIUM_TIER: [], ECONOMY_TIER: [], EXTRACTIVE_TIER: []}
+    for item in items:
+        premium_score = premium.get("min_score")
+        if (
+            item.is_must_read
+            or id(item) in top
+            or (premium_score is not None and item.score >= premium_score)
+        ):
+            tiers[PREMIUM_TIER].append(item)
+        elif economy is not None and item.score >= economy.get("min_score", 0):
+            tiers[ECONOMY_TIER].append(item)
+        else:
+            tiers[EXTRACTIVE_TIER].append(item)
+    return tiers
+
+
+def _summarize_with_model(
+    items: List[Item],
+    config: Dict[str, Any],
+    store=None,
+    run_id: Optional[str] = None,
+    tier: str = DEFAULT_TIER,
+) -> List[Item]:
+    """用配置中的模型生成摘要（摘要缓存、合并请求、自适应并发、调用记录）
+
+    Args:
+        items: Item列表
+        config: LLM配置
+        store: Storage实例
+        run_id: 调用记录所属的运行ID
+        tier: 调用记录中的层级名
+
+    Returns:
+        生成摘要后的Item列表（原地修改）
+    """
     # 尝试使用LLM
     summarizer: Optional[BaseSummarizer] = None
 
@@ -328,45 +848,252 @@ def summarize_batch(items: List[Item], config: Dict[str, Any]) -> List[Item]:
             logger.error("LLM摘要器不可用且未启用fallback，跳过摘要生成")
             return items
 
-    # 批量处理
-    success_count = 0
-    failed_count = 0
-    batch_size = config.get("batch_size", 10)
+    fallback_enabled = config.get("fallback_to_extractive", True)
 
-    for i in range(0, len(items), batch_size):
-        batch = items[i : i + batch_size]
+    if not isinstance(summarizer, LLMSummarizer):
+        outcomes = [_summarize_item(summarizer, item, None, 0, False) for item in items]
+        success_count = sum(result is not None for result in outcomes)
+        logger.info(f"摘要生成完成: 成功 {success_count}, 失败 {len(items) - success_count}")
+        return items
 
-        for item in batch:
-            try:
-                result = summarizer.summarize(item)
-                item.ai_summary = result.get("summary", "")
-                item.key_points = result.get("key_points", [])
-                item.action = result.get("action", "")
-                success_count += 1
-            except Exception as e:
-                logger.error(f"生成摘要失败 '{item.title}': {e}")
-                failed_count += 1
-
-                # 降级到extractive
-                if isinstance(summarizer, LLMSummarizer) and config.get("fallback_to_extractive", True):
-                    try:
-                        fallback = ExtractiveSummarizer()
-                        result = fallback.summarize(item)
-                        item.ai_summary = result.get("summary", "")
-                        item.key_points = result.get("key_points", [])
-                        item.action = result.get("action", "")
-                        logger.info(f"使用fallback成功: {item.title}")
-                    except Exception as e2:
-                        logger.error(f"Fallback也失败: {e2}")
-
-        # 批次间短暂休息避免rate limit
-        if i + batch_size < len(items) and isinstance(summarizer, LLMSummarizer):
-            import time
-            time.sleep(1)
-
-    logger.info(f"摘要生成完成: 成功 {success_count}, 失败 {failed_count}")
+    # 先查摘要缓存（开启合并请求时，合并请求的缓存结果也可复用；单条请求只用单条结果）
+    batch_prompts = config.get("batch_prompts", False)
+    cache = None
+    pending = items
+    cache_keys: Dict[int, str] = {}
+    batch_keys: Dict[int, str] = {}
+    if store is not None and config.get("cache", True):
+        cache = SummaryCache(
+            store, summarizer.provider, summarizer.model, summarizer.PROMPT_VERSION
+        )
+        prompts = {id(item): summarizer.prompt_for(item) for item in items}
+        cache_keys = {key: cache.key(prompt) for key, prompt in prompts.items()}
+        batch_keys = {key: cache.key(prompt, batched=True) for key, prompt in prompts.items()}
+        lookup_keys = list(cache_keys.values())
+        if batch_prompts:
+            lookup_keys += batch_keys.values()
+        cached = cache.lookup(lookup_keys)
+        pending = []
+        tokens = 0
+        for item in items:
+            result = cached.get(cache_keys[id(item)])
+            if result is None and batch_prompts:
+                result = cached.get(batch_keys[id(item)])
+            if result is None:
+                pending.append(item)
+                continue
+            _apply_result(item, result)
+            tokens += saved_tokens(result)
+        hits = len(items) - len(pending)
+        if items:
+            logger.info(
+                f"摘要缓存命中 {hits}/{len(items)} ({hits / len(items):.0%})，节省约 {tokens} tokens"
+            )
+
+    # 合并请求：多条信息共用一份说明，按token预算打包
+    if batch_prompts and len(pending) > 1:
+        groups = plan_request_groups(
+            pending,
+            [summarizer.request_tokens(item) for item in pending],
+            max_items=config.get("batch_size", 10),
+            token_budget=config.get("batch_token_budget", 8000),
+            overhead=estimate_tokens(BATCH_SYSTEM_PROMPT),
+        )
+        logger.info(f"合并请求: {len(pending)} 条打包为 {len(groups)} 个请求")
+    else:
+        groups = [[item] for item in pending]
+
+    # LLM调用主要耗时在等待网络，按自适应并发并行执行
+    controller = AdaptiveConcurrency(
+        initial=config.get("initial_concurrency", 2),
+        minimum=config.get("min_concurrency", 1),
+        maximum=config.get("max_concurrency", 8),
+        target_latency=config.get("target_latency", 10.0),
+    )
+    retries = config.get("rate_limit_retries", 3)
+    telemetry = None
+    if store is not None and config.get("telemetry", True):
+        telemetry = LLMTelemetry(
+            run_id or new_run_id("summarize"), summarizer.provider, summarizer.model, tier=tier
+        )
+    with ThreadPoolExecutor(max_workers=controller.maximum) as executor:
+        outcomes = [
+            result
+            for group_outcomes in executor.map(
+                lambda group: _summarize_group(
+                    summarizer, group, controller, retries, fallback_enabled, telemetry
+                ),
+                groups,
+            )
+            for result in group_outcomes
+        ]
+    if telemetry is not None:
+        telemetry.save(store)
+
+    # 本次实际调用的token用量（含提供商前缀缓存命中的部分）
+    usages = [result.get("usage") or {} for result in outcomes if result is not None]
+    prompt_tokens = sum(usage.get("prompt_tokens", 0) for usage in usages)
+    if prompt_tokens:
+        cached_tokens = sum(usage.get("cached_tokens", 0) for usage in usages)
+        completion_tokens = sum(usage.get("completion_tokens", 0) for usage in usages)
+        logger.info(
+            f"LLM用量: 输入 {prompt_tokens} tokens（提供商缓存命中 {cached_tokens}，"
+            f"{cached_tokens / prompt_tokens:.0%}），输出 {completion_tokens} tokens"
+        )
+
+    # 只缓存成功解析的LLM结果（降级或解析失败的不缓存）
+    if cache is not None:
+        cache.save(
+            {
+                (batch_keys if result.get("batched") else cache_keys)[id(item)]: result
+                for item, result in zip(pending, outcomes)
+                if result is not None and not result.get("parse_failed")
+            }
+        )
+
+    success_count = len(items) - len(pending) + sum(result is not None for result in outcomes)
+    failed_count = len(items) - success_count
+
+    logger.info(f"摘要生成完成 ({tier}): 成功 {success_count}, 失败 {failed_count}")
 
     return items
 
 
-__all__ = ["LLMSummarizer", "ExtractiveSummarizer", "summarize_batch"]
+def submit_batch_jobs(items: List[Item], config: Dict[str, Any], store) -> List[str]:
+    """把待摘要条目提交到提供商的批处理接口（不等待结果）
+
+    已在未结束作业中的条目跳过，摘要缓存命中的条目直接写回。每个请求只含一条信息，
+    以摘要缓存键作为 custom_id，提示词相同的条目共用一个请求。
+
+    Args:
+        items: 入库的Item列表
+        config: LLM配置
+        store: Storage实例（记录作业、写回摘要）
+
+    Returns:
+        提交的作业ID列表
+    """
+    summarizer = LLMSummarizer(config)
+    backend = batch_backend(summarizer)
+    cache = SummaryCache(store, summarizer.provider, summarizer.model, summarizer.PROMPT_VERSION)
+
+    queued = {url for job in store.get_open_summary_batches() for url in job["entries"]}
+    pending = [item for item in items if item.url not in queued]
+    if len(pending) < len(items):
+        logger.info(f"{len(items) - len(pending)} 条已在未结束的批处理作业中，跳过")
+
+    cache_keys = {item.url: cache.key(summarizer.prompt_for(item)) for item in pending}
+    cached = cache.lookup(cache_keys.values())
+    hits = [item for item in pending if cache_keys[item.url] in cached]
+    for item in hits:
+        _apply_result(item, cached[cache_keys[item.url]])
+    if hits:
+        store.update_summaries(hits)
+        logger.info(f"摘要缓存命中 {len(hits)} 条，已直接写回")
+
+    requests: Dict[str, Tuple[str, str, int]] = {}
+    entries: Dict[str, str] = {}
+    for item in pending:
+        cache_key = cache_keys[item.url]
+        if cache_key in cached:
+            continue
+        if cache_key not in requests:
+            content = summarizer._build_content(item)
+            requests[cache_key] = (
+                SYSTEM_PROMPT,
+                summarizer._build_prompt(item, content),
+                summarizer.output_tokens(content),
+            )
+        entries[item.url] = cache_key
+
+    # 按提供商的单作业请求数上限拆分
+    max_requests = config.get("batch_api_max_requests", 10000)
+    custom_ids = list(requests)
+    job_ids = []
+    for start in range(0, len(custom_ids), max_requests):
+        chunk = set(custom_ids[start : start + max_requests])
+        job_id = backend.submit({custom_id: requests[custom_id] for custom_id in chunk})
+        job_entries = {url: key for url, key in entries.items() if key in chunk}
+        store.save_summary_batch(job_id, summarizer.provider, summarizer.model, job_entries)
+        job_ids.append(job_id)
+        logger.info(f"已提交批处理作业 {job_id}: {len(chunk)} 个请求，{len(job_entries)} 条")
+    return job_ids
+
+
+def collect_batch_results(config: Dict[str, Any], store, run_id: Optional[str] = None) -> int:
+    """轮询未结束的批处理作业，把已结束作业的结果写回条目和摘要缓存
+
+    失败、过期的请求对应的条目不写回，下次提交时重新进入作业。
+
+    Args:
+        config: LLM配置
+        store: Storage实例
+        run_id: 调用记录所属的运行ID，默认按当前时间生成
+
+    Returns:
+        写回摘要的条目数
+    """
+    jobs = store.get_open_summary_batches()
+    if not jobs:
+        return 0
+
+    summarizer = LLMSummarizer(config)
+    backend = batch_backend(summarizer)
+    applied = 0
+    run_id = run_id or new_run_id("summarize")
+    for job in jobs:
+        job_id = job["job_id"]
+        if job["provider"] != summarizer.provider:
+            logger.warning(
+                f"批处理作业 {job_id} 属于 {job['provider']}，当前提供商为 {summarizer.provider}，跳过"
+            )
+            continue
+
+        try:
+            status = backend.status(job_id)
+            if status == IN_PROGRESS:
+                logger.info(f"批处理作业 {job_id} 仍在处理中（提交于 {job['submitted_at']}）")
+                continue
+            responses = backend.results(job_id) if status == ENDED else {}
+        except Exception as e:
+            logger.warning(f"查询批处理作业 {job_id} 失败: {e}")
+            continue
+
+        # 批处理结果没有延迟数据，只记录token用量和解析失败
+        telemetry = LLMTelemetry(run_id, job["provider"], job["model"], mode="batch")
+        results = {}
+        for custom_id, (text, usage) in responses.items():
+            result = summarizer._parse_result(text)
+            result["usage"] = usage
+            results[custom_id] = result
+            parse_failures = int(bool(result.get("parse_failed")))
+            telemetry.record(1, None, usage=usage, parse_failures=parse_failures)
+        for custom_id in set(job["entries"].values()) - set(results):
+            telemetry.record(1, None, error=f"批处理请求未返回结果（作业状态: {status}）")
+        if config.get("telemetry", True):
+            telemetry.save(store)
+
+        items = store.get_items_by_urls(
+            url for url, cache_key in job["entries"].items() if cache_key in results
+        )
+        for url, item in items.items():
+            _apply_result(item, results[job["entries"][url]])
+        store.update_summaries(list(items.values()))
+        store.save_summary_cache(
+            {key: result for key, result in results.items() if not result.get("parse_failed")}
+        )
+        store.finish_summary_batch(job_id, status)
+        applied += len(items)
+        logger.info(f"批处理作业 {job_id} 已结束: 写回 {len(items)}/{len(job['entries'])} 条摘要")
+    return applied
+
+
+__all__ = [
+    "LLMSummarizer",
+    "ExtractiveSummarizer",
+    "collect_batch_results",
+    "new_run_id",
+    "route_by_score",
+    "submit_batch_jobs",
+    "summarize_batch",
+]
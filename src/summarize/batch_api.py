@@ -0,0 +1,176 @@
+"""提供商异步批处理接口（OpenAI Batch / Anthropic Message Batches）
+
+周报和历史回填不要求秒级返回：待摘要条目一次性提交到提供商的批处理接口，
+按批处理价格计费，也不占用实时接口的限流额度。作业ID记录在 SQLite，
+后续运行时轮询，结束后取回结果写回条目和摘要缓存。
+"""
+
+import json
+from typing import Dict, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger("summarize.batch_api")
+
+# 作业状态
+IN_PROGRESS = "in_progress"
+ENDED = "ended"
+FAILED = "failed"
+
+
+class BatchBackend:
+    """批处理接口基类
+
+    请求以 custom_id 标识，custom_id 由调用方保证在作业内唯一（使用摘要缓存键）。
+    """
+
+    def __init__(self, summarizer):
+        """初始化批处理接口
+
+        Args:
+            summarizer: LLMSummarizer实例（复用其客户端、请求参数和响应解析）
+        """
+        self.summarizer = summarizer
+        self.client = summarizer.client
+
+    def submit(self, requests: Dict[str, Tuple[str, str, int]]) -> str:
+        """提交批处理作业
+
+        Args:
+            requests: custom_id -> (系统提示词, 用户消息, 最大输出token数)
+
+        Returns:
+            作业ID
+        """
+        raise NotImplementedError
+
+    def status(self, job_id: str) -> str:
+        """查询作业状态
+
+        Args:
+            job_id: 作业ID
+
+        Returns:
+            IN_PROGRESS / ENDED / FAILED
+        """
+        raise NotImplementedError
+
+    def results(self, job_id: str) -> Dict[str, Tuple[str, Dict[str, int]]]:
+        """取回已结束作业的结果
+
+        Args:
+            job_id: 作业ID
+
+        Returns:
+            custom_id -> (模型输出文本, token用量)；失败或过期的请求不包含在内
+        """
+        raise NotImplementedError
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API：上传JSONL请求文件，结束后下载结果文件"""
+
+    ENDPOINT = "/v1/chat/completions"
+
+    def submit(self, requests: Dict[str, Tuple[str, str, int]]) -> str:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": self.ENDPOINT,
+                    "body": self.summarizer.request_params(system, prompt, max_tokens),
+                },
+                ensure_ascii=False,
+            )
+            for custom_id, (system, prompt, max_tokens) in requests.items()
+        ]
+        input_file = self.client.files.create(
+            file=("summaries.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id, endpoint=self.ENDPOINT, completion_window="24h"
+        )
+        return batch.id
+
+    def status(self, job_id: str) -> str:
+        status = self.client.batches.retrieve(job_id).status
+        # 过期或取消的作业仍可能有部分结果
+        if status in {"completed", "expired", "cancelled"}:
+            return ENDED
+        if status == "failed":
+            return FAILED
+        return IN_PROGRESS
+
+    def results(self, job_id: str) -> Dict[str, Tuple[str, Dict[str, int]]]:
+        batch = self.client.batches.retrieve(job_id)
+        if not batch.output_file_id:
+            return {}
+
+        results = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                continue
+            results[entry["custom_id"]] = self.summarizer.read_response(response["body"])
+        return results
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API"""
+
+    def submit(self, requests: Dict[str, Tuple[str, str, int]]) -> str:
+        batch = self.client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": self.summarizer.request_params(system, prompt, max_tokens),
+                }
+                for custom_id, (system, prompt, max_tokens) in requests.items()
+            ]
+        )
+        return batch.id
+
+    def status(self, job_id: str) -> str:
+        batch = self.client.messages.batches.retrieve(job_id)
+        return ENDED if batch.processing_status == "ended" else IN_PROGRESS
+
+    def results(self, job_id: str) -> Dict[str, Tuple[str, Dict[str, int]]]:
+        results = {}
+        for entry in self.client.messages.batches.results(job_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = self.summarizer.read_response(entry.result.message)
+        return results
+
+
+def batch_backend(summarizer) -> BatchBackend:
+    """按提供商选择批处理接口
+
+    Args:
+        summarizer: LLMSummarizer实例
+
+    Returns:
+        批处理接口
+
+    Raises:
+        ValueError: 提供商没有批处理接口（如 ollama）
+    """
+    if summarizer.provider in {"openai", "openai_compatible"}:
+        return OpenAIBatchBackend(summarizer)
+    if summarizer.provider == "anthropic":
+        return AnthropicBatchBackend(summarizer)
+    raise ValueError(f"{summarizer.provider} 不支持批处理接口")
+
+
+__all__ = [
+    "AnthropicBatchBackend",
+    "BatchBackend",
+    "ENDED",
+    "FAILED",
+    "IN_PROGRESS",
+    "OpenAIBatchBackend",
+    "batch_backend",
+]
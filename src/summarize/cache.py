@@ -0,0 +1,82 @@
+"""LLM摘要缓存
+
+以「发给模型的提示词内容 + 提供商 + 模型 + 提示词模板版本」的哈希为键，把摘要结果持久化到 SQLite。
+同一篇文章换了URL、失败后重跑、周报实时采集回退等情况下，提示词相同就直接复用，不再调用模型。
+修改提示词模板时提升 LLMSummarizer.PROMPT_VERSION，旧缓存自然失效。
+合并请求（batch_prompts）的输出来自另一份提示词，与单条请求的结果不等价，使用单独的缓存键。
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable
+
+from ..utils.logger import get_logger
+
+logger = get_logger("summarize.cache")
+
+
+class SummaryCache:
+    """摘要结果缓存"""
+
+    def __init__(self, store, provider: str, model: str, prompt_version: str):
+        """初始化摘要缓存
+
+        Args:
+            store: Storage实例
+            provider: LLM提供商
+            model: 模型名
+            prompt_version: 提示词模板版本
+        """
+        self.store = store
+        self.provider = provider
+        self.model = model
+        self.prompt_version = prompt_version
+
+    def key(self, prompt: str, batched: bool = False) -> str:
+        """计算缓存键
+
+        Args:
+            prompt: 发给模型的完整提示词（单条请求的提示词）
+            batched: 是否为合并请求的结果
+
+        Returns:
+            SHA256哈希
+        """
+        parts = [self.provider, self.model, self.prompt_version, prompt]
+        if batched:
+            parts.append("batch")
+        payload = json.dumps(parts, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """批量查询缓存
+
+        Args:
+            keys: 缓存键列表
+
+        Returns:
+            命中的 缓存键 -> 摘要结果
+        """
+        return self.store.get_summary_cache(keys)
+
+    def save(self, entries: Dict[str, Dict[str, Any]]) -> int:
+        """保存摘要结果
+
+        Args:
+            entries: 缓存键 -> 摘要结果
+
+        Returns:
+            保存的数量
+        """
+        if not entries:
+            return 0
+        return self.store.save_summary_cache(entries)
+
+
+def saved_tokens(result: Dict[str, Any]) -> int:
+    """缓存命中节省的token数（生成该结果时的提示词与输出token）"""
+    usage = result.get("usage") or {}
+    return int(usage.get("prompt_tokens", 0)) + int(usage.get("completion_tokens", 0))
+
+
+__all__ = ["SummaryCache", "saved_tokens"]
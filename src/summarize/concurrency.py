@@ -0,0 +1,148 @@
+"""LLM 调用的自适应并发控制
+
+AIMD（加性增、乘性减）：延迟正常时每完成约一个并发窗口的请求，并发上限 +1；
+遇到限流（429 / Retry-After）时上限减半，并让所有线程暂停到服务端要求的时间之后。
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("summarize.concurrency")
+
+# 限流但没有 Retry-After 时的默认等待秒数
+DEFAULT_RETRY_AFTER = 2.0
+
+
+class AdaptiveConcurrency:
+    """AIMD 并发控制器（线程安全）"""
+
+    def __init__(
+        self,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = 8,
+        target_latency: float = 10.0,
+    ):
+        """初始化控制器
+
+        Args:
+            initial: 初始并发数
+            minimum: 并发下限
+            maximum: 并发上限
+            target_latency: 单次调用的目标延迟（秒），超过时不再增加并发
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self.target_latency = target_latency
+        self.in_flight = 0
+
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """等待一个并发名额（限流冷却期间阻塞）"""
+        with self._condition:
+            while True:
+                wait = self._resume_at - time.monotonic()
+                if wait > 0:
+                    self._condition.wait(wait)
+                elif self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                else:
+                    self._condition.wait()
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        error: bool = False,
+        retry_after: Optional[float] = None,
+    ):
+        """归还名额并根据调用结果调整并发
+
+        Args:
+            latency: 成功调用的耗时（秒）
+            error: 调用是否失败
+            retry_after: 被限流时服务端要求等待的秒数
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if retry_after is not None:
+                self.limit = max(self.minimum, self.limit // 2)
+                self._successes = 0
+                self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+                logger.warning(f"LLM调用被限流，并发降为 {self.limit}，暂停 {retry_after:.1f} 秒")
+            elif error or latency is None or latency > self.target_latency:
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+                    logger.debug(f"LLM调用延迟正常，并发升为 {self.limit}")
+            self._condition.notify_all()
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """从异常中识别限流并读取需要等待的秒数
+
+    兼容 openai/anthropic SDK 的 APIStatusError（status_code + response.headers）
+    和 requests 的 HTTPError（response.status_code + response.headers）。
+
+    Args:
+        error: 调用LLM时抛出的异常
+
+    Returns:
+        被限流时返回等待秒数，其他错误返回None
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    headers = getattr(response, "headers", None) or {}
+
+    retry_after = _header(headers, "retry-after-ms")
+    delay = _parse_seconds(retry_after, scale=0.001) if retry_after else None
+    if delay is None:
+        retry_after = _header(headers, "retry-after")
+        delay = _parse_seconds(retry_after) if retry_after else None
+
+    if status == 429:
+        return delay if delay is not None else DEFAULT_RETRY_AFTER
+    if status == 503 and delay is not None:
+        return delay
+    return None
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """大小写不敏感地读取响应头"""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if value is None and isinstance(headers, dict):
+        value = next((v for k, v in headers.items() if str(k).lower() == name), None)
+    return value
+
+
+def _parse_seconds(value: str, scale: float = 1.0) -> Optional[float]:
+    """解析 Retry-After（秒数或 HTTP 日期）"""
+    try:
+        return max(0.0, float(value) * scale)
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+__all__ = ["AdaptiveConcurrency", "DEFAULT_RETRY_AFTER", "retry_after_seconds"]
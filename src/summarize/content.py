@@ -0,0 +1,100 @@
+"""按token预算选取送给LLM的正文
+
+长文章只截前几千字符会漏掉后面的关键信息，短的发布说明又常带大量模板文字。
+这里保留首段（通常交代了是什么），其余句子按命中评分关键词的数量排序，
+在token预算内选取，最后按原文顺序拼接。
+"""
+
+import re
+from typing import List, Optional
+
+from ..utils.keywords import KeywordMatcher
+from .tokens import estimate_tokens
+
+# 句子切分：中英文句末标点之后，或换行处
+_SENTENCE_RE = re.compile(r"(?<=[。！？!?；;])|(?<=\.)\s+|\n+")
+_SPACE_RE = re.compile(r"[ \t\r\f\v]+")
+
+
+def _paragraphs(text: str) -> List[str]:
+    """按空行切分段落并压缩空白"""
+    paragraphs = []
+    for block in re.split(r"\n\s*\n", text):
+        block = _SPACE_RE.sub(" ", block).strip()
+        if block:
+            paragraphs.append(block)
+    return paragraphs
+
+
+def _truncate(text: str, token_budget: int) -> str:
+    """按token预算截断（按句子，不足一句时按字符）"""
+    selected = []
+    used = 0
+    for sentence in _SENTENCE_RE.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        tokens = estimate_tokens(sentence)
+        if used + tokens > token_budget:
+            break
+        selected.append(sentence)
+        used += tokens
+    if selected:
+        return " ".join(selected)
+    # 首句就超出预算：按估算比例截断字符
+    ratio = token_budget / max(1, estimate_tokens(text))
+    return text[: max(1, int(len(text) * ratio))]
+
+
+def select_content(text: str, token_budget: int, keywords: Optional[KeywordMatcher] = None) -> str:
+    """在token预算内选取正文
+
+    Args:
+        text: 原始正文
+        token_budget: token预算
+        keywords: 评分关键词匹配器，为空时只按原文顺序选取
+
+    Returns:
+        选取后的正文（未超预算时为压缩空白后的原文）
+    """
+    paragraphs = _paragraphs(text)
+    if not paragraphs:
+        return ""
+    compact = "\n\n".join(paragraphs)
+    if estimate_tokens(compact) <= token_budget:
+        return compact
+
+    # 首段
+    lead = _truncate(paragraphs[0], token_budget)
+    remaining = token_budget - estimate_tokens(lead)
+
+    # 其余句子去重后按关键词命中数排序（同分时靠前的优先）
+    sentences = []
+    seen = set()
+    for paragraph in paragraphs[1:]:
+        for sentence in _SENTENCE_RE.split(paragraph):
+            sentence = sentence.strip()
+            if len(sentence) < 10 or sentence in seen:
+                continue
+            seen.add(sentence)
+            sentences.append(sentence)
+
+    def hits(sentence: str) -> int:
+        return len(keywords.find(sentence.lower())) if keywords else 0
+
+    ranked = sorted(range(len(sentences)), key=lambda index: (-hits(sentences[index]), index))
+    chosen = []
+    for index in ranked:
+        tokens = estimate_tokens(sentences[index])
+        if tokens > remaining:
+            continue
+        chosen.append(index)
+        remaining -= tokens
+        if remaining <= 0:
+            break
+
+    body = " ".join(sentences[index] for index in sorted(chosen))
+    return f"{lead}\n\n{body}" if body else lead
+
+
+__all__ = ["select_content"]
@@ -0,0 +1,147 @@
+"""多个 Ollama 服务的连接池
+
+每个服务一个 requests.Session（复用连接），请求发往未完成请求数最少的健康服务；
+超时或连接失败时把该服务标记为不可用并切换到其他服务，冷却期过后先做健康检查再恢复使用。
+请求带 keep_alive，使模型在两次运行之间保持加载。
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..utils.logger import get_logger
+
+logger = get_logger("summarize.ollama_pool")
+
+
+@dataclass
+class OllamaEndpoint:
+    """单个 Ollama 服务"""
+
+    base_url: str
+    session: requests.Session = field(default_factory=requests.Session)
+    outstanding: int = 0
+    down_until: float = 0.0
+
+
+class OllamaPool:
+    """Ollama 服务池（线程安全）"""
+
+    def __init__(
+        self,
+        base_urls: List[str],
+        timeout: float = 30,
+        keep_alive: Optional[str] = "30m",
+        retry_interval: float = 30.0,
+        pool_size: int = 8,
+    ):
+        """初始化服务池
+
+        Args:
+            base_urls: 服务地址列表
+            timeout: 单次请求超时（秒）
+            keep_alive: 请求完成后模型保持加载的时间，为空时使用服务端默认值
+            retry_interval: 服务失败后的冷却时间（秒），之后通过健康检查再恢复
+            pool_size: 每个服务的连接池大小
+        """
+        if not base_urls:
+            raise ValueError("至少需要一个 Ollama 地址")
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.retry_interval = retry_interval
+        self.endpoints = []
+        for base_url in dict.fromkeys(url.rstrip("/") for url in base_urls):
+            endpoint = OllamaEndpoint(base_url)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            endpoint.session.mount("http://", adapter)
+            endpoint.session.mount("https://", adapter)
+            self.endpoints.append(endpoint)
+        self._lock = threading.Lock()
+
+    def post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """发送请求，超时或连接失败时切换到其他服务
+
+        Args:
+            path: 接口路径，如 /api/chat
+            payload: 请求体
+
+        Returns:
+            响应JSON
+
+        Raises:
+            requests.RequestException: 所有服务都失败，或服务返回错误状态码
+        """
+        if self.keep_alive:
+            payload = {**payload, "keep_alive": self.keep_alive}
+
+        tried: Set[str] = set()
+        while True:
+            endpoint = self._acquire(tried)
+            try:
+                response = endpoint.session.post(
+                    f"{endpoint.base_url}{path}", json=payload, timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
+            except (requests.Timeout, requests.ConnectionError) as e:
+                tried.add(endpoint.base_url)
+                self._mark_down(endpoint)
+                if len(tried) >= len(self.endpoints):
+                    raise
+                logger.warning(f"Ollama服务 {endpoint.base_url} 请求失败，切换到其他服务: {e}")
+            finally:
+                with self._lock:
+                    endpoint.outstanding -= 1
+
+    def _acquire(self, tried: Set[str]) -> OllamaEndpoint:
+        """选择未完成请求数最少的可用服务并占用一个请求
+
+        冷却期已过的服务先做健康检查；没有可用服务时仍选择未尝试过的服务，让请求自己报错。
+        """
+        now = time.monotonic()
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.base_url not in tried]
+        with self._lock:
+            recovering = [endpoint for endpoint in candidates if 0 < endpoint.down_until <= now]
+            # 顺延冷却期，避免多个线程同时检查同一个服务
+            for endpoint in recovering:
+                endpoint.down_until = now + self.retry_interval
+        for endpoint in recovering:
+            if self.check(endpoint):
+                with self._lock:
+                    endpoint.down_until = 0.0
+                logger.info(f"Ollama服务 {endpoint.base_url} 已恢复")
+
+        with self._lock:
+            healthy = [endpoint for endpoint in candidates if endpoint.down_until == 0.0]
+            endpoint = min(healthy or candidates, key=lambda endpoint: endpoint.outstanding)
+            endpoint.outstanding += 1
+        return endpoint
+
+    def _mark_down(self, endpoint: OllamaEndpoint):
+        """把服务标记为不可用，冷却期后再做健康检查"""
+        with self._lock:
+            endpoint.down_until = time.monotonic() + self.retry_interval
+
+    def check(self, endpoint: OllamaEndpoint) -> bool:
+        """健康检查（GET /api/tags）
+
+        Args:
+            endpoint: 服务
+
+        Returns:
+            服务是否可用
+        """
+        try:
+            response = endpoint.session.get(
+                f"{endpoint.base_url}/api/tags", timeout=min(5.0, self.timeout)
+            )
+            return response.ok
+        except requests.RequestException:
+            return False
+
+
+__all__ = ["OllamaEndpoint", "OllamaPool"]
@@ -0,0 +1,264 @@
+"""LLM调用遥测
+
+每次LLM调用（单条、合并请求、批处理接口结果）记录提供商、模型、token用量、延迟、
+限流重试次数和解析失败数，运行结束后写入 SQLite 的 llm_calls 表。
+`python -m src.main llm-report` 按运行、层级、模型汇总 p50/p95 延迟和费用，用于比较模型或提示词改动前后的变化。
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..utils.logger import get_logger
+
+logger = get_logger("summarize.telemetry")
+
+# 批处理接口的默认价格折扣（OpenAI / Anthropic 均为实时价格的一半）
+DEFAULT_BATCH_DISCOUNT = 0.5
+# 未配置 cache_write 价格时，写入提示词缓存的token按输入价格的倍数计费（Anthropic 为1.25倍）
+DEFAULT_CACHE_WRITE_MULTIPLIER = 1.25
+
+
+def new_run_id(run_type: str, started_at: Optional[datetime] = None) -> str:
+    """生成运行ID
+
+    Args:
+        run_type: 运行类型（daily / weekly / summarize）
+        started_at: 运行开始时间，默认当前时间
+
+    Returns:
+        形如 daily-20260419-080000 的运行ID
+    """
+    return f"{run_type}-{(started_at or datetime.now()):%Y%m%d-%H%M%S}"
+
+
+class LLMTelemetry:
+    """一次运行中的LLM调用记录（线程安全）"""
+
+    def __init__(
+        self,
+        run_id: str,
+        provider: str,
+        model: str,
+        mode: str = "realtime",
+        tier: str = "default",
+    ):
+        """初始化调用记录
+
+        Args:
+            run_id: 运行ID
+            provider: LLM提供商
+            model: 模型名
+            mode: 调用方式（realtime / batch；分级路由中未调用模型的条目为 extractive）
+            tier: 分级路由的层级（未启用路由时为 default）
+        """
+        self.run_id = run_id
+        self.provider = provider
+        self.model = model
+        self.mode = mode
+        self.tier = tier
+        self.calls: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        items: int,
+        latency: Optional[float],
+        retries: int = 0,
+        usage: Optional[Dict[str, int]] = None,
+        parse_failures: int = 0,
+        error: Optional[str] = None,
+    ):
+        """记录一次调用
+
+        Args:
+            items: 请求包含的条目数
+            latency: 最后一次尝试的耗时（秒），批处理结果为None
+            retries: 被限流后的重试次数
+            usage: token用量
+            parse_failures: 输出无法解析或缺失的条目数
+            error: 调用最终失败时的错误信息
+        """
+        usage = usage or {}
+        call = {
+            "run_id": self.run_id,
+            "provider": self.provider,
+            "model": self.model,
+            "mode": self.mode,
+            "tier": self.tier,
+            "items": items,
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "cached_tokens": usage.get("cached_tokens", 0),
+            "cache_write_tokens": usage.get("cache_write_tokens", 0),
+            "latency": latency,
+            "retries": retries,
+            "parse_failures": parse_failures,
+            "error": error,
+            "created_at": datetime.now().isoformat(),
+        }
+        with self._lock:
+            self.calls.append(call)
+
+    def save(self, store) -> int:
+        """写入 Storage
+
+        Args:
+            store: Storage实例
+
+        Returns:
+            保存的记录数
+        """
+        with self._lock:
+            calls, self.calls = self.calls, []
+        return store.save_llm_calls(calls) if calls else 0
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """线性插值百分位数
+
+    Args:
+        values: 数值列表
+        q: 百分位（0-100）
+
+    Returns:
+        百分位数，列表为空时返回None
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def call_cost(
+    call: Dict[str, Any],
+    pricing: Dict[str, Any],
+    batch_discount: float = DEFAULT_BATCH_DISCOUNT,
+) -> Optional[float]:
+    """计算一次调用的费用
+
+    Args:
+        call: 调用记录
+        pricing: 模型名 -> 每百万token价格（input / cached_input / cache_write / output）；
+            未配置 cached_input 时按 input 计，未配置 cache_write 时按 input 的1.25倍计
+        batch_discount: 批处理接口相对实时接口的价格系数
+
+    Returns:
+        费用（抽取式摘要为0），模型未配置价格时返回None
+    """
+    if call["mode"] == "extractive":
+        return 0.0
+    prices = pricing.get(call["model"])
+    if not isinstance(prices, dict):
+        return None
+    input_price = prices.get("input", 0)
+    cached = call["cached_tokens"] or 0
+    written = call["cache_write_tokens"] or 0
+    uncached = max(0, (call["prompt_tokens"] or 0) - cached - written)
+    cost = (
+        uncached * input_price
+        + cached * prices.get("cached_input", input_price)
+        + written * prices.get("cache_write", input_price * DEFAULT_CACHE_WRITE_MULTIPLIER)
+        + (call["completion_tokens"] or 0) * prices.get("output", 0)
+    ) / 1_000_000
+    if call["mode"] == "batch":
+        cost *= batch_discount
+    return cost
+
+
+def summarize_calls(
+    calls: Iterable[Dict[str, Any]],
+    pricing: Dict[str, Any],
+    group_by: Sequence[str] = ("run_id", "tier", "model"),
+    batch_discount: float = DEFAULT_BATCH_DISCOUNT,
+) -> List[Dict[str, Any]]:
+    """按运行、层级、模型汇总调用记录
+
+    Args:
+        calls: 调用记录
+        pricing: 价格配置（见 call_cost）
+        group_by: 分组字段
+        batch_discount: 批处理接口相对实时接口的价格系数
+
+    Returns:
+        每组一行：调用数、条目数、失败数、解析失败数、重试数、token用量、p50/p95延迟、费用
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for call in calls:
+        groups.setdefault(tuple(call[name] for name in group_by), []).append(call)
+
+    rows = []
+    for key, members in groups.items():
+        latencies = [
+            call["latency"] for call in members if call["latency"] is not None and not call["error"]
+        ]
+        costs = [call_cost(call, pricing, batch_discount) for call in members]
+        row = dict(zip(group_by, key))
+        row.update(
+            {
+                "calls": len(members),
+                "items": sum(call["items"] for call in members),
+                "errors": sum(bool(call["error"]) for call in members),
+                "parse_failures": sum(call["parse_failures"] for call in members),
+                "retries": sum(call["retries"] for call in members),
+                "prompt_tokens": sum(call["prompt_tokens"] for call in members),
+                "cached_tokens": sum(call["cached_tokens"] for call in members),
+                "cache_write_tokens": sum(call["cache_write_tokens"] for call in members),
+                "completion_tokens": sum(call["completion_tokens"] for call in members),
+                "p50_latency": percentile(latencies, 50),
+                "p95_latency": percentile(latencies, 95),
+                "cost": None if any(cost is None for cost in costs) else sum(costs),
+            }
+        )
+        rows.append(row)
+    return rows
+
+
+def format_report(
+    rows: List[Dict[str, Any]], group_by: Sequence[str] = ("run_id", "tier", "model")
+) -> str:
+    """格式化汇总表格
+
+    Args:
+        rows: summarize_calls 的结果
+        group_by: 分组字段
+
+    Returns:
+        表格文本
+    """
+
+    def seconds(value):
+        return f"{value:>7.2f}" if value is not None else f"{'-':>7}"
+
+    header = (
+        " ".join(f"{name:<24}" for name in group_by)
+        + f" {'calls':>6} {'items':>6} {'errors':>6} {'parse':>6} {'retry':>6}"
+        + f" {'input':>10} {'cached':>10} {'written':>10} {'output':>10}"
+        + f" {'p50(s)':>7} {'p95(s)':>7} {'cost':>9}"
+    )
+    lines = [header]
+    for row in rows:
+        cost = f"{row['cost']:>9.4f}" if row["cost"] is not None else f"{'-':>9}"
+        lines.append(
+            " ".join(f"{str(row[name]):<24}" for name in group_by)
+            + f" {row['calls']:>6} {row['items']:>6} {row['errors']:>6} {row['parse_failures']:>6}"
+            + f" {row['retries']:>6} {row['prompt_tokens']:>10} {row['cached_tokens']:>10}"
+            + f" {row['cache_write_tokens']:>10} {row['completion_tokens']:>10}"
+            + f" {seconds(row['p50_latency'])} {seconds(row['p95_latency'])} {cost}"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DEFAULT_BATCH_DISCOUNT",
+    "DEFAULT_CACHE_WRITE_MULTIPLIER",
+    "LLMTelemetry",
+    "call_cost",
+    "format_report",
+    "new_run_id",
+    "percentile",
+    "summarize_calls",
+]
@@ -0,0 +1,29 @@
+"""token数估算
+
+不依赖具体模型的分词器：中日韩字符大约每字1个token，其余文本大约每4个字符1个token。
+只用于请求打包和预算控制，不要求精确。
+"""
+
+import re
+
+_CJK_RE = re.compile(
+    r"[\u3000-\u303f\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uff00-\uffef]"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """估算文本的token数
+
+    Args:
+        text: 文本
+
+    Returns:
+        估算的token数
+    """
+    if not text:
+        return 0
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+__all__ = ["estimate_tokens"]
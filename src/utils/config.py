@@ -1,6 +1,7 @@
 """配置加载工具"""
 
 import os
+import re
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -11,6 +12,25 @@ from .logger import get_logger
 logger = get_logger("utils.config")
 
 
+def compile_topic_patterns(topic_name: str, patterns: List[str]) -> List[re.Pattern]:
+    """逐个编译主题正则（不区分大小写），无效的正则报告后跳过
+
+    Args:
+        topic_name: 主题名
+        patterns: 正则表达式列表
+
+    Returns:
+        编译成功的正则列表（保持原顺序）
+    """
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except (re.error, TypeError) as e:
+            logger.warning(f"主题 '{topic_name}' 的正则表达式无效，已忽略 '{pattern}': {e}")
+    return compiled
+
+
 class Config:
     """配置管理器"""
 
@@ -77,12 +97,24 @@ class Config:
                     for topic in topics:
                         topic["category"] = category
                     self.topics.extend(topics)
+            self._validate_topic_patterns()
             logger.info(f"已加载 {len(self.topics)} 个主题")
 
         # 加载rules.yaml
         self.rules = self._load_yaml("rules.yaml") or {}
         logger.info("已加载评分与过滤规则")
 
+    def _validate_topic_patterns(self):
+        """校验主题正则表达式
+
+        无效的正则在启动时报告一次并从配置中移除，主题匹配器编译时不会再遇到它们。
+        """
+        for topic in self.topics:
+            patterns = topic.get("patterns") or []
+            compiled = compile_topic_patterns(topic.get("name"), patterns)
+            if len(compiled) != len(patterns):
+                topic["patterns"] = [regex.pattern for regex in compiled]
+
     def get_enabled_sources(self) -> List[Dict[str, Any]]:
         """获取已启用的信息源
 
@@ -179,6 +211,16 @@ class Config:
         if env_model:
             llm_config["model"] = env_model
 
+        # 选取送给LLM的正文时优先保留命中评分关键词的句子
+        if "content_keywords" not in llm_config:
+            scoring_config = self.get_scoring_config()
+            llm_config["content_keywords"] = [
+                keyword
+                for section in ("research_keywords", "engineering_keywords")
+                for keywords in (scoring_config.get(section) or {}).values()
+                for keyword in keywords or []
+            ]
+
         provider = llm_config.get("provider")
 
         # 从环境变量读取API密钥 / 地址
@@ -206,7 +248,10 @@ class Config:
             temperature = os.getenv("OLLAMA_TEMPERATURE")
             max_tokens = os.getenv("OLLAMA_MODEL_TOKENS")
             if base_url:
-                llm_config["base_url"] = base_url
+                # 逗号分隔多个服务地址
+                base_urls = [url.strip() for url in base_url.split(",") if url.strip()]
+                llm_config["base_url"] = base_urls[0]
+                llm_config["base_urls"] = base_urls
             if model:
                 llm_config["model"] = model
             if temperature:
@@ -0,0 +1,159 @@
+"""条目 × 关键词稀疏命中矩阵
+
+回填或周报重评分时一次要处理上万条数据。这里把每条文本单遍扫描得到的关键词命中
+组装成 CSR 稀疏矩阵，主题标签、研究/工程关键词得分、偏好命中都可以用矩阵乘法
+一次算出，而不必对每个条目逐个关键词循环。
+
+依赖 NumPy/SciPy（可选依赖，``pip install .[batch]``），未安装时调用方退回逐条路径。
+"""
+
+from typing import Dict, Iterable, List, Sequence
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - exercised only when dependency is missing
+    np = None
+    sparse = None
+
+from .keywords import SUBSTRING_MAX_KEYWORDS, KeywordMatcher
+
+# 批量条目数达到该值才走矩阵路径（小批量时构建矩阵的固定开销不划算）
+MATRIX_MIN_ITEMS = 200
+
+
+def matrix_available() -> bool:
+    """NumPy/SciPy 是否可用"""
+    return np is not None and sparse is not None
+
+
+def use_matrix(count: int) -> bool:
+    """判断一批条目是否应走矩阵路径
+
+    Args:
+        count: 条目数
+
+    Returns:
+        依赖可用且条目数达到阈值时为True
+    """
+    return matrix_available() and count >= MATRIX_MIN_ITEMS
+
+
+class KeywordMatrix:
+    """关键词命中矩阵构建器
+
+    列按 KeywordMatcher.keywords 的顺序排列（小写、去重、排序）。
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """初始化矩阵构建器
+
+        Args:
+            keywords: 关键词列表（内部统一转小写）
+
+        Raises:
+            RuntimeError: NumPy/SciPy 未安装
+        """
+        if not matrix_available():
+            raise RuntimeError("KeywordMatrix 需要 numpy 和 scipy，请安装: pip install .[batch]")
+        self.matcher = KeywordMatcher(keywords)
+        self.columns: Dict[str, int] = {
+            keyword: index for index, keyword in enumerate(self.matcher.keywords)
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def hits(self, texts_lower: Sequence[str]):
+        """构建命中矩阵
+
+        Args:
+            texts_lower: 已转小写的文本列表
+
+        Returns:
+            形状为 (文本数, 关键词数) 的 CSR 矩阵，命中为1
+        """
+        shape = (len(texts_lower), len(self.columns))
+        indptr = [0]
+        indices: List[int] = []
+
+        if len(self.columns) <= SUBSTRING_MAX_KEYWORDS:
+            # 按列构建: 每个关键词一次列表推导
+            for keyword in self.matcher.keywords:
+                indices.extend(row for row, text in enumerate(texts_lower) if keyword in text)
+                indptr.append(len(indices))
+            layout = sparse.csc_matrix
+        else:
+            # 按行构建: 每条文本单遍扫描
+            columns = self.columns
+            for text in texts_lower:
+                indices.extend(sorted(columns[keyword] for keyword in self.matcher.find(text)))
+                indptr.append(len(indices))
+            layout = sparse.csr_matrix
+
+        data = np.ones(len(indices), dtype=np.float64)
+        matrix = layout(
+            (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+            shape=shape,
+        )
+        return matrix.tocsr()
+
+    def weights(self, weighted_keywords: Iterable) -> "np.ndarray":
+        """构建关键词权重向量
+
+        同一关键词出现多次时权重累加，与逐个关键词累加得分的结果一致。
+
+        Args:
+            weighted_keywords: (关键词, 权重) 序列
+
+        Returns:
+            长度为关键词数的权重向量
+        """
+        vector = np.zeros(len(self.columns), dtype=np.float64)
+        for keyword, weight in weighted_keywords:
+            keyword = str(keyword).lower()
+            if keyword in self.columns:
+                vector[self.columns[keyword]] += weight
+        return vector
+
+    def indicator(self, keywords: Iterable[str]) -> "np.ndarray":
+        """构建关键词指示向量（命中任一关键词即可）
+
+        Args:
+            keywords: 关键词列表
+
+        Returns:
+            长度为关键词数的0/1向量
+        """
+        vector = np.zeros(len(self.columns), dtype=np.float64)
+        for keyword in keywords:
+            keyword = str(keyword).lower()
+            if keyword in self.columns:
+                vector[self.columns[keyword]] = 1.0
+        return vector
+
+    def incidence(self, groups: Dict[str, Iterable[str]], names: Sequence[str]):
+        """构建关键词 × 分组关联矩阵
+
+        Args:
+            groups: 关键词 -> 所属分组名列表
+            names: 分组名顺序（矩阵的列）
+
+        Returns:
+            形状为 (关键词数, 分组数) 的 CSR 矩阵
+        """
+        positions = {name: index for index, name in enumerate(names)}
+        rows, cols = [], []
+        for keyword, members in groups.items():
+            row = self.columns.get(str(keyword).lower())
+            if row is None:
+                continue
+            for name in members:
+                if name in positions:
+                    rows.append(row)
+                    cols.append(positions[name])
+        data = np.ones(len(rows), dtype=np.float64)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(self.columns), len(names)))
+
+
+__all__ = ["KeywordMatrix", "MATRIX_MIN_ITEMS", "matrix_available", "use_matrix"]
@@ -0,0 +1,96 @@
+"""多关键词匹配工具"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# 关键词不超过该数量时逐个做子串查找（C 实现的子串搜索对短文本、少量关键词更快），
+# 超过时用字典树正则单遍扫描
+SUBSTRING_MAX_KEYWORDS = 100
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    """把字典树节点转换为正则片段（较长分支优先）"""
+    is_end = "" in node
+    branches = [
+        re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char
+    ]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if is_end:
+        body = "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    """多关键词单遍匹配器
+
+    所有关键词编译为按字典树组织的一个正则（与 Aho-Corasick 一样共享公共前缀），
+    在文本上只扫描一遍，耗时与文本长度相关而与关键词数量基本无关。
+    每个起始位置取最长匹配，同一位置上更短的关键词一定是它的前缀，通过前缀闭包补全，
+    因此结果与逐个执行 ``keyword in text`` 完全一致。
+    关键词较少时正则逐位置尝试的开销反而更大，此时直接逐个子串查找。
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """初始化匹配器
+
+        Args:
+            keywords: 关键词列表（内部统一转小写，空关键词会被忽略）
+        """
+        self.keywords: List[str] = sorted({str(k).lower() for k in keywords if str(k)})
+        self._substring = len(self.keywords) <= SUBSTRING_MAX_KEYWORDS
+        self._closure: Dict[str, frozenset] = {}
+        self._pattern: Optional[re.Pattern] = None
+        if self._substring or not self.keywords:
+            return
+
+        trie: Dict[str, dict] = {}
+        for keyword in self.keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        # 前缀闭包: 关键词 -> 所有作为其前缀的关键词（含自身）
+        for keyword in self.keywords:
+            node = trie
+            prefixes = []
+            for index, char in enumerate(keyword, 1):
+                node = node[char]
+                if "" in node:
+                    prefixes.append(keyword[:index])
+            self._closure[keyword] = frozenset(prefixes)
+
+        self._pattern = re.compile(_trie_pattern(trie))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> Set[str]:
+        """查找文本中出现的所有关键词
+
+        Args:
+            text: 已转小写的文本
+
+        Returns:
+            命中的关键词集合（小写）
+        """
+        if self._substring:
+            return {keyword for keyword in self.keywords if keyword in text}
+
+        hits: Set[str] = set()
+        if self._pattern is None or not text:
+            return hits
+
+        search = self._pattern.search
+        position = 0
+        while True:
+            match = search(text, position)
+            if match is None:
+                return hits
+            hits.update(self._closure[match.group()])
+            position = match.start() + 1
+
+
+__all__ = ["KeywordMatcher", "SUBSTRING_MAX_KEYWORDS"]
@@ -0,0 +1,186 @@
+from datetime import datetime
+
+import pytest
+
+from src.classify import classify_item, get_topic_matcher
+from src.ingest.models import Item
+from src.utils import Config
+from src.utils.keywords import KeywordMatcher
+
+TOPICS = [
+    {"name": "LLM", "keywords": ["LLM", "gpt", "GPT-4o"], "patterns": ["Claude [0-9]"]},
+    {"name": "Inference", "keywords": ["inference", "vLLM", "serving"]},
+    {"name": "Agent", "keywords": ["agent"], "patterns": ["ReAct"]},
+]
+
+
+def _item(title: str, content: str = "") -> Item:
+    return Item(
+        url="https://example.com/a",
+        title=title,
+        published=datetime(2026, 4, 9),
+        source="Example",
+        content=content,
+    )
+
+
+def test_keyword_matcher_matches_substring_semantics():
+    keywords = ["api", "gpt", "gpt-4o", "llm inference", "inference", "ference"]
+    text = "new gpt-4o capital llm inference engine"
+    expected = {k for k in keywords if k in text}
+
+    assert KeywordMatcher(keywords).find(text) == expected
+    # 关键词较多时走字典树正则路径，结果应一致
+    padding = [f"unused-keyword-{i}" for i in range(150)]
+    assert KeywordMatcher(keywords + padding).find(text) == expected
+
+
+def test_classify_item_single_pass_matches_keywords_and_patterns():
+    item = _item("vLLM adds serving support for Claude 4", "A ReAct style agent demo.")
+
+    assert sorted(classify_item(item, TOPICS)) == ["Agent", "Inference", "LLM"]
+
+
+def test_topic_matcher_is_cached_per_config_version():
+    first = get_topic_matcher(TOPICS)
+
+    assert get_topic_matcher([dict(topic) for topic in TOPICS]) is first
+
+    changed = [dict(topic) for topic in TOPICS]
+    changed[1] = {"name": "Inference", "keywords": ["inference", "tensorrt"]}
+    assert get_topic_matcher(changed) is not first
+
+
+def test_invalid_patterns_are_reported_once_and_skipped(caplog):
+    topics = [{"name": "Broken", "keywords": ["zzz"], "patterns": ["[unclosed", "Claude [0-9]"]}]
+    matcher = get_topic_matcher(topics)
+
+    for _ in range(3):
+        assert classify_item(_item("Claude 4 is here"), topics, matcher) == ["Broken"]
+
+    warnings = [r for r in caplog.records if "[unclosed" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_config_validates_patterns_once_for_matcher(tmp_path, caplog):
+    (tmp_path / "topics.yaml").write_text(
+        "models:\n  - name: Broken\n    patterns: ['[unclosed', 'Claude [0-9]']\n",
+        encoding="utf-8",
+    )
+    config = Config(str(tmp_path))
+
+    assert config.topics[0]["patterns"] == ["Claude [0-9]"]
+    for _ in range(3):
+        assert classify_item(_item("Claude 4 is here"), config.topics) == ["Broken"]
+
+    warnings = [r for r in caplog.records if "[unclosed" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_patterns_with_backreferences_are_not_merged():
+    topics = [{"name": "Repeat", "patterns": ["(ab)x", r"(\w+) \1"]}]
+
+    assert classify_item(_item("hello hello"), topics) == ["Repeat"]
+    assert classify_item(_item("hello world"), topics) == []
+
+
+def test_item_text_view_is_cached_and_tracks_field_changes():
+    item = Item(
+        url="https://example.com/a",
+        title="GPT-5 Release",
+        published=datetime(2026, 4, 9),
+        source="OpenAI Blog",
+        summary="New Model",
+    )
+
+    view = item.text
+    assert view.searchable_lower == "gpt-5 release new model"
+    assert item.text is view
+    assert view.title_lower == "gpt-5 release"
+
+    item.ai_summary = "Faster API"
+    assert item.text is not view
+    assert item.text.headline_lower == "gpt-5 release faster api"
+
+
+def test_batch_keyword_matrix_matches_per_item_classification():
+    pytest.importorskip("scipy")
+    matcher = get_topic_matcher(TOPICS)
+    items = [
+        _item("vLLM adds serving support for Claude 4", "A ReAct style agent demo."),
+        _item("GPT-4o pricing update"),
+        _item("Nothing relevant here"),
+    ]
+
+    batch_hits = matcher.match_keywords_batch([item.text.classify_lower for item in items])
+
+    for item, keyword_topics in zip(items, batch_hits):
+        assert keyword_topics == set(matcher.match_keywords(item.text.classify_lower))
+        assert sorted(classify_item(item, TOPICS, matcher, keyword_topics)) == sorted(
+            classify_item(item, TOPICS, matcher)
+        )
+
+
+def test_classification_cache_recomputes_only_changed_topics(tmp_path, monkeypatch):
+    from src.classify import classify_batch, match_topics
+    from src.storage import Storage
+
+    store = Storage(str(tmp_path / "cache.db"))
+    items = [_item("vLLM serving for GPT-4o", "agent demo"), _item("Nothing relevant")]
+    classify_batch(items, TOPICS, store=store)
+    assert sorted(items[0].tags) == ["Agent", "Inference", "LLM"]
+
+    calls = []
+    original = match_topics
+
+    def counting_match_topics(item, matcher, keyword_topics=None):
+        calls.append(sorted(matcher.topic_names))
+        return original(item, matcher, keyword_topics)
+
+    monkeypatch.setattr("src.classify.match_topics", counting_match_topics)
+
+    fresh = [_item("vLLM serving for GPT-4o", "agent demo"), _item("Nothing relevant")]
+    classify_batch(fresh, TOPICS, store=store)
+    assert calls == []
+    assert sorted(fresh[0].tags) == ["Agent", "Inference", "LLM"]
+
+    changed = [dict(topic) for topic in TOPICS]
+    changed[2] = {"name": "Agent", "keywords": ["nothing"], "boost": 2.0}
+    again = [_item("vLLM serving for GPT-4o", "agent demo"), _item("Nothing relevant")]
+    classify_batch(again, changed, store=store)
+    assert calls == [["Agent"], ["Agent"]]
+    assert sorted(again[0].tags) == ["Inference", "LLM"]
+    assert again[1].tags == ["Agent"]
+    store.close()
+
+
+def test_reclassify_updates_only_items_affected_by_topic_changes(tmp_path):
+    from src.classify import classify_batch
+    from src.classify.reclassify import reclassify_history
+    from src.storage import Storage
+
+    store = Storage(str(tmp_path / "history.db"))
+    items = [
+        _item("vLLM serving release", "inference server"),
+        _item("New agent framework", "ReAct loop"),
+        _item("Quantization guide", "int4 weights"),
+    ]
+    for index, item in enumerate(items):
+        item.url = f"https://example.com/{index}"
+    classify_batch(items, TOPICS, store=store)
+    store.save_items(items)
+    assert reclassify_history(store, TOPICS)["updated"] == 0
+
+    changed = [
+        TOPICS[0],
+        {"name": "Inference", "keywords": ["inference", "vLLM", "serving", "quantization"]},
+    ]
+    stats = reclassify_history(store, changed)
+
+    assert stats["candidates"] == 3
+    assert stats["updated"] == 2
+    stored = {item.url: sorted(item.tags) for item in store.get_items()}
+    assert stored["https://example.com/1"] == []
+    assert stored["https://example.com/2"] == ["Inference"]
+    assert reclassify_history(store, changed) == {"candidates": 0, "updated": 0}
+    store.close()
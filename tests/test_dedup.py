@@ -0,0 +1,139 @@
+from datetime import datetime
+
+from src.dedup import (
+    StoryClusterer,
+    UrlIndex,
+    deduplicate,
+    is_duplicate_title,
+    is_duplicate_url,
+)
+from src.dedup.benchmark import CorpusGenerator, run_benchmark
+from src.ingest.models import Item
+
+
+def _item(url: str, title: str) -> Item:
+    return Item(url=url, title=title, published=datetime(2026, 4, 9), source="Test")
+
+
+def test_url_index_matches_tracking_variants_on_same_host():
+    index = UrlIndex(0.9)
+    index.add("https://www.example.com/blog/new-model-release")
+
+    assert index.contains_similar("http://example.com/blog/new-model-release?utm_source=x")
+    assert index.contains_similar("https://example.com/blog/new-model-releases")
+
+
+def test_url_index_skips_other_hosts():
+    index = UrlIndex(0.9)
+    index.add("https://example.com/blog/new-model-release")
+
+    assert not index.contains_similar("https://example.org/blog/new-model-release")
+    assert not is_duplicate_url(
+        "https://example.com/blog/new-model-release",
+        "https://example.org/blog/new-model-release",
+    )
+
+
+def test_deduplicate_drops_url_duplicates_against_history():
+    history = [_item("https://example.com/a/first-post", "First post about inference")]
+    items = [
+        _item("https://example.com/a/first-post?ref=feed", "Totally different headline"),
+        _item("https://other.com/b/unrelated", "Unrelated agent tooling update"),
+    ]
+
+    result = deduplicate(items, history, {})
+
+    assert [item.url for item in result] == ["https://other.com/b/unrelated"]
+
+
+def test_story_clusterer_merges_cross_source_coverage():
+    blog = _item("https://openai.com/index/gpt-5-launch", "OpenAI launches GPT-5 reasoning model")
+    blog.source = "OpenAI Blog"
+    blog.raw_data["authority_score"] = 100
+    blog.summary = "GPT-5 reasoning model now available in the API and ChatGPT."
+    news = _item(
+        "https://news.example.com/openai-gpt-5", "OpenAI releases GPT-5 reasoning model to API"
+    )
+    news.source = "Example News"
+    news.summary = "The GPT-5 reasoning model is available in ChatGPT today."
+    other = _item("https://example.com/vllm-release", "vLLM adds speculative decoding support")
+    other.source = "vLLM Releases"
+
+    clusterer = StoryClusterer()
+    result = clusterer.cluster([news, blog, other])
+
+    assert result == [blog, other]
+    assert blog.raw_data["related_links"][0]["url"] == news.url
+    assert len(clusterer.new_members) == 3
+
+
+def test_story_clusterer_drops_followups_of_history_clusters():
+    first = StoryClusterer()
+    blog = _item("https://openai.com/index/gpt-5-launch", "OpenAI launches GPT-5 reasoning model")
+    blog.source = "OpenAI Blog"
+    first.cluster([blog])
+
+    later = _item("https://news.example.com/gpt-5", "OpenAI GPT-5 reasoning model launches widely")
+    later.source = "Example News"
+
+    assert StoryClusterer(first.new_members).cluster([later]) == []
+
+
+def test_story_members_of_unsaved_representatives_are_not_kept():
+    first = StoryClusterer()
+    blog = _item("https://openai.com/index/gpt-5-launch", "OpenAI launches GPT-5 reasoning model")
+    blog.source = "OpenAI Blog"
+    other = _item("https://example.com/vllm-release", "vLLM adds speculative decoding support")
+    other.source = "vLLM Releases"
+    first.cluster([blog, other])
+
+    # 只有 vLLM 条目入库，GPT-5 事件从未发布，之后的报道不应被当作后续报道丢弃
+    saved = first.members_to_save([other])
+    later = _item("https://news.example.com/gpt-5", "OpenAI GPT-5 reasoning model launches widely")
+    later.source = "Example News"
+
+    assert [member["url"] for member in saved] == [other.url]
+    assert StoryClusterer(saved).cluster([later]) == [later]
+
+
+def test_history_titles_with_edits_spread_across_title_are_duplicates():
+    title = "openai launches new reasoning model api"
+    edited = "".join(
+        "x" if index in {3, 11, 19, 27, 35} else char for index, char in enumerate(title)
+    )
+    history = [_item("https://example.com/old", title)]
+    items = [_item("https://other.com/new", edited)]
+
+    assert is_duplicate_title(title, edited)
+    assert deduplicate(items, history, {}) == []
+    assert deduplicate(items, history, {"title_similarity_threshold": 0.9}) == items
+
+
+def test_benchmark_engines_agree_on_planted_duplicates():
+    results = run_benchmark(sizes=[300], new_size=40, seed=7)
+
+    # 第一个引擎是优化前的逐对比较，其余引擎都与它比较
+    assert [row["engine"] for row in results] == ["pairwise", "scan"]
+    for row in results:
+        assert row["same_as_baseline"]
+        assert row["recall"] == 1.0
+        assert row["precision"] == 1.0
+        assert row["missed_vs_baseline"] == 0
+
+
+def test_benchmark_recalls_titles_with_spread_edits():
+    config = {"title_similarity_threshold": 0.9}
+    results = run_benchmark(sizes=[300], new_size=50, seed=11, config=config)
+
+    for row in results:
+        assert row["recall_title_edits"] == 1.0
+        assert row["recall_delta"] == 0.0
+        assert row["missed_vs_baseline"] == 0
+
+
+def test_corpus_generator_is_deterministic():
+    first = CorpusGenerator(3).generate(50, 20)
+    second = CorpusGenerator(3).generate(50, 20)
+
+    assert [item.url for item in first.new_items] == [item.url for item in second.new_items]
+    assert first.planted == second.planted
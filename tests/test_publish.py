@@ -0,0 +1,87 @@
+from datetime import datetime
+
+from src.ingest.models import Item
+from src.publish import select_missing_summaries, select_publishable
+from src.storage import Storage
+
+
+def _items(scores):
+    return [
+        Item(
+            url=f"https://a.com/{index}",
+            title=f"Item {index}",
+            published=datetime(2026, 4, 9),
+            source="Test",
+            score=score,
+        )
+        for index, score in enumerate(scores)
+    ]
+
+
+def _urls(items):
+    return [item.url.rsplit("/", 1)[1] for item in items]
+
+
+def test_select_publishable_applies_min_score_and_max_items():
+    items = _items([95, 90, 80, 70, 65, 50, 40])
+
+    selected = select_publishable(items, {"min_score": 60, "max_items": 3}, margin=0)
+
+    assert _urls(selected) == ["0", "1", "2"]
+    assert _urls(select_publishable(items, {"min_score": 85}, margin=0)) == ["0", "1"]
+
+
+def test_select_publishable_truncates_by_limit_before_cutoff():
+    items = _items([95, 90, 80, 70, 65])
+
+    selected = select_publishable(items, {"min_score": 60, "max_items": 20}, limit=2, margin=3)
+
+    # --limit 截断后的条目之外不再有候补
+    assert _urls(selected) == ["0", "1"]
+
+
+def test_select_publishable_keeps_spares_after_cutoff_in_score_order():
+    items = _items([95, 90, 80, 70, 65, 50, 40])
+    config = {"min_score": 60, "max_items": 3, "summary_margin": 2}
+
+    assert _urls(select_publishable(items, config)) == ["0", "1", "2", "3", "4"]
+    # 低于 min_score 的条目同样可以作为候补
+    assert _urls(select_publishable(items, {"min_score": 85}, margin=2)) == ["0", "1", "2", "3"]
+    assert _urls(select_publishable(items, config, margin=100)) == _urls(items)
+
+
+def test_select_publishable_always_includes_must_read_items():
+    items = _items([95, 90, 80, 70, 65, 50, 40, 30])
+    items[7].is_must_read = True
+    config = {"min_score": 60, "max_items": 2, "summary_margin": 1}
+
+    # 低于 min_score、且在 max_items + margin 之外的必看条目仍然会被选中
+    assert _urls(select_publishable(items, config)) == ["0", "1", "2", "7"]
+    assert _urls(select_publishable(items, config, margin=0)) == ["0", "1", "7"]
+    assert _urls(select_missing_summaries(items, config)) == ["0", "1", "7"]
+    # --limit 截掉的必看条目不会出现在报告里，也就不需要摘要
+    assert _urls(select_publishable(items, config, limit=4)) == ["0", "1", "2"]
+
+
+def test_weekly_backfill_summarizes_only_published_items_without_summary():
+    store = Storage(":memory:")
+    items = _items([95, 90, 80, 70, 50])
+    items[0].ai_summary = "已有摘要"
+    store.save_items(items)
+    config = {"min_score": 60, "max_items": 3, "summary_margin": 5}
+
+    missing = select_missing_summaries(store.get_items(), config, queued_urls=[items[2].url])
+
+    # 已有摘要、在批处理作业中、以及只是候补的条目都不回填
+    assert _urls(missing) == ["1"]
+
+    missing[0].ai_summary = "补齐的摘要"
+    missing[0].key_points = ["要点"]
+    assert store.update_summaries(missing) == 1
+
+    saved = {item.url: item for item in store.get_items()}
+    assert saved[items[1].url].ai_summary == "补齐的摘要"
+    assert saved[items[1].url].key_points == ["要点"]
+    assert saved[items[1].url].score == 90
+    assert saved[items[0].url].ai_summary == "已有摘要"
+    assert select_missing_summaries(list(saved.values()), config, [items[2].url]) == []
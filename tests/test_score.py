@@ -0,0 +1,147 @@
+from datetime import datetime
+
+import pytest
+
+from src.ingest.models import Item
+from src.score import Scorer, attach_reasons, filter_items, score_batch
+from src.score.rules import RuleSet, compile_rule
+
+CONFIG = {
+    "research_keywords": {"high_value": ["benchmark", "sota"], "medium_value": ["paper"]},
+    "engineering_keywords": {
+        "critical": ["breaking change", "deprecat"],
+        "high_value": ["release", "api", "benchmark"],
+        "medium_value": ["update"],
+    },
+}
+PREFERENCES = {"priority_vendors": ["OpenAI"], "priority_tools": ["vLLM"]}
+
+
+def _item(title: str, summary: str = "") -> Item:
+    return Item(
+        url="https://example.com/a",
+        title=title,
+        published=datetime(2026, 4, 9),
+        source="Example",
+        summary=summary,
+    )
+
+
+def test_batch_keyword_scores_match_per_item_scoring():
+    pytest.importorskip("scipy")
+    scorer = Scorer(CONFIG, [])
+    items = [
+        _item("OpenAI API release", "Breaking change: deprecated endpoints, new SOTA benchmark"),
+        _item("vLLM update", "paper notes"),
+        _item("Unrelated"),
+    ]
+
+    batch = scorer.batch_keyword_scores(items, PREFERENCES)
+
+    for item, (research, engineering, preference) in zip(items, batch):
+        assert research == scorer._score_research_signal(item)
+        assert engineering == scorer._score_engineering_signal(item)
+        assert preference == scorer._score_preference(item, PREFERENCES)
+
+
+def test_reasons_are_generated_only_when_attached():
+    scorer = Scorer(CONFIG, [])
+    item = _item("OpenAI API release", "Breaking change: deprecated endpoints, new SOTA benchmark")
+    item.raw_data["authority_score"] = 95
+
+    scorer.score_item(item, PREFERENCES)
+    assert "reasons" not in item.score_breakdown
+
+    attach_reasons([item])
+    assert item.score_breakdown["reasons"] == ["来自高权威源: Example", "工程信号: 破坏性变更"]
+
+
+def test_vectorized_score_batch_matches_per_item_path(monkeypatch):
+    pytest.importorskip("numpy")
+    topics = [{"name": "infra", "keywords": ["vllm"], "boost": 1.3}, {"name": "misc", "boost": 0.7}]
+    titles = ["OpenAI API release", "vLLM update", "SOTA paper", "Unrelated", "Deprecated API"]
+    now = datetime(2026, 4, 10, 12)
+
+    def make_items():
+        items = []
+        for index, title in enumerate(titles):
+            item = _item(title, "benchmark notes" if index % 2 else "")
+            item.published = datetime(2026, 4, 10 - index)
+            item.raw_data["authority_score"] = 40 + index * 12.5
+            item.tags = [["infra"], ["misc", "infra"], [], ["misc"], ["infra", "misc"]][index]
+            items.append(item)
+        return items
+
+    expected = score_batch(make_items(), CONFIG, topics, PREFERENCES, now=now)
+    monkeypatch.setattr("src.score.MATRIX_MIN_ITEMS", 1)
+    vectorized = score_batch(make_items(), CONFIG, topics, PREFERENCES, now=now)
+
+    assert [item.title for item in vectorized] == [item.title for item in expected]
+    assert [item.score for item in vectorized] == [item.score for item in expected]
+    assert [item.score_breakdown for item in vectorized] == [
+        item.score_breakdown for item in expected
+    ]
+
+
+def test_rule_set_compiles_conditions_with_prerequisites():
+    rule = compile_rule("score >= 88 and (contains('CVE') or contains_any(['incident']))", "安全")
+    assert rule.min_score == 88
+    assert rule.keyword_groups == [frozenset({"cve", "incident"})]
+
+    rule_set = RuleSet(
+        [
+            {"condition": "__import__('os').system('true')", "reason": "无效"},
+            {"condition": "score >= 88 and contains('cve')", "reason": "安全"},
+            {"condition": "authority_score >= 90 and 'infra' in tags", "reason": "权威"},
+        ]
+    )
+    assert len(rule_set) == 2
+
+    item = _item("Patch for CVE-2026-1")
+    item.score = 90
+    assert rule_set.first_match(item).reason == "安全"
+    item.score = 80
+    assert rule_set.first_match(item) is None
+    item.raw_data["authority_score"] = 95
+    item.tags = ["infra"]
+    assert rule_set.first_match(item).reason == "权威"
+
+
+def test_filter_items_drops_matching_items_before_publishing():
+    rules = [
+        {"condition": "score < 35", "reason": "低分"},
+        {"condition": "age_days > 5", "reason": "过期"},
+        {"condition": "is_duplicate", "reason": "重复"},
+    ]
+    fresh, low, stale, duplicate = (_item(title) for title in ["fresh", "low", "stale", "dup"])
+    for item in (fresh, low, stale, duplicate):
+        item.score = 60
+    low.score = 10
+    stale.published = datetime(2026, 4, 1)
+    duplicate.raw_data["is_duplicate"] = True
+
+    kept = filter_items([fresh, low, stale, duplicate], rules, now=datetime(2026, 4, 10))
+
+    assert kept == [fresh]
+
+
+def test_rescore_freshness_matches_full_scoring_at_new_time():
+    topics = [{"name": "infra", "boost": 1.3}]
+    scorer = Scorer(CONFIG, topics)
+    items = [_item("OpenAI API release"), _item("vLLM update", "paper"), _item("Unrelated")]
+    items[0].tags = ["infra"]
+    for item in items:
+        scorer.score_item(item, PREFERENCES, now=datetime(2026, 4, 9, 6))
+
+    later = datetime(2026, 4, 14)
+    expected = {}
+    for item in items:
+        copy = _item(item.title, item.summary)
+        copy.tags = item.tags
+        scorer.score_item(copy, PREFERENCES, now=later)
+        expected[item.title] = (copy.score, copy.score_breakdown)
+
+    rescored = scorer.rescore_freshness(items, now=later)
+
+    assert [item.score for item in rescored] == sorted(item.score for item in rescored)[::-1]
+    assert {item.title: (item.score, item.score_breakdown) for item in rescored} == expected
@@ -0,0 +1,415 @@
+import json
+import sys
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import requests
+
+from src.ingest.models import Item
+from src.storage import Storage
+from src.summarize import LLMSummarizer, collect_batch_results, submit_batch_jobs, summarize_batch
+from src.summarize.content import select_content
+from src.summarize.ollama_pool import OllamaPool
+from src.summarize.telemetry import call_cost, summarize_calls
+from src.summarize.tokens import estimate_tokens
+from src.utils.keywords import KeywordMatcher
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+    class response:
+        headers = {"Retry-After": "0"}
+
+
+def _items(count):
+    return [
+        Item(
+            url=f"https://example.com/{index}",
+            title=f"Item {index}",
+            published=datetime(2026, 4, 9),
+            source="Example",
+            summary="A model release with a new API and faster inference for everyone.",
+        )
+        for index in range(count)
+    ]
+
+
+def test_summarize_batch_runs_concurrently_and_retries_rate_limits(monkeypatch):
+    lock = threading.Lock()
+    calls = []
+
+    def fake_summarize(self, item):
+        with lock:
+            calls.append(item.title)
+            first_call = len(calls) == 1
+        if first_call:
+            raise RateLimited("slow down")
+        if item.title == "Item 3":
+            raise RuntimeError("boom")
+        return {
+            "summary": f"summary of {item.title}",
+            "key_points": [item.title],
+            "action": "仅记录",
+        }
+
+    monkeypatch.setattr(LLMSummarizer, "summarize", fake_summarize)
+    items = _items(6)
+
+    summarize_batch(items, {"provider": "ollama", "max_concurrency": 4})
+
+    assert len(calls) == 7
+    for item in items:
+        if item.title == "Item 3":
+            assert item.ai_summary.startswith("A model release")
+        else:
+            assert item.ai_summary == f"summary of {item.title}"
+            assert item.key_points == [item.title]
+
+
+def test_summary_cache_reuses_results_for_identical_prompts(monkeypatch):
+    calls = []
+
+    def fake_summarize(self, item):
+        calls.append(item.url)
+        usage = {"prompt_tokens": 300, "completion_tokens": 80}
+        return {
+            "summary": "cached summary",
+            "key_points": ["a"],
+            "action": "仅记录",
+            "usage": usage,
+        }
+
+    monkeypatch.setattr(LLMSummarizer, "summarize", fake_summarize)
+    store = Storage(":memory:")
+    config = {"provider": "ollama"}
+
+    summarize_batch(_items(2)[:1], config, store=store)
+    moved = _items(1)[0]
+    moved.url = "https://mirror.example.com/0"
+    summarize_batch([moved], config, store=store)
+    summarize_batch(_items(1), {"provider": "ollama", "model": "other"}, store=store)
+
+    assert calls == ["https://example.com/0", "https://example.com/0"]
+    assert moved.ai_summary == "cached summary"
+    assert moved.key_points == ["a"]
+    store.close()
+
+
+def test_batched_prompts_retry_items_missing_from_output(monkeypatch):
+    prompts = []
+
+    def fake_complete(self, system, prompt, max_tokens):
+        prompts.append(prompt)
+        usage = {"prompt_tokens": 900, "completion_tokens": 300}
+        if "下面共有" in prompt:
+            entries = [
+                {"id": 1, "summary": "first", "key_points": [], "action": "仅记录"},
+                {"id": 3, "summary": "third", "key_points": [], "action": "仅记录"},
+            ]
+            return json.dumps(entries, ensure_ascii=False), usage
+        return '{"summary": "alone", "key_points": [], "action": "仅记录"}', usage
+
+    monkeypatch.setattr(LLMSummarizer, "_complete", fake_complete)
+    items = _items(3)
+
+    summarize_batch(items, {"provider": "ollama", "batch_prompts": True, "batch_size": 5})
+
+    assert [item.ai_summary for item in items] == ["first", "alone", "third"]
+    assert len(prompts) == 2
+    assert "标题: Item 1" in prompts[1] and "下面共有" not in prompts[1]
+
+
+def test_batched_prompt_results_are_cached_apart_from_single_results(monkeypatch):
+    prompts = []
+
+    def fake_complete(self, system, prompt, max_tokens):
+        prompts.append(prompt)
+        usage = {"prompt_tokens": 900, "completion_tokens": 300}
+        if "下面共有" in prompt:
+            entries = [
+                {"id": index, "summary": "batched", "key_points": [], "action": "仅记录"}
+                for index in (1, 2)
+            ]
+            return json.dumps(entries, ensure_ascii=False), usage
+        return '{"summary": "single", "key_points": [], "action": "仅记录"}', usage
+
+    monkeypatch.setattr(LLMSummarizer, "_complete", fake_complete)
+    store = Storage(":memory:")
+    batched = {"provider": "ollama", "batch_prompts": True, "batch_size": 5}
+
+    summarize_batch(_items(2), batched, store=store)
+    items = _items(2)
+    summarize_batch(items, batched, store=store)
+    assert [item.ai_summary for item in items] == ["batched", "batched"]
+    assert len(prompts) == 1
+
+    # 单条请求不复用合并请求的输出
+    items = _items(2)
+    summarize_batch(items, {"provider": "ollama"}, store=store)
+    assert [item.ai_summary for item in items] == ["single", "single"]
+    assert len(prompts) == 3
+
+    # 两种结果都在缓存中时，合并请求优先复用单条请求的结果
+    items = _items(2)
+    summarize_batch(items, batched, store=store)
+    assert [item.ai_summary for item in items] == ["single", "single"]
+    assert len(prompts) == 3
+    store.close()
+
+
+def test_select_content_keeps_lead_and_keyword_sentences_within_budget():
+    lead = "OpenAI released a new model today. It is available via the API."
+    filler = " ".join(f"Newsletter signup and cookie notice number {index}." for index in range(80))
+    signal = "This is a breaking change: the old endpoint is deprecated."
+    text = f"{lead}\n\n{filler}\n\n{signal}\n\n{filler}"
+
+    selected = select_content(text, 60, KeywordMatcher(["breaking change", "deprecated"]))
+
+    assert selected.startswith(lead)
+    assert signal in selected
+    assert estimate_tokens(selected) <= 60
+
+
+def test_anthropic_requests_mark_static_system_prompt_for_caching():
+    requests_seen = []
+
+    class FakeMessages:
+        def create(self, **kwargs):
+            requests_seen.append(kwargs)
+            usage = SimpleNamespace(
+                input_tokens=40,
+                output_tokens=120,
+                cache_read_input_tokens=500,
+                cache_creation_input_tokens=0,
+            )
+            text = '{"summary": "s", "key_points": [], "action": "仅记录"}'
+            return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+    summarizer = LLMSummarizer({"provider": "ollama"})
+    summarizer.provider = "anthropic"
+    summarizer.client = SimpleNamespace(messages=FakeMessages())
+    first, second = _items(2)
+
+    result = summarizer.summarize(first)
+    summarizer.summarize(second)
+
+    assert result["usage"] == {
+        "prompt_tokens": 540,
+        "completion_tokens": 120,
+        "cached_tokens": 500,
+        "cache_write_tokens": 0,
+    }
+    assert requests_seen[0]["system"] == requests_seen[1]["system"]
+    assert requests_seen[0]["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "Item 0" in requests_seen[0]["messages"][0]["content"]
+
+
+class FakeOpenAIBatches:
+    def __init__(self, **kwargs):
+        self.uploads = {}
+        self.jobs = {}
+        self.files = SimpleNamespace(create=self._upload, content=self._download)
+        self.batches = SimpleNamespace(
+            create=self._create, retrieve=lambda job_id: self.jobs[job_id]
+        )
+
+    def _upload(self, file, purpose):
+        file_id = f"file-{len(self.uploads)}"
+        self.uploads[file_id] = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id=file_id)
+
+    def _create(self, input_file_id, endpoint, completion_window):
+        job = SimpleNamespace(
+            id=f"batch-{len(self.jobs)}",
+            input=input_file_id,
+            status="in_progress",
+            output_file_id=None,
+        )
+        self.jobs[job.id] = job
+        return job
+
+    def _download(self, file_id):
+        return SimpleNamespace(text=self.uploads[file_id])
+
+    def finish(self, job_id, failed_title):
+        lines = []
+        for request in self.uploads[self.jobs[job_id].input]:
+            if failed_title in request["body"]["messages"][1]["content"]:
+                lines.append(
+                    {"custom_id": request["custom_id"], "response": None, "error": {"code": "x"}}
+                )
+                continue
+            body = {
+                "choices": [
+                    {
+                        "message": {
+                            "content": '{"summary": "batched", "key_points": [], "action": "仅记录"}'
+                        }
+                    }
+                ],
+                "usage": {"prompt_tokens": 400, "completion_tokens": 90},
+            }
+            lines.append(
+                {"custom_id": request["custom_id"], "response": {"status_code": 200, "body": body}}
+            )
+        self.uploads["out"] = "\n".join(json.dumps(line) for line in lines)
+        self.jobs[job_id].status = "completed"
+        self.jobs[job_id].output_file_id = "out"
+
+
+def test_batch_api_jobs_are_tracked_in_storage_and_applied_when_finished(monkeypatch):
+    client = FakeOpenAIBatches()
+    monkeypatch.setitem(sys.modules, "openai", SimpleNamespace(OpenAI=lambda **kwargs: client))
+    store = Storage(":memory:")
+    store.save_items(_items(3))
+    config = {"provider": "openai", "api_key": "test"}
+
+    job_ids = submit_batch_jobs(store.get_items(), config, store)
+    assert submit_batch_jobs(store.get_items(), config, store) == []
+    assert collect_batch_results(config, store) == 0
+
+    client.finish(job_ids[0], failed_title="Item 1")
+    assert collect_batch_results(config, store) == 2
+
+    summaries = {item.title: item.ai_summary for item in store.get_items()}
+    assert summaries == {"Item 0": "batched", "Item 1": None, "Item 2": "batched"}
+    assert store.get_open_summary_batches() == []
+
+    retry = [item for item in store.get_items() if not item.ai_summary]
+    submit_batch_jobs(retry, config, store)
+    assert list(store.get_open_summary_batches()[0]["entries"]) == ["https://example.com/1"]
+    store.close()
+
+
+def test_ollama_pool_routes_to_least_loaded_endpoint_and_fails_over_on_timeout():
+    posted = []
+
+    class FakeSession:
+        def __init__(self, name, fail=False):
+            self.name, self.fail = name, fail
+
+        def post(self, url, json, timeout):
+            posted.append((self.name, json["keep_alive"]))
+            if self.fail:
+                raise requests.Timeout("timed out")
+            return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"from": self.name})
+
+        def get(self, url, timeout):
+            return SimpleNamespace(ok=not self.fail)
+
+    pool = OllamaPool(["http://a:11434", "http://b:11434", "http://c:11434/"], keep_alive="1h")
+    slow, busy, idle = pool.endpoints
+    slow.session, busy.session, idle.session = (
+        FakeSession("a", fail=True),
+        FakeSession("b"),
+        FakeSession("c"),
+    )
+    busy.outstanding = 2
+
+    assert pool.post("/api/chat", {"model": "m"}) == {"from": "c"}
+    idle.outstanding = 3
+    assert pool.post("/api/chat", {"model": "m"}) == {"from": "b"}
+    assert posted == [("a", "1h"), ("c", "1h"), ("b", "1h")]
+    assert slow.down_until > 0 and slow.outstanding == 0
+
+
+def test_llm_calls_are_recorded_per_run_and_reported(monkeypatch):
+    def fake_complete(self, system, prompt, max_tokens):
+        usage = {"prompt_tokens": 1000, "completion_tokens": 200, "cached_tokens": 400}
+        if "Item 2" in prompt:
+            return "not json", usage
+        return '{"summary": "s", "key_points": [], "action": "仅记录"}', usage
+
+    monkeypatch.setattr(LLMSummarizer, "_complete", fake_complete)
+    store = Storage(":memory:")
+
+    summarize_batch(_items(3), {"provider": "ollama", "model": "m"}, store=store, run_id="daily-1")
+
+    calls = store.get_llm_calls(run_id="daily-1")
+    assert len(calls) == 3
+    assert sum(call["parse_failures"] for call in calls) == 1
+    assert all(call["latency"] is not None and call["retries"] == 0 for call in calls)
+
+    pricing = {"m": {"input": 1.0, "cached_input": 0.5, "output": 2.0}}
+    (row,) = summarize_calls(calls, pricing, ("run_id", "model"))
+    assert row["calls"] == 3 and row["prompt_tokens"] == 3000 and row["cached_tokens"] == 1200
+    assert abs(row["cost"] - (1800 * 1.0 + 1200 * 0.5 + 600 * 2.0) / 1_000_000) < 1e-12
+    assert row["p50_latency"] <= row["p95_latency"]
+    store.close()
+
+
+def test_call_cost_prices_cache_writes_and_batch_discount():
+    call = {
+        "model": "claude",
+        "mode": "realtime",
+        "prompt_tokens": 10_000,
+        "cached_tokens": 6_000,
+        "cache_write_tokens": 3_000,
+        "completion_tokens": 1_000,
+    }
+    prices = {"input": 3.0, "cached_input": 0.3, "output": 15.0}
+
+    expected = (1_000 * 3.0 + 6_000 * 0.3 + 3_000 * 3.75 + 1_000 * 15.0) / 1_000_000
+    assert abs(call_cost(call, {"claude": prices}) - expected) < 1e-12
+    configured = {"claude": {**prices, "cache_write": 6.0}}
+    expected = (1_000 * 3.0 + 6_000 * 0.3 + 3_000 * 6.0 + 1_000 * 15.0) / 1_000_000
+    assert abs(call_cost(call, configured) - expected) < 1e-12
+    batch = {**call, "mode": "batch"}
+    assert abs(call_cost(batch, configured, batch_discount=0.4) - expected * 0.4) < 1e-12
+    assert call_cost(call, {"other": prices}) is None
+
+
+def test_routing_sends_tiers_to_their_models_and_tail_to_extractive(monkeypatch):
+    models = {}
+
+    def fake_complete(self, system, prompt, max_tokens):
+        models[prompt.split("\n")[0]] = self.model
+        return '{"summary": "llm", "key_points": [], "action": "仅记录"}', {"prompt_tokens": 10}
+
+    monkeypatch.setattr(LLMSummarizer, "_complete", fake_complete)
+    items = _items(5)
+    for item, score in zip(items, [90, 40, 70, 50, 30]):
+        item.score = score
+    items[4].is_must_read = True
+    store = Storage(":memory:")
+    routing = {
+        "premium": {"top_n": 1, "min_score": 85},
+        "economy": {"min_score": 60, "model": "cheap"},
+    }
+
+    summarize_batch(items, {"provider": "ollama", "model": "big", "routing": routing}, store=store)
+
+    assert models == {"标题: Item 0": "big", "标题: Item 4": "big", "标题: Item 2": "cheap"}
+    assert [item.ai_summary == "llm" for item in items] == [True, False, True, False, True]
+    assert items[1].ai_summary.startswith("A model release")
+    tiers = {(call["tier"], call["model"]): call["items"] for call in store.get_llm_calls()}
+    assert tiers == {
+        ("premium", "big"): 1,
+        ("economy", "cheap"): 1,
+        ("extractive", "extractive"): 2,
+    }
+    rows = summarize_calls(store.get_llm_calls(), {}, ("tier",))
+    assert {row["tier"]: row["items"] for row in rows}["extractive"] == 2
+    assert {row["tier"]: row["cost"] for row in rows}["extractive"] == 0.0
+    store.close()
+
+
+def test_routing_without_premium_block_still_routes_must_read_items(monkeypatch):
+    models = []
+
+    def fake_complete(self, system, prompt, max_tokens):
+        models.append(self.model)
+        return '{"summary": "llm", "key_points": [], "action": "仅记录"}', {"prompt_tokens": 10}
+
+    monkeypatch.setattr(LLMSummarizer, "_complete", fake_complete)
+    items = _items(2)
+    items[0].score, items[1].score = 30, 70
+    items[0].is_must_read = True
+
+    for premium in ({}, {"premium": None}):
+        models.clear()
+        routing = {"economy": {"min_score": 60, "model": "cheap"}, **premium}
+        summarize_batch(items, {"provider": "ollama", "model": "big", "routing": routing})
+        assert sorted(models) == ["big", "cheap"]